@@ -0,0 +1,152 @@
+"""
+Per-frame latency of AIController.process for agents run in the thread executor and for
+AsyncAIInterface agents awaited on the event loop, with a trivial and a local TCP echo processing.
+
+    python benchmarks/bench_async_processing.py [--frames 5000]
+"""
+import argparse
+import asyncio
+import socket
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from pyftg.aiinterface.ai_interface import AIInterface  # noqa: E402
+from pyftg.aiinterface.async_ai_interface import AsyncAIInterface  # noqa: E402
+from pyftg.models.key import Key  # noqa: E402
+from pyftg.socket.aio.ai_controller import AIController  # noqa: E402
+
+WARMUP = 200
+MESSAGE = b"x" * 16
+
+
+class BenchmarkAI:
+    def __init__(self):
+        self.key = Key()
+
+    def name(self) -> str:
+        return self.__class__.__name__
+
+    def is_blind(self) -> bool:
+        return True
+
+    def initialize(self, game_data, player_number):
+        pass
+
+    def get_non_delay_frame_data(self, frame_data):
+        pass
+
+    def get_information(self, frame_data, is_control):
+        pass
+
+    def get_screen_data(self, screen_data):
+        pass
+
+    def get_audio_data(self, audio_data):
+        pass
+
+    def input(self) -> Key:
+        return self.key
+
+    def round_end(self, round_result):
+        pass
+
+    def game_end(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class TrivialAI(BenchmarkAI, AIInterface):
+    def processing(self):
+        self.key.A = not self.key.A
+
+
+class AsyncTrivialAI(BenchmarkAI, AsyncAIInterface):
+    async def processing(self):
+        self.key.A = not self.key.A
+
+
+class SocketAI(BenchmarkAI, AIInterface):
+    def __init__(self, port: int):
+        super().__init__()
+        self.sock = socket.create_connection(("127.0.0.1", port))
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def processing(self):
+        self.sock.sendall(MESSAGE)
+        self.sock.recv(64)
+
+
+class AsyncSocketAI(BenchmarkAI, AsyncAIInterface):
+    async def connect(self, port: int):
+        self.reader, self.writer = await asyncio.open_connection("127.0.0.1", port)
+        self.writer.get_extra_info("socket").setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    async def processing(self):
+        self.writer.write(MESSAGE)
+        await self.writer.drain()
+        await self.reader.read(64)
+
+
+async def echo(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    while data := await reader.read(64):
+        writer.write(data)
+        await writer.drain()
+    writer.close()
+
+
+async def measure(ai: AIInterface, frames: int) -> tuple:
+    """
+    Mean, median and 99th percentile of the latency of `AIController.process`, in microseconds.
+    """
+    controller = AIController(None, None, ai, True)
+    for _ in range(WARMUP):
+        await controller.process()
+    latencies = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        await controller.process()
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return (statistics.mean(latencies) * 1e6, latencies[len(latencies) // 2] * 1e6,
+            latencies[int(len(latencies) * 0.99)] * 1e6)
+
+
+async def run(frames: int):
+    server = await asyncio.start_server(echo, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    async_socket_ai = AsyncSocketAI()
+    await async_socket_ai.connect(port)
+    cases = [
+        ("trivial, executor", TrivialAI()),
+        ("trivial, awaited", AsyncTrivialAI()),
+        ("tcp echo, executor", SocketAI(port)),
+        ("tcp echo, awaited", async_socket_ai),
+    ]
+    print(f"{'processing':<20} | {'mean':>8} | {'p50':>8} | {'p99':>8}")
+    for name, ai in cases:
+        mean, p50, p99 = await measure(ai, frames)
+        print(f"{name:<20} | {mean:>5.1f} us | {p50:>5.1f} us | {p99:>5.1f} us")
+    cases[2][1].sock.close()
+    async_socket_ai.writer.close()
+    await async_socket_ai.writer.wait_closed()
+    await asyncio.sleep(0.1)  # let the echo handlers see the end of their streams
+    server.close()
+    await server.wait_closed()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=5000, help="measured frames per case")
+    args = parser.parse_args()
+    asyncio.run(run(args.frames))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Microbenchmark of the generated model converters against the hand-written ones they replaced,
+on the frame of data_example.json.
+
+    python benchmarks/bench_converters.py [--number 20000] [--repeat 5]
+"""
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT / "src"), str(ROOT / "tests")]
+
+from legacy_converters import LEGACY  # noqa: E402
+from pyftg.models.frame_data import FrameData  # noqa: E402
+from samples import example_frame_dict  # noqa: E402
+
+
+def measure(function, number: int, repeat: int) -> float:
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000, help="calls per measurement")
+    parser.add_argument("--repeat", type=int, default=5, help="measurements, the fastest is reported")
+    args = parser.parse_args()
+
+    data = example_frame_dict()
+    frame_data = FrameData.from_dict(data)
+    proto_obj = frame_data.to_proto()
+    assert FrameData.from_proto(proto_obj) == frame_data
+    legacy_to_dict, legacy_from_dict, legacy_from_proto = LEGACY[FrameData]
+
+    cases = [
+        ("from_proto", lambda: legacy_from_proto(proto_obj), lambda: FrameData.from_proto(proto_obj)),
+        ("from_dict", lambda: legacy_from_dict(data), lambda: FrameData.from_dict(data)),
+        ("to_dict", lambda: legacy_to_dict(frame_data), lambda: frame_data.to_dict()),
+    ]
+    print(f"{'FrameData':<12} | {'hand-written':>12} | {'generated':>10} | {'speedup':>7}")
+    for name, legacy, generated in cases:
+        before = measure(legacy, args.number, args.repeat)
+        after = measure(generated, args.number, args.repeat)
+        print(f"{name:<12} | {before * 1e6:>9.1f} us | {after * 1e6:>7.1f} us | {before / after:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Pickle size and dumps/loads time of models with the generated compact `__reduce__` against
+the default dataclass pickling it replaced, which stores every instance dictionary and enum member.
+
+    python benchmarks/bench_pickle.py [--number 2000] [--repeat 5] [--frames 200]
+"""
+import argparse
+import copyreg
+import io
+import pickle
+import sys
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT / "src"), str(ROOT / "tests")]
+
+from pyftg.models.base_model import BaseModel  # noqa: E402
+from pyftg.models.frame_data import FrameData  # noqa: E402
+from pyftg.models.round_result import RoundResult  # noqa: E402
+from samples import example_frame_dict  # noqa: E402
+
+PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+
+class DefaultPickler(pickle.Pickler):
+    """
+    Pickler reducing models like `object.__reduce_ex__` did before `__reduce__` was generated.
+    """
+
+    def reducer_override(self, obj):
+        if isinstance(obj, BaseModel):
+            return copyreg.__newobj__, (type(obj),), obj.__dict__
+        return NotImplemented
+
+
+def default_dumps(obj) -> bytes:
+    buffer = io.BytesIO()
+    DefaultPickler(buffer, PROTOCOL).dump(obj)
+    return buffer.getvalue()
+
+
+def compact_dumps(obj) -> bytes:
+    return pickle.dumps(obj, PROTOCOL)
+
+
+def measure(function, number: int, repeat: int) -> float:
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000, help="calls per measurement")
+    parser.add_argument("--repeat", type=int, default=5, help="measurements, the fastest is reported")
+    parser.add_argument("--frames", type=int, default=200, help="frames in the list case")
+    args = parser.parse_args()
+
+    frame_data = FrameData.from_dict(example_frame_dict())
+    frames = []
+    for i in range(args.frames):
+        frame = frame_data.copy()
+        frame.current_frame_number = i
+        frames.append(frame)
+    cases = [
+        ("FrameData", frame_data, args.number),
+        (f"{args.frames} frames", frames, max(args.number // args.frames, 1)),
+        ("RoundResult", RoundResult(current_round=1, remaining_hps=[120, 340], elapsed_frame=3600), args.number),
+    ]
+
+    print(f"{'case':<12} | {'pickling':<8} | {'size':>9} | {'dumps':>10} | {'loads':>10}")
+    for name, obj, number in cases:
+        for pickling, dumps in (("default", default_dumps), ("compact", compact_dumps)):
+            data = dumps(obj)
+            assert pickle.loads(data) == obj
+            dumps_time = measure(lambda: dumps(obj), number, args.repeat)
+            loads_time = measure(lambda: pickle.loads(data), number, args.repeat)
+            print(f"{name:<12} | {pickling:<8} | {len(data):>7} B | {dumps_time * 1e6:>7.1f} us | "
+                  f"{loads_time * 1e6:>7.1f} us")
+
+
+if __name__ == "__main__":
+    main()
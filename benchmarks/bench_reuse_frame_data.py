@@ -0,0 +1,105 @@
+"""
+Steady-state allocations and time per frame of FrameData decoding, with and without
+`reuse_frame_data`, over the frames of a capture or frames derived from data_example.json.
+
+    python benchmarks/bench_reuse_frame_data.py [--capture FILE] [--frames 2000]
+"""
+import argparse
+import gc
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT / "src"), str(ROOT / "tests")]
+
+from pyftg.models.frame_data import FrameData  # noqa: E402
+from pyftg.protoc import service_pb2  # noqa: E402
+from pyftg.utils.capture import read_capture  # noqa: E402
+from samples import example_frame_dict  # noqa: E402
+
+
+def capture_frames(file_path: str) -> list:
+    """
+    Frame data messages of the game state packets of a capture file.
+    """
+    frames = []
+    for captured in read_capture(file_path):
+        state = service_pb2.PlayerGameState()
+        state.ParseFromString(captured.packet)
+        if state.HasField("frame_data"):
+            frames.append(state.frame_data)
+    return frames
+
+
+def example_frames(count: int) -> list:
+    """
+    Frame data messages derived from the example frame, with advancing frame numbers,
+    moving characters and zero to three projectiles.
+    """
+    rng = random.Random(0)
+    example = FrameData.from_dict(example_frame_dict())
+    frames = []
+    for i in range(count):
+        proto_obj = example.to_proto()
+        proto_obj.current_frame_number = i
+        for character in proto_obj.character_data:
+            character.x += rng.randint(-20, 20)
+            character.hp -= i // 10
+        del proto_obj.projectile_data[rng.randint(0, 3):]
+        frames.append(proto_obj)
+    return frames
+
+
+def run(frames: list, convert) -> tuple:
+    """
+    Decode every frame, keeping the previous result alive until the next one is built.
+    Returns the mean number of memory blocks and microseconds spent per frame.
+    """
+    frame_data = convert(frames[0])
+    blocks = 0
+    elapsed = 0.0
+    gc.disable()
+    try:
+        for proto_obj in frames:
+            before = sys.getallocatedblocks()
+            start = time.perf_counter()
+            new_frame_data = convert(proto_obj)
+            elapsed += time.perf_counter() - start
+            blocks += sys.getallocatedblocks() - before
+            frame_data = new_frame_data
+            del new_frame_data
+    finally:
+        gc.enable()
+    return blocks / len(frames), elapsed / len(frames) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--capture", help="capture file to take the frames from")
+    parser.add_argument("--frames", type=int, default=2000, help="frames derived from the example frame")
+    args = parser.parse_args()
+
+    frames = capture_frames(args.capture) if args.capture else example_frames(args.frames)
+    if not frames:
+        parser.error("no frame data in the capture")
+
+    reused = FrameData.from_proto(frames[0])
+    cases = [
+        ("from_proto", FrameData.from_proto),
+        ("update_from_proto", reused.update_from_proto),
+        # What FrameRecorder(reuse_frame_data=True) adds to every recorded frame.
+        ("update + copy", lambda proto_obj: reused.update_from_proto(proto_obj).copy()),
+    ]
+    print(f"{len(frames)} frames")
+    print(f"{'decoding':<18} | {'blocks/frame':>12} | {'us/frame':>8}")
+    for name, convert in cases:
+        for proto_obj in frames:
+            convert(proto_obj)
+        blocks, micros = run(frames, convert)
+        print(f"{name:<18} | {blocks:>12.1f} | {micros:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
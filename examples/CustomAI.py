@@ -1,11 +1,9 @@
 import logging
 import random
-import os
-from datetime import datetime
-import json
 
 from pyftg import (AIInterface, AudioData, CommandCenter, FrameData, GameData,
                    Key, RoundResult, ScreenData)
+from pyftg.utils.recorder import FrameRecorder
 
 logger = logging.getLogger(__name__)
 
@@ -54,18 +52,13 @@ POSSIBLE_ACTIONS = [
 ]
 
 SAVE_DIR = "../state_action_records"
-os.makedirs(SAVE_DIR, exist_ok=True)
 
 class CustomAI(AIInterface):
     def __init__(self):
         self.blind_flag = False
         self.width = 96
         self.height = 64
-        now = datetime.now()
-        self.session_id = now.strftime("%m%d_%H%M%S")
-        self.file_path_template = os.path.join(
-            SAVE_DIR, f"{self.session_id}_r{{round:02d}}.jsonl"
-        )
+        self.recorder = FrameRecorder(SAVE_DIR)
 
     def name(self) -> str:
         return self.__class__.__name__
@@ -110,23 +103,17 @@ class CustomAI(AIInterface):
         action = random.choice(POSSIBLE_ACTIONS)
         self.cc.command_call(action)
 
-        self.save_frame_data(self.frame_data.to_dict(), action)
+        self.save_frame_data(self.frame_data, action)
 
-    def save_frame_data(self, frame_data_dict, action):
+    def save_frame_data(self, frame_data, action):
         """
-        현재 프레임 데이터를 JSONL로 저장
+        현재 프레임 데이터를 백그라운드 recorder에 넘겨 JSONL로 저장
 
         Args:
-            frame_data_dict (dict): FrameData를 to_dict()로 변환한 dict
+            frame_data (FrameData): 현재 프레임 데이터
             action (str): AI가 선택한 action
         """
-        frame_data_dict['action'] = action
-
-        round_num = frame_data_dict['current_round']
-        file_path = self.file_path_template.format(round=round_num)
-
-        with open(file_path, "a") as f:
-            f.write(json.dumps(frame_data_dict) + "\n")
+        self.recorder.record(frame_data, action)
 
                         
     def calculate_distance(self, display_buffer: bytes):
@@ -153,6 +140,7 @@ class CustomAI(AIInterface):
     
     def game_end(self):
         logger.info("game end")
+        self.recorder.next_game()
         
     def close(self):
-        pass
\ No newline at end of file
+        self.recorder.close()
\ No newline at end of file
@@ -34,10 +34,13 @@ class KickAI(AIInterface):
         self.cc.set_frame_data(self.frame_data, self.player)
 
     def get_screen_data(self, screen_data: ScreenData):
-        self.screen_data = screen_data
+        pass
 
     def get_audio_data(self, audio_data: AudioData):
-        self.audio_data = audio_data
+        pass
+
+    def input_queue(self):
+        return self.cc.get_skill_keys()
 
     def processing(self):
         if self.frame_data.empty_flag or self.frame_data.current_frame_number <= 0:
@@ -84,6 +84,9 @@ class RandomAI(AIInterface):
     def get_audio_data(self, audio_data: AudioData):
         pass
         
+    def input_queue(self):
+        return self.cc.get_skill_keys()
+
     def processing(self):
 
         if self.frame_data.empty_flag or self.frame_data.current_frame_number <= 0:
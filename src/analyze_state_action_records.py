@@ -0,0 +1,238 @@
+import argparse
+import re
+from concurrent.futures import ProcessPoolExecutor
+from glob import glob
+
+import numpy as np
+
+from convert_state_action_records import ColumnarDataset, convert_file, infer_file_schema
+from pyftg.models.enums.int_action import IntAction
+from pyftg.utils.hitbox import valid_attack_mask
+from vectorize import path_to_key
+
+STAGE_WIDTH = 960
+HIT_AREA_SIDES = ("left", "right", "top", "bottom")
+HITBOX_BINS = np.arange(0, 410, 10)
+
+# 프레임별 이상 플래그 (bitmask)
+FLAG_HP_INCREASED = 1
+FLAG_OUT_OF_STAGE = 2
+FLAG_EMPTY_HITBOX = 4
+FLAG_FRAME_NOT_INCREASING = 8
+
+FLAG_NAMES = {
+    FLAG_HP_INCREASED: "hp_increased",
+    FLAG_OUT_OF_STAGE: "out_of_stage",
+    FLAG_EMPTY_HITBOX: "empty_hitbox",
+    FLAG_FRAME_NOT_INCREASING: "frame_not_increasing",
+}
+
+
+def attack_prefixes(keys, player: int) -> list:
+    """
+    컬럼 key 목록에 있는 한 캐릭터의 공격 데이터 prefix를 찾습니다.
+    attack_data가 첫 번째이고, 기록된 projectile_attack[i]가 번호 순으로 뒤따릅니다.
+
+    Returns:
+        list of str: 예: ["character_data[0].attack_data", "character_data[0].projectile_attack[0]", ...]
+    """
+    char = f"character_data[{player}]"
+    keys = set(keys)
+    prefixes = [f"{char}.attack_data"] if f"{char}.attack_data.empty_flag" in keys else []
+    pattern = re.compile(re.escape(f"{char}.projectile_attack[") + r"(\d+)\]\.empty_flag")
+    indices = sorted(int(m.group(1)) for m in map(pattern.fullmatch, keys) if m)
+    return prefixes + [f"{char}.projectile_attack[{i}]" for i in indices]
+
+
+def attack_columns_mask(col, prefix: str):
+    """
+    pyftg.utils.hitbox.valid_attack_mask를 공격 데이터 컬럼에 적용합니다.
+
+    Args:
+        col (Callable[[str], np.ndarray]): key -> (N,) 배열
+        prefix (str): 공격 데이터 key prefix (예: "character_data[0].attack_data")
+
+    Returns:
+        valid (np.ndarray): (N,) bool, 유효한 공격 여부
+        width (np.ndarray): (N,) hitbox 폭
+        height (np.ndarray): (N,) hitbox 높이
+        bbox_only_invalid (np.ndarray): (N,) bool, hitbox 크기만 문제인 공격
+    """
+    boxes = np.stack([col(f"{prefix}.current_hit_area.{side}") for side in HIT_AREA_SIDES], axis=-1)
+    alive = valid_attack_mask(boxes, col(f"{prefix}.empty_flag") != 0, col(f"{prefix}.current_frame"),
+                              col(f"{prefix}.is_projectile") != 0, col(f"{prefix}.is_live") != 0, check_bbox=False)
+    width = boxes[:, 1] - boxes[:, 0]
+    height = boxes[:, 3] - boxes[:, 2]
+    has_bbox = (width > 0) & (height > 0)
+    return alive & has_bbox, width, height, alive & ~has_bbox
+
+
+def analyze_arrays(col, keys, actions, file_ids, rounds, frames) -> dict:
+    """
+    한 파일(또는 연속된 프레임 묶음)의 컬럼 배열로 통계를 계산합니다.
+    공격/투사체 컬럼은 keys에 있는 것만 사용합니다.
+
+    Returns:
+        dict: 합칠 수 있는 부분 통계
+    """
+    n = len(actions)
+    flags = np.zeros(n, dtype=np.uint8)
+    stats = {
+        "frames": n,
+        "valid_attacks": np.zeros(2, dtype=np.int64),
+        "valid_projectiles": np.zeros(2, dtype=np.int64),
+        "width_hist": np.zeros(len(HITBOX_BINS) - 1, dtype=np.int64),
+        "height_hist": np.zeros(len(HITBOX_BINS) - 1, dtype=np.int64),
+        "action_counts": np.bincount(actions[actions >= 0], minlength=len(IntAction)),
+        "hp_loss": [],
+    }
+
+    same_round = np.r_[False, (file_ids[1:] == file_ids[:-1]) & (rounds[1:] == rounds[:-1])]
+    flags[same_round & np.r_[False, frames[1:] <= frames[:-1]]] |= FLAG_FRAME_NOT_INCREASING
+
+    for p in range(2):
+        char = f"character_data[{p}]"
+        hp = col(f"{char}.hp")
+        flags[same_round & np.r_[False, hp[1:] > hp[:-1]]] |= FLAG_HP_INCREASED
+        x = col(f"{char}.x")
+        flags[(x < 0) | (x > STAGE_WIDTH)] |= FLAG_OUT_OF_STAGE
+
+        for prefix in attack_prefixes(keys, p):
+            valid, width, height, bbox_only_invalid = attack_columns_mask(col, prefix)
+            stats["valid_attacks" if prefix.endswith(".attack_data") else "valid_projectiles"][p] += int(valid.sum())
+            stats["width_hist"] += np.histogram(width[valid], HITBOX_BINS)[0]
+            stats["height_hist"] += np.histogram(height[valid], HITBOX_BINS)[0]
+            flags[bbox_only_invalid] |= FLAG_EMPTY_HITBOX
+
+    # 라운드별 HP 감소량: 라운드 첫 프레임 HP - 마지막 프레임 HP (변환에 실패한 NaN 행은 건너뜀)
+    round_starts = np.flatnonzero(~same_round)
+    round_ends = np.r_[round_starts[1:], n]
+    hp0, hp1 = col("character_data[0].hp"), col("character_data[1].hp")
+    hp_rows = np.flatnonzero(~(np.isnan(hp0) | np.isnan(hp1)))
+    for s, e in zip(round_starts, round_ends):
+        lo, hi = np.searchsorted(hp_rows, [s, e])
+        if lo == hi:
+            stats["hp_loss"].append((int(file_ids[s]), int(rounds[s]), float("nan"), float("nan")))
+            continue
+        first, last = hp_rows[lo], hp_rows[hi - 1]
+        stats["hp_loss"].append((int(file_ids[s]), int(rounds[s]),
+                                 float(hp0[first] - hp0[last]), float(hp1[first] - hp1[last])))
+
+    stats["flags"] = flags
+    return stats
+
+
+def _analyze_file(file_path: str, file_id: int, schema: list) -> dict:
+    values, actions, rounds, frames, _ = convert_file(file_path, schema)
+    column_ids = {path_to_key(path): i for i, path in enumerate(schema)}
+    file_ids = np.full(len(actions), file_id, dtype=np.int32)
+    return analyze_arrays(lambda k: values[:, column_ids[k]], column_ids, actions, file_ids, rounds, frames)
+
+
+def _analyze_dataset_slice(data_dir: str, start: int, stop: int) -> dict:
+    dataset = ColumnarDataset(data_dir)
+    index = dataset.index[start:stop]
+    return analyze_arrays(lambda k: dataset[k][start:stop], dataset.columns, dataset.action[start:stop],
+                          index[:, 0], index[:, 1], index[:, 2])
+
+
+def merge_stats(parts: list) -> dict:
+    """
+    부분 통계들을 합칩니다. 프레임 플래그는 입력 순서대로 이어 붙입니다.
+    """
+    merged = dict(parts[0])
+    merged["hp_loss"] = list(parts[0]["hp_loss"])
+    for part in parts[1:]:
+        for k in ("frames", "valid_attacks", "valid_projectiles", "width_hist", "height_hist", "action_counts"):
+            merged[k] = merged[k] + part[k]
+        merged["hp_loss"].extend(part["hp_loss"])
+    merged["flags"] = np.concatenate([part["flags"] for part in parts])
+    return merged
+
+
+def analyze_records(file_paths: list, workers: int = None) -> dict:
+    """
+    JSONL 기록 파일들을 파일 단위로 병렬 분석합니다.
+    """
+    file_paths = sorted(file_paths)
+    schema = infer_file_schema(file_paths[0])
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        parts = list(executor.map(_analyze_file, file_paths, range(len(file_paths)), [schema] * len(file_paths)))
+    return merge_stats(parts)
+
+
+def analyze_dataset(data_dir: str, workers: int = None) -> dict:
+    """
+    convert_records로 만든 컬럼형 데이터셋을 파일 경계 단위로 나눠 병렬 분석합니다.
+    """
+    dataset = ColumnarDataset(data_dir)
+    file_ids = np.asarray(dataset.index[:, 0])
+    bounds = np.r_[0, np.flatnonzero(file_ids[1:] != file_ids[:-1]) + 1, len(file_ids)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        parts = list(executor.map(_analyze_dataset_slice, [data_dir] * (len(bounds) - 1), bounds[:-1], bounds[1:]))
+    return merge_stats(parts)
+
+
+def print_summary(stats: dict, top_actions: int = 15):
+    """
+    통계를 표 형태로 출력합니다.
+    """
+    print(f"Frames: {stats['frames']}")
+    print()
+    print(f"{'Player':<8} | {'Valid Atk':>10} | {'Valid Proj':>10}")
+    for p in range(2):
+        print(f"P{p:<7} | {stats['valid_attacks'][p]:>10} | {stats['valid_projectiles'][p]:>10}")
+
+    print()
+    print(f"{'Hitbox size':<12} | {'Width':>8} | {'Height':>8}")
+    for i in range(len(HITBOX_BINS) - 1):
+        w, h = stats["width_hist"][i], stats["height_hist"][i]
+        if w or h:
+            print(f"{f'{HITBOX_BINS[i]}-{HITBOX_BINS[i + 1]}':<12} | {w:>8} | {h:>8}")
+
+    print()
+    counts = stats["action_counts"]
+    total = max(int(counts.sum()), 1)
+    print(f"{'Action':<16} | {'Count':>8} | {'Ratio':>6}")
+    for code in np.argsort(counts)[::-1][:top_actions]:
+        if counts[code]:
+            print(f"{IntAction(code).name:<16} | {counts[code]:>8} | {counts[code] / total:>6.1%}")
+
+    print()
+    hp_loss = np.asarray([row[2:] for row in stats["hp_loss"]]).reshape(-1, 2)
+    # HP를 읽을 수 있는 프레임이 하나도 없는 라운드는 제외합니다.
+    hp_loss = hp_loss[~np.isnan(hp_loss).any(axis=1)]
+    skipped = len(stats["hp_loss"]) - len(hp_loss)
+    print(f"Rounds: {len(hp_loss)}" + (f" ({skipped} without HP skipped)" if skipped else ""))
+    if len(hp_loss):
+        print(f"{'HP loss':<8} | {'Mean':>8} | {'Std':>8} | {'Min':>8} | {'Max':>8}")
+        for p in range(2):
+            loss = hp_loss[:, p]
+            print(f"P{p:<7} | {loss.mean():>8.1f} | {loss.std():>8.1f} | {loss.min():>8.0f} | {loss.max():>8.0f}")
+
+    print()
+    print(f"{'Anomaly':<22} | {'Frames':>8}")
+    for flag, name in FLAG_NAMES.items():
+        print(f"{name:<22} | {int(np.count_nonzero(stats['flags'] & flag)):>8}")
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="state-action 기록 통계 분석")
+    parser.add_argument("--records", default="../state_action_records/*.jsonl", help="JSONL 기록 파일 glob")
+    parser.add_argument("--dataset", default=None, help="convert_state_action_records.py로 만든 데이터셋 디렉터리")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--flags-out", default=None, help="프레임별 이상 플래그를 저장할 .npy 경로")
+    args = parser.parse_args()
+
+    if args.dataset:
+        stats = analyze_dataset(args.dataset, args.workers)
+    else:
+        state_action_records = glob(args.records)
+        if not state_action_records:
+            raise FileNotFoundError("No state-action records found.")
+        stats = analyze_records(state_action_records, args.workers)
+
+    print_summary(stats)
+    if args.flags_out:
+        np.save(args.flags_out, stats["flags"])
@@ -0,0 +1,163 @@
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from glob import glob
+
+import numpy as np
+
+from pyftg.models.enums.int_action import IntAction
+from vectorize import compile_flattener, fixed_schema, flatten_frames
+
+COLUMN_DIR = "columns"
+META_FILE = "meta.json"
+ACTION_FILE = "action.npy"
+INDEX_FILE = "index.npy"
+
+INDEX_COLUMNS = ["file_id", "round", "frame"]
+
+
+def action_to_code(action) -> int:
+    """
+    action 이름을 IntAction 정수 코드로 변환합니다. 알 수 없는 action은 -1.
+    """
+    if action in IntAction.__members__:
+        return IntAction[action].value
+    return -1
+
+
+def infer_file_schema(file_path: str) -> list:
+    """
+    첫 번째 프레임에 기록된 고정 길이 필드로 스키마(컬럼 경로 목록)를 결정합니다.
+    개수가 바뀌는 projectile_data는 컬럼에 포함되지 않습니다.
+    """
+    with open(file_path, "r") as f:
+        return fixed_schema(json.loads(f.readline()))
+
+
+def convert_file(file_path: str, schema: list):
+    """
+    JSONL 파일 하나를 컬럼 배열로 변환합니다. (worker 프로세스에서 실행)
+    스키마에 맞지 않는 프레임은 NaN 행이 되고 errors에 기록됩니다.
+
+    Returns:
+        values (np.ndarray): (N, D) float32
+        actions (np.ndarray): (N,) int16
+        rounds (np.ndarray): (N,) int32
+        frames (np.ndarray): (N,) int32
+        errors (list of tuple): (줄 번호, 오류 메시지)
+    """
+    flatten, keys = compile_flattener(schema)
+    with open(file_path, "r") as f:
+        frame_dicts = [json.loads(line) for line in f]
+    values, errors = flatten_frames(frame_dicts, flatten, len(keys))
+
+    actions = np.asarray([action_to_code(d.get("action")) for d in frame_dicts], dtype=np.int16)
+    rounds = np.asarray([d.get("current_round", -1) for d in frame_dicts], dtype=np.int32)
+    frames = np.asarray([d.get("current_frame_number", -1) for d in frame_dicts], dtype=np.int32)
+    return values, actions, rounds, frames, errors
+
+
+def convert_records(file_paths: list, out_dir: str, max_workers: int = None) -> int:
+    """
+    JSONL 기록 파일들을 프로세스 풀로 병렬 변환해 컬럼별 .npy 파일로 저장합니다.
+
+    스키마는 첫 번째 파일의 첫 프레임에 기록된 고정 길이 필드입니다. (infer_file_schema 참고)
+
+    출력 구조:
+        out_dir/meta.json          컬럼 이름, 원본 파일 목록, 프레임 수
+        out_dir/columns/00000.npy  컬럼별 (N,) float32
+        out_dir/action.npy         (N,) int16, IntAction 코드
+        out_dir/index.npy          (N, 3) int32, [file_id, round, frame]
+
+    Returns:
+        int: 변환된 전체 프레임 수
+    """
+    file_paths = sorted(file_paths)
+    schema = infer_file_schema(file_paths[0])
+    _, columns = compile_flattener(schema)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(convert_file, file_paths, [schema] * len(file_paths)))
+
+    num_frames = sum(len(actions) for _, actions, _, _, _ in results)
+    os.makedirs(os.path.join(out_dir, COLUMN_DIR), exist_ok=True)
+
+    open_memmap = np.lib.format.open_memmap
+    column_arrays = [open_memmap(os.path.join(out_dir, COLUMN_DIR, f"{i:05d}.npy"), mode="w+", dtype=np.float32, shape=(num_frames,))
+                     for i in range(len(columns))]
+    action_array = open_memmap(os.path.join(out_dir, ACTION_FILE), mode="w+", dtype=np.int16, shape=(num_frames,))
+    index_array = open_memmap(os.path.join(out_dir, INDEX_FILE), mode="w+", dtype=np.int32, shape=(num_frames, len(INDEX_COLUMNS)))
+
+    start = 0
+    for file_id, (values, actions, rounds, frames, errors) in enumerate(results):
+        for line_no, message in errors:
+            print(f"{file_paths[file_id]}:{line_no + 1}: {message}")
+        end = start + len(actions)
+        for i, column_array in enumerate(column_arrays):
+            column_array[start:end] = values[:, i]
+        action_array[start:end] = actions
+        index_array[start:end, 0] = file_id
+        index_array[start:end, 1] = rounds
+        index_array[start:end, 2] = frames
+        start = end
+
+    for array in column_arrays + [action_array, index_array]:
+        array.flush()
+
+    with open(os.path.join(out_dir, META_FILE), "w") as f:
+        json.dump({"columns": columns, "files": file_paths, "num_frames": num_frames}, f)
+    return num_frames
+
+
+class ColumnarDataset:
+    """
+    convert_records로 만든 데이터셋을 np.memmap으로 열어 복사 없이 임의 접근합니다.
+    """
+
+    def __init__(self, data_dir: str):
+        with open(os.path.join(data_dir, META_FILE), "r") as f:
+            meta = json.load(f)
+        self.data_dir = data_dir
+        self.columns: list = meta["columns"]
+        self.files: list = meta["files"]
+        self.num_frames: int = meta["num_frames"]
+        self._column_ids = {k: i for i, k in enumerate(self.columns)}
+        self._cache = {}
+        self.action = np.load(os.path.join(data_dir, ACTION_FILE), mmap_mode="r")
+        self.index = np.load(os.path.join(data_dir, INDEX_FILE), mmap_mode="r")
+
+    def __len__(self):
+        return self.num_frames
+
+    def __getitem__(self, key: str) -> np.memmap:
+        """
+        컬럼 하나를 (N,) memmap으로 반환합니다.
+        """
+        if key not in self._cache:
+            path = os.path.join(self.data_dir, COLUMN_DIR, f"{self._column_ids[key]:05d}.npy")
+            self._cache[key] = np.load(path, mmap_mode="r")
+        return self._cache[key]
+
+    def rows(self, indices, keys: list = None) -> np.ndarray:
+        """
+        선택한 프레임들의 (len(indices), len(keys)) 배열을 만듭니다.
+        """
+        keys = self.columns if keys is None else keys
+        return np.stack([self[k][indices] for k in keys], axis=-1)
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="state-action JSONL 기록을 컬럼형 .npy 데이터셋으로 변환")
+    parser.add_argument("--records", default="../state_action_records/*.jsonl")
+    parser.add_argument("--out", default="../state_action_dataset")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    state_action_records = glob(args.records)
+    if not state_action_records:
+        raise FileNotFoundError("No state-action records found.")
+
+    num_frames = convert_records(state_action_records, args.out, args.workers)
+    print(f"{len(state_action_records)} files, {num_frames} frames -> {args.out}")
@@ -1,4 +1,5 @@
 from pyftg.aiinterface.ai_interface import AIInterface
+from pyftg.aiinterface.async_ai_interface import AsyncAIInterface
 from pyftg.aiinterface.command_center import CommandCenter
 from pyftg.models.audio_data import AudioData
 from pyftg.models.frame_data import FrameData
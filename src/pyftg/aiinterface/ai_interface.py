@@ -1,4 +1,6 @@
+import dis
 from abc import ABC, abstractmethod
+from typing import FrozenSet, List, Optional
 
 from pyftg.models.audio_data import AudioData
 from pyftg.models.frame_data import FrameData
@@ -7,6 +9,35 @@ from pyftg.models.key import Key
 from pyftg.models.round_result import RoundResult
 from pyftg.models.screen_data import ScreenData
 
+FRAME_DATA = "frame_data"
+NON_DELAY_FRAME_DATA = "non_delay_frame_data"
+SCREEN_DATA = "screen_data"
+AUDIO_DATA = "audio_data"
+
+_STREAM_HANDLERS = {
+    FRAME_DATA: "get_information",
+    NON_DELAY_FRAME_DATA: "get_non_delay_frame_data",
+    SCREEN_DATA: "get_screen_data",
+    AUDIO_DATA: "get_audio_data",
+}
+
+
+def is_noop(method) -> bool:
+    """
+    Check whether a method's body does nothing, such as `pass`, `...` or only a docstring.
+
+    Args:
+        method: Function or bound method.
+
+    Returns:
+        bool: True if the method is a no-op.
+    """
+    code = getattr(getattr(method, "__func__", method), "__code__", None)
+    if code is None:
+        return False
+    instructions = [(i.opname, i.argval) for i in dis.get_instructions(code) if i.opname not in ("RESUME", "NOP")]
+    return instructions in ([("LOAD_CONST", None), ("RETURN_VALUE", None)], [("RETURN_CONST", None)])
+
 
 class AIInterface(ABC):
     """
@@ -44,10 +75,9 @@ class AIInterface(ABC):
         """
         pass
 
-    @abstractmethod
     def get_non_delay_frame_data(self, frame_data: FrameData):
         """
-        Get non-delay frame data.
+        Get non-delay frame data. Optional, the data is not decoded if this method is not overridden.
 
         Args:
             frame_data (FrameData): Frame data.
@@ -65,26 +95,46 @@ class AIInterface(ABC):
         """
         pass
 
-    @abstractmethod
     def get_screen_data(self, screen_data: ScreenData):
         """
-        Get screen data.
+        Get screen data. Optional, the data is not decoded if this method is not overridden.
 
         Args:
             screen_data (ScreenData): Screen data.
         """
         pass
 
-    @abstractmethod
     def get_audio_data(self, audio_data: AudioData):
         """
-        Get audio data.
+        Get audio data. Optional, the data is not decoded if this method is not overridden.
 
         Args:
             audio_data (AudioData): Audio data.
         """
         pass
 
+    def subscribed_data(self) -> FrozenSet[str]:
+        """
+        Get the data streams the AI consumes. Streams not listed are neither decoded nor delivered.
+        By default a stream is consumed if its method is overridden with a body other than `pass`.
+
+        Return:
+            FrozenSet[str]: Subset of FRAME_DATA, NON_DELAY_FRAME_DATA, SCREEN_DATA and AUDIO_DATA.
+        """
+        return frozenset(stream for stream, handler in _STREAM_HANDLERS.items() if not is_noop(getattr(self, handler)))
+
+    def input_queue(self) -> Optional[List[Key]]:
+        """
+        Get the keys the AI will input on the next frames, to opt in to the input queue fast path.
+        While the returned list is not empty, the controller pops and sends its first key itself
+        without delivering the frame data or calling `processing`. Frames are delivered again
+        once the AI has to decide.
+
+        Return:
+            Optional[List[Key]]: Pending keys such as `CommandCenter.get_skill_keys()`, or None to opt out.
+        """
+        return None
+
     @abstractmethod
     def processing(self):
         """
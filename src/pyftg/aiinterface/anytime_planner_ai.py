@@ -0,0 +1,177 @@
+import logging
+import threading
+from abc import abstractmethod
+from typing import Iterator, Optional, Tuple
+
+from pyftg.aiinterface.ai_interface import AIInterface
+from pyftg.aiinterface.command_center import CommandCenter
+from pyftg.models.audio_data import AudioData
+from pyftg.models.frame_data import FrameData
+from pyftg.models.game_data import GameData
+from pyftg.models.key import Key
+from pyftg.models.round_result import RoundResult
+from pyftg.models.screen_data import ScreenData
+
+logger = logging.getLogger(__name__)
+
+
+class AnytimePlannerAI(AIInterface):
+    """
+    Base class of agents planning in a persistent background thread.
+
+    The planner thread runs `plan` on the newest frame and publishes every action it yields,
+    then plans again from the newest frame once it is done. The frame loop and the planner only
+    exchange immutable tuples through single attribute assignments, so no lock is taken and the
+    newest result always wins. When `diverged` reports that a new frame invalidates the running plan,
+    its results are discarded and planning restarts from the new frame at the planner's next yield.
+    `processing` only consumes the newest result and never waits for the planner.
+
+    Frames are handed to the planner as they are given to `get_information`; with
+    `reuse_frame_data` enabled on the controller, override `snapshot` to copy them.
+    """
+
+    def __init__(self):
+        self.player = True
+        self.key = Key()
+        self.cc = CommandCenter()
+        self.planned_frames = 0
+        self._frame: Tuple[int, Optional[FrameData]] = (0, None)
+        self._result: Tuple[int, int, Optional[str]] = (0, 0, None)
+        self._consumed = 0
+        self._wakeup = threading.Event()
+        self._stop = False
+        self._thread: Optional[threading.Thread] = None
+
+    @abstractmethod
+    def plan(self, frame_data: FrameData) -> Iterator[Optional[str]]:
+        """
+        Plan from a frame in the planner thread, yielding refined actions as they are found.
+
+        Yielding None publishes nothing and only gives the base class a point to abandon the plan,
+        so long computations should yield regularly.
+
+        Args:
+            frame_data (FrameData): Frame to plan from.
+
+        Yields:
+            Optional[str]: Best action found so far, passed to `CommandCenter.command_call`.
+        """
+        pass
+
+    def diverged(self, previous: FrameData, latest: FrameData) -> bool:
+        """
+        Whether a new frame invalidates the plans started from the previous frame.
+        By default a plan is invalidated when the round, an action or the hp of either character changes.
+
+        Args:
+            previous (FrameData): Previous frame.
+            latest (FrameData): New frame.
+
+        Returns:
+            bool: True to discard the running plan and restart from the new frame.
+        """
+        if previous.current_round != latest.current_round:
+            return True
+        for player in (True, False):
+            a, b = previous.get_character(player), latest.get_character(player)
+            if a is None or b is None:
+                return a is not b
+            if a.action != b.action or a.hp != b.hp:
+                return True
+        return False
+
+    def snapshot(self, frame_data: FrameData) -> FrameData:
+        """
+        Get the object handed to the planner for a received frame.
+
+        Args:
+            frame_data (FrameData): Received frame.
+
+        Returns:
+            FrameData: Frame to plan from. Defaults to the received frame itself.
+        """
+        return frame_data
+
+    def name(self) -> str:
+        return self.__class__.__name__
+
+    def is_blind(self) -> bool:
+        return False
+
+    def initialize(self, game_data: GameData, player_number: bool):
+        self.player = player_number
+        self.key = Key()
+        self.cc = CommandCenter()
+        if self._thread is None:
+            self._stop = False
+            self._thread = threading.Thread(target=self._run, name=f"{self.name()}-planner", daemon=True)
+            self._thread.start()
+
+    def get_non_delay_frame_data(self, frame_data: FrameData):
+        pass
+
+    def get_information(self, frame_data: FrameData, is_control: bool):
+        self.cc.set_frame_data(frame_data, self.player)
+        if frame_data.empty_flag or frame_data.current_frame_number <= 0:
+            return
+        generation, latest = self._frame
+        if latest is None or self.diverged(latest, frame_data):
+            generation += 1
+        self._frame = (generation, self.snapshot(frame_data))
+        self._wakeup.set()
+
+    def get_screen_data(self, screen_data: ScreenData):
+        pass
+
+    def get_audio_data(self, audio_data: AudioData):
+        pass
+
+    def processing(self):
+        if self.cc.get_skill_flag():
+            self.key = self.cc.get_skill_key()
+            return
+        self.key.empty()
+        self.cc.skill_cancel()
+
+        generation, sequence, action = self._result
+        if generation == self._frame[0] and sequence != self._consumed and action is not None:
+            self._consumed = sequence
+            self.cc.command_call(action)
+
+    def input(self) -> Key:
+        return self.key
+
+    def round_end(self, round_result: RoundResult):
+        self._frame = (self._frame[0] + 1, None)
+
+    def game_end(self):
+        pass
+
+    def close(self):
+        if self._thread is not None:
+            self._stop = True
+            self._wakeup.set()
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        sequence = 0
+        planned = None
+        while not self._stop:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            generation, frame_data = self._frame
+            if frame_data is None or frame_data is planned:
+                continue
+            planned = frame_data
+            try:
+                for action in self.plan(frame_data):
+                    if self._stop or self._frame[0] != generation:
+                        break
+                    if action is not None:
+                        sequence += 1
+                        self._result = (generation, sequence, action)
+                else:
+                    self.planned_frames += 1
+            except Exception:
+                logger.exception("Planner failed")
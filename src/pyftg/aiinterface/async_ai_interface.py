@@ -0,0 +1,21 @@
+from abc import abstractmethod
+
+from pyftg.aiinterface.ai_interface import AIInterface
+
+
+class AsyncAIInterface(AIInterface):
+    """
+    Abstract class for AI interface whose processing is a coroutine.
+
+    `AIController` awaits `processing` directly on its event loop instead of running it in a thread
+    executor, which suits agents whose work is asyncio-native I/O such as requests to an inference server.
+    CPU-bound work inside the coroutine blocks the event loop and every controller sharing it.
+    `initialize`, `round_end`, `game_end` and `close` may also be defined as coroutines; they are awaited when they are.
+    """
+
+    @abstractmethod
+    async def processing(self):
+        """
+        Processing.
+        """
+        pass
@@ -0,0 +1,135 @@
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+from pyftg.aiinterface.ai_interface import AIInterface
+from pyftg.aiinterface.command_center import CommandCenter
+from pyftg.models.audio_data import AudioData
+from pyftg.models.frame_data import FrameData
+from pyftg.models.game_data import GameData
+from pyftg.models.key import Key
+from pyftg.models.round_result import RoundResult
+from pyftg.models.screen_data import ScreenData
+from pyftg.utils.mcts import Node, SearchTree, Simulator, create_pool, run_search, submit_paths
+
+
+class MCTSAI(AIInterface):
+    """
+    Base class of agents choosing their actions by parallel Monte Carlo tree search.
+
+    Leaves are evaluated in batches by a `Simulator` running in a persistent process pool,
+    which holds the pluggable forward model and evaluator. Search is anytime: every `processing`
+    call searches until `time_budget` has elapsed and commands the action with the most backed-up
+    evaluations; nothing is commanded until a first batch has been evaluated.
+    The tree is kept between frames and re-rooted on the action the character was observed to start.
+    """
+
+    def __init__(self, actions: Sequence[str], simulator: Simulator, workers: int = 2, time_budget: float = 0.012,
+                 batch_size: int = 16, max_depth: int = 3, exploration: float = 1.4):
+        """
+        Initialize AI.
+
+        Args:
+            actions (Sequence[str]): Commands the search chooses from, also used as tree edges.
+            simulator (Simulator): Simulator evaluating action paths. It must be picklable.
+            workers (int): Number of worker processes. 0 to evaluate in the agent's process.
+            time_budget (float): Search time per decision, in seconds.
+            batch_size (int): Number of leaves evaluated per task.
+            max_depth (int): Maximum depth of the tree.
+            exploration (float): UCT exploration constant.
+        """
+        self.actions = list(actions)
+        self.simulator = simulator
+        self.workers = workers
+        self.time_budget = time_budget
+        self.batch_size = batch_size
+        self.tree = SearchTree(self.actions, exploration, max_depth)
+        self.rollouts = 0
+        self.frame_data: Optional[FrameData] = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pending: Dict[Future, List[Node]] = {}
+        self._seed = 0
+        self._observed_action: Optional[str] = None
+
+    def name(self) -> str:
+        return self.__class__.__name__
+
+    def is_blind(self) -> bool:
+        return False
+
+    def initialize(self, game_data: GameData, player_number: bool):
+        self.key = Key()
+        self.cc = CommandCenter()
+        self.player = player_number
+        if self.workers > 0 and self._pool is None:
+            self._pool = create_pool(self.simulator, self.workers)
+
+    def get_non_delay_frame_data(self, frame_data: FrameData):
+        pass
+
+    def get_information(self, frame_data: FrameData, is_control: bool):
+        self.frame_data = frame_data
+        self.cc.set_frame_data(frame_data, self.player)
+
+    def get_screen_data(self, screen_data: ScreenData):
+        pass
+
+    def get_audio_data(self, audio_data: AudioData):
+        pass
+
+    def processing(self):
+        if self.frame_data is None or self.frame_data.empty_flag or self.frame_data.current_frame_number <= 0:
+            return
+        if self.cc.get_skill_flag():
+            self.key = self.cc.get_skill_key()
+            return
+        self.key.empty()
+        self.cc.skill_cancel()
+
+        action = self.search(self.frame_data, time.perf_counter() + self.time_budget)
+        if action is not None:
+            self.cc.command_call(action)
+
+    def search(self, frame_data: FrameData, deadline: float) -> Optional[str]:
+        """
+        Re-root the tree on the observed action and search until the deadline.
+
+        Args:
+            frame_data (FrameData): Current frame.
+            deadline (float): `time.perf_counter()` value at which to stop.
+
+        Returns:
+            Optional[str]: Action with the most backed-up evaluations, or None if no evaluation has come back yet.
+        """
+        character = frame_data.get_character(self.player)
+        observed = character.action.name if character is not None else None
+        if observed != self._observed_action:
+            self.tree.reroot(observed)
+            self._observed_action = observed
+        self.rollouts += run_search(self.tree, lambda paths: self._submit(frame_data, paths), deadline,
+                                    self._pending, max(self.workers, 1) * 2, self.batch_size)
+        return self.tree.best_action()
+
+    def _submit(self, frame_data: FrameData, paths: List[List[str]]) -> Future:
+        self._seed += 1
+        if self._pool is not None:
+            return submit_paths(self._pool, frame_data, self.player, paths, self._seed)
+        future = Future()
+        future.set_result(self.simulator.evaluate(frame_data, self.player, paths, self._seed))
+        return future
+
+    def input(self) -> Key:
+        return self.key
+
+    def round_end(self, round_result: RoundResult):
+        self.tree.reset()
+        self._observed_action = None
+
+    def game_end(self):
+        pass
+
+    def close(self):
+        self._pending.clear()
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
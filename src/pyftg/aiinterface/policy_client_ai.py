@@ -0,0 +1,84 @@
+import asyncio
+from typing import Callable, Optional
+
+import numpy as np
+
+from pyftg.aiinterface.async_ai_interface import AsyncAIInterface
+from pyftg.models.audio_data import AudioData
+from pyftg.models.frame_data import FrameData
+from pyftg.models.game_data import GameData
+from pyftg.models.key import Key
+from pyftg.models.round_result import RoundResult
+from pyftg.models.screen_data import ScreenData
+from pyftg.utils.policy_server import PolicyServer
+
+
+class PolicyClientAI(AsyncAIInterface):
+    """
+    AI delegating its decisions to a `PolicyServer` shared with other agents.
+
+    `processing` awaits the server's future on the controller's event loop without holding a thread,
+    so any number of controllers can wait on the server at once and have their observations batched
+    into one forward pass, while the thread executor stays free for the other agents.
+    """
+
+    def __init__(self, server: PolicyServer, observe: Callable[[FrameData, bool], Optional[np.ndarray]],
+                 timeout: Optional[float] = None, name: Optional[str] = None):
+        """
+        Initialize AI.
+
+        Args:
+            server (PolicyServer): Shared policy server.
+            observe (Callable[[FrameData, bool], Optional[np.ndarray]]): Encoder of a frame seen from a player.
+                Frames it returns None for are answered with an empty key without calling the server.
+            timeout (float, optional): Maximum time to wait for the server, in seconds.
+            name (str, optional): AI name. Defaults to the class name.
+        """
+        self.server = server
+        self.observe = observe
+        self.timeout = timeout
+        self.ai_name = name or self.__class__.__name__
+        self.key = Key()
+        self.frame_data: Optional[FrameData] = None
+
+    def name(self) -> str:
+        return self.ai_name
+
+    def is_blind(self) -> bool:
+        return False
+
+    def initialize(self, game_data: GameData, player_number: bool):
+        self.player = player_number
+
+    def get_non_delay_frame_data(self, frame_data: FrameData):
+        pass
+
+    def get_information(self, frame_data: FrameData, is_control: bool):
+        self.frame_data = frame_data
+
+    def get_screen_data(self, screen_data: ScreenData):
+        pass
+
+    def get_audio_data(self, audio_data: AudioData):
+        pass
+
+    async def processing(self):
+        observation = None
+        if self.frame_data is not None and not self.frame_data.empty_flag and self.frame_data.current_frame_number > 0:
+            observation = self.observe(self.frame_data, self.player)
+        if observation is None:
+            self.key = Key()
+        else:
+            self.key = await asyncio.wait_for(asyncio.wrap_future(self.server.submit(observation)), self.timeout)
+
+    def input(self) -> Key:
+        return self.key
+
+    def round_end(self, round_result: RoundResult):
+        pass
+
+    def game_end(self):
+        pass
+
+    def close(self):
+        pass
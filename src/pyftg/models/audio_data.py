@@ -1,12 +1,13 @@
 from dataclasses import dataclass, field
 from typing import List
 
-from google.protobuf.message import Message
-
 from pyftg.models.base_model import BaseModel
+from pyftg.models.converter import generate_converters
 from pyftg.models.fft_data import FFTData
+from pyftg.protoc import message_pb2
 
 
+@generate_converters(message_pb2.GrpcAudioData, proto_names={"raw_data_bytes": "raw_data_as_bytes", "spectrogram_data_bytes": "spectrogram_data_as_bytes"})
 @dataclass
 class AudioData(BaseModel):
     """
@@ -25,26 +26,3 @@ class AudioData(BaseModel):
     """
     spectrogram_data_bytes (bytes): Spectrogram data bytes.
     """
-
-    def to_dict(self):
-        return {
-            "raw_data_bytes": self.raw_data_bytes,
-            "fft_data": [data.to_dict() for data in self.fft_data],
-            "spectrogram_data_bytes": self.spectrogram_data_bytes
-        }
-
-    @classmethod
-    def from_dict(cls, data_obj: dict):
-        return AudioData(
-            raw_data_bytes=data_obj["raw_data_bytes"],
-            fft_data=[FFTData.from_dict(data) for data in data_obj["fft_data"]],
-            spectrogram_data_bytes=data_obj["spectrogram_data_bytes"]
-        )
-    
-    @classmethod
-    def from_proto(cls, proto_obj: Message):
-        return AudioData(
-            raw_data_bytes=proto_obj.raw_data_as_bytes,
-            fft_data=list(map(FFTData.from_proto, proto_obj.fft_data)),
-            spectrogram_data_bytes=proto_obj.spectrogram_data_as_bytes
-        )
@@ -0,0 +1,489 @@
+import abc
+import dataclasses
+import struct
+import typing
+import zlib
+from enum import Enum
+from typing import Callable, Dict, Iterable, Optional
+
+from google.protobuf.descriptor import FieldDescriptor
+
+VALUE = "value"
+ENUM = "enum"
+MODEL = "model"
+LIST_VALUE = "list_value"
+LIST_MODEL = "list_model"
+LIST_OPTIONAL_MODEL = "list_optional_model"
+
+BINARY_VERSION = 1
+BINARY_HEADER = struct.Struct("<BI")
+"""
+Header of `to_bytes` buffers: format version and schema id of the packed class.
+"""
+STR_SIZE = 32
+"""
+Size in bytes of string fields in the binary layout. Packing a longer string, or one ending with
+a NUL character that would be lost to the padding, raises ValueError instead of truncating it.
+"""
+_COUNT = struct.Struct("<H")
+_BULK_COUNT = struct.Struct("<I")
+_PRESENT = b"\x01"
+_ABSENT = b"\x00"
+_BINARY_CODES = {int: "i", bool: "?", float: "d", str: f"{STR_SIZE}s"}
+
+
+def _is_model(tp) -> bool:
+    return isinstance(tp, type) and hasattr(tp, "to_dict") and dataclasses.is_dataclass(tp)
+
+
+def _is_int_enum(tp) -> bool:
+    return isinstance(tp, type) and issubclass(tp, Enum) and hasattr(tp, "to_int")
+
+
+def _classify(tp):
+    """
+    Classify a field type annotation into one of the supported conversion kinds.
+    """
+    if _is_int_enum(tp):
+        return ENUM, tp
+    if _is_model(tp):
+        return MODEL, tp
+    if typing.get_origin(tp) in (list, typing.List):
+        (item_tp,) = typing.get_args(tp)
+        if _is_model(item_tp):
+            return LIST_MODEL, item_tp
+        if typing.get_origin(item_tp) is typing.Union:
+            args = [arg for arg in typing.get_args(item_tp) if arg is not type(None)]
+            if len(args) == 1 and _is_model(args[0]):
+                return LIST_OPTIONAL_MODEL, args[0]
+        return LIST_VALUE, item_tp
+    return VALUE, tp
+
+
+def enum_tables(enum_cls) -> tuple:
+    """
+    Build precomputed int -> member and member name -> int tables of an enum providing `to_int`.
+    The reverse table is keyed by name since hashing a member calls back into Python.
+
+    Args:
+        enum_cls: Enum class providing `to_int`.
+
+    Returns:
+        tuple: (int -> member dict, member name -> int dict).
+    """
+    from_int = {member.to_int(): member for member in enum_cls}
+    return from_int, {member.name: value for value, member in from_int.items()}
+
+
+def _update_models(items: list, protos, from_proto: Callable) -> None:
+    """
+    Update a list of models in place from repeated protobuf messages, reusing existing items.
+    """
+    num_protos = len(protos)
+    del items[num_protos:]
+    for i in range(num_protos):
+        if i == len(items):
+            items.append(from_proto(protos[i]))
+        elif items[i] is None:
+            items[i] = from_proto(protos[i])
+        else:
+            items[i].update_from_proto(protos[i])
+
+
+def unpickle_model(cls, state: tuple):
+    """
+    Rebuild a model from the compact state produced by its generated `__reduce__`.
+
+    Args:
+        cls: Model class.
+        state (tuple): Field values in field order, with enums as int codes and nested models as tuples.
+
+    Returns:
+        Rebuilt model.
+    """
+    return cls._from_state(state)
+
+
+def _encode_str(value: str) -> bytes:
+    data = value.encode()
+    if len(data) > STR_SIZE:
+        raise ValueError(f"String longer than {STR_SIZE} bytes cannot be packed: {value!r}")
+    if data.endswith(b"\x00"):
+        raise ValueError(f"String ending with a NUL character cannot be packed: {value!r}")
+    return data
+
+
+def _decode_str(data: bytes) -> str:
+    return data.rstrip(b"\x00").decode()
+
+
+def _check_header(cls, data: bytes, schema_id: int) -> None:
+    if len(data) < BINARY_HEADER.size:
+        raise ValueError(f"Buffer too short for {cls.__name__}")
+    version, data_schema_id = BINARY_HEADER.unpack_from(data)
+    if version != BINARY_VERSION or data_schema_id != schema_id:
+        raise ValueError(f"Buffer was not packed from {cls.__name__} with binary format version {BINARY_VERSION}")
+
+
+def _generate_binary(cls, fields: list, namespace: dict, ref: Callable) -> None:
+    """
+    Generate fixed-layout binary converters. Scalar fields are packed with one struct in field order,
+    followed by nested models and count-prefixed lists in field order.
+    """
+    scalar_codes, scalar_names, scalar_packs, scalar_values = [], [], [], {}
+    nested_packs, nested_unpacks, nested_values = [], [], {}
+    layout = []
+    for name, kind, tp in fields:
+        if kind == ENUM:
+            scalar_codes.append("B")
+            scalar_packs.append(f"{ref(kind, tp, 'to_int')}[self.{name}._name_]")
+            scalar_values[name] = f"{ref(kind, tp, 'from_int')}[{name}]"
+        elif kind == VALUE and tp in _BINARY_CODES:
+            scalar_codes.append(_BINARY_CODES[tp])
+            scalar_packs.append(f"_encode_str(self.{name})" if tp is str else f"self.{name}")
+            scalar_values[name] = f"_decode_str({name})" if tp is str else name
+        elif kind in (MODEL, LIST_MODEL, LIST_OPTIONAL_MODEL) and hasattr(tp, "_schema_id"):
+            pack, unpack = ref(kind, tp, "_pack_into"), ref(kind, tp, "_unpack_from")
+            if kind == MODEL:
+                nested_packs.append(f"{pack}(self.{name}, parts)")
+                nested_unpacks.append(f"{name}, offset = {unpack}(data, offset)")
+            else:
+                nested_packs.append(f"parts.append(_COUNT.pack(len(self.{name})))")
+                nested_unpacks.append(f"(count,) = _COUNT.unpack_from(data, offset)\n    offset += 2\n    {name} = []")
+                if kind == LIST_MODEL:
+                    nested_packs.append(f"for v in self.{name}:\n        {pack}(v, parts)")
+                    nested_unpacks.append(f"for _ in range(count):\n        v, offset = {unpack}(data, offset)\n        {name}.append(v)")
+                else:
+                    nested_packs.append(f"for v in self.{name}:\n        if v is None:\n            parts.append(_ABSENT)\n"
+                                        f"        else:\n            parts.append(_PRESENT)\n            {pack}(v, parts)")
+                    nested_unpacks.append(f"for _ in range(count):\n        offset += 1\n        if data[offset - 1]:\n"
+                                          f"            v, offset = {unpack}(data, offset)\n        else:\n            v = None\n"
+                                          f"        {name}.append(v)")
+            nested_values[name] = name
+            layout.append((name, kind, tp._schema_id))
+            continue
+        elif kind == LIST_VALUE and tp in _BINARY_CODES and tp is not str:
+            code = _BINARY_CODES[tp]
+            nested_packs.append(f"parts.append(_COUNT.pack(len(self.{name})))\n    parts.append(_struct.pack(f'<{{len(self.{name})}}{code}', *self.{name}))")
+            nested_unpacks.append(f"(count,) = _COUNT.unpack_from(data, offset)\n    offset += 2\n"
+                                  f"    {name} = list(_struct.unpack_from(f'<{{count}}{code}', data, offset))\n"
+                                  f"    offset += _struct.calcsize(f'<{{count}}{code}')")
+            nested_values[name] = name
+            layout.append((name, kind, code))
+            continue
+        else:
+            raise TypeError(f"{cls.__name__}.{name} cannot be packed into the binary layout")
+        scalar_names.append(name)
+        layout.append((name, kind, scalar_codes[-1]))
+
+    scalar_struct = struct.Struct("<" + "".join(scalar_codes))
+    schema_id = zlib.crc32(repr((cls.__name__, layout)).encode())
+    namespace.update(_struct=struct, _COUNT=_COUNT, _PRESENT=_PRESENT, _ABSENT=_ABSENT, _scalar=scalar_struct,
+                     _encode_str=_encode_str, _decode_str=_decode_str)
+
+    lines = [f"parts.append(_scalar.pack({', '.join(scalar_packs)}))"] if scalar_names else []
+    source = "def _pack_into(self, parts):\n    " + "\n    ".join(lines + nested_packs or ["pass"]) + "\n"
+    cls._pack_into = _compile(source, namespace, "_pack_into", cls)
+
+    lines = []
+    if scalar_names:
+        lines.append(f"({', '.join(scalar_names)}{',' if len(scalar_names) == 1 else ''}) = _scalar.unpack_from(data, offset)")
+        lines.append(f"offset += {scalar_struct.size}")
+    values = {**scalar_values, **nested_values}
+    items = ", ".join(f"{name!r}: {values[name]}" for name, _, _ in fields)
+    lines += nested_unpacks + ["obj = _new(cls)", f"obj.__dict__ = {{{items}}}", "return obj, offset"]
+    source = "def _unpack_from(cls, data, offset):\n    " + "\n    ".join(lines) + "\n"
+    cls._unpack_from = classmethod(_compile(source, namespace, "_unpack_from", cls))
+    cls._schema_id = schema_id
+
+    def to_bytes(self) -> bytes:
+        """
+        Pack this object into a versioned fixed-layout binary buffer.
+
+        Returns:
+            bytes: Packed buffer.
+        """
+        parts = [BINARY_HEADER.pack(BINARY_VERSION, schema_id)]
+        self._pack_into(parts)
+        return b"".join(parts)
+
+    def from_bytes(cls, data: bytes):
+        """
+        Unpack an object packed by `to_bytes`.
+
+        Args:
+            data (bytes): Packed buffer.
+
+        Returns:
+            Unpacked object.
+        """
+        _check_header(cls, data, schema_id)
+        try:
+            obj, offset = cls._unpack_from(data, BINARY_HEADER.size)
+        except struct.error as e:
+            raise ValueError(f"Truncated buffer of {cls.__name__}") from e
+        if offset != len(data):
+            raise ValueError(f"Trailing bytes after packed {cls.__name__}")
+        return obj
+
+    def pack_many(objs: Iterable) -> bytes:
+        """
+        Pack a sequence of objects into one buffer, e.g. a sequence of frames.
+
+        Args:
+            objs (Iterable): Objects of this class.
+
+        Returns:
+            bytes: Packed buffer.
+        """
+        objs = list(objs)
+        parts = [BINARY_HEADER.pack(BINARY_VERSION, schema_id), _BULK_COUNT.pack(len(objs))]
+        for obj in objs:
+            obj._pack_into(parts)
+        return b"".join(parts)
+
+    def unpack_many(cls, data: bytes) -> list:
+        """
+        Unpack a buffer packed by `pack_many`.
+
+        Args:
+            data (bytes): Packed buffer.
+
+        Returns:
+            list: Unpacked objects.
+        """
+        _check_header(cls, data, schema_id)
+        (count,) = _BULK_COUNT.unpack_from(data, BINARY_HEADER.size)
+        offset = BINARY_HEADER.size + _BULK_COUNT.size
+        unpack = cls._unpack_from
+        objs = []
+        try:
+            for _ in range(count):
+                obj, offset = unpack(data, offset)
+                objs.append(obj)
+        except struct.error as e:
+            raise ValueError(f"Truncated buffer of {cls.__name__} sequence") from e
+        if offset != len(data):
+            raise ValueError(f"Trailing bytes after packed {cls.__name__} sequence")
+        return objs
+
+    for function in (to_bytes, from_bytes, pack_many, unpack_many):
+        function.__module__ = cls.__module__
+        function.__qualname__ = f"{cls.__qualname__}.{function.__name__}"
+    cls.to_bytes = to_bytes
+    cls.from_bytes = classmethod(from_bytes)
+    cls.pack_many = staticmethod(pack_many)
+    cls.unpack_many = classmethod(unpack_many)
+
+
+def _compile(source: str, namespace: dict, name: str, cls) -> Callable:
+    exec(compile(source, f"<generated {cls.__name__}.{name}>", "exec"), namespace)
+    function = namespace[name]
+    function.__module__ = cls.__module__
+    function.__qualname__ = f"{cls.__qualname__}.{name}"
+    return function
+
+
+def generate_converters(proto_cls=None, proto_names: Optional[Dict[str, str]] = None,
+                        empty_defaults: Optional[Dict[str, Callable[[], object]]] = None,
+                        skip: Iterable[str] = (), binary: bool = False):
+    """
+    Class decorator generating `to_dict`, `from_dict`, `from_proto`, `to_proto`, `update_from_proto`, `copy`
+    and `__reduce__` of a model dataclass once at import time from its fields and the protobuf message descriptor.
+
+    Generated constructors are classmethods filling the instance dictionary directly instead of going
+    through `__init__`, so they build instances of the subclass they are called on, and enum fields are
+    converted with precomputed tables. `update_from_proto`
+    overwrites an existing object tree in place, so nested models and lists are reused.
+    `__reduce__` pickles a model as one flat tuple of primitives and enum int codes
+    instead of pickling every nested dataclass and enum member separately.
+
+    Args:
+        proto_cls: Generated protobuf message class the model is built from. None to skip `from_proto`
+            and `to_proto`.
+        proto_names (Dict[str, str], optional): Protobuf field names differing from the dataclass field names.
+        empty_defaults (Dict[str, Callable[[], object]], optional): Factories used by `from_proto`
+            when a repeated protobuf field is empty.
+        skip (Iterable[str]): Names of converters to keep hand-written. Skipping `from_proto`
+            also skips `to_proto` and `update_from_proto`.
+        binary (bool): Also generate `to_bytes`, `from_bytes`, `pack_many` and `unpack_many`
+            using a fixed `struct` layout. Nested models must be generated with `binary` too.
+    """
+    proto_names = proto_names or {}
+    empty_defaults = empty_defaults or {}
+    skip = set(skip)
+
+    def decorator(cls):
+        hints = typing.get_type_hints(cls)
+        fields = [(f.name, *_classify(hints[f.name])) for f in dataclasses.fields(cls)]
+        namespace = {"_new": object.__new__, "_update_models": _update_models}
+
+        def ref(kind: str, tp, suffix: str) -> str:
+            name = f"_{tp.__name__}_{suffix}"
+            if name not in namespace:
+                if kind == ENUM:
+                    namespace[f"_{tp.__name__}_from_int"], namespace[f"_{tp.__name__}_to_int"] = enum_tables(tp)
+                else:
+                    namespace[name] = getattr(tp, suffix)
+            return name
+
+        def convert_from(kind: str, tp, src: str, suffix: str) -> str:
+            if kind == ENUM:
+                return f"{ref(kind, tp, 'from_int')}[{src}]"
+            if kind == MODEL:
+                return f"{ref(kind, tp, suffix)}({src})"
+            if kind == LIST_MODEL:
+                return f"[{ref(kind, tp, suffix)}(v) for v in {src}]"
+            if kind == LIST_OPTIONAL_MODEL:
+                if suffix == "from_proto":
+                    return f"[{ref(kind, tp, suffix)}(v) for v in {src}]"
+                return f"[None if not v else {ref(kind, tp, suffix)}(v) for v in {src}]"
+            if kind == LIST_VALUE and suffix == "from_proto":
+                return f"list({src})"
+            return src
+
+        def convert_to(kind: str, tp, src: str) -> str:
+            if kind == ENUM:
+                return f"{ref(kind, tp, 'to_int')}[{src}._name_]"
+            if kind == MODEL:
+                return f"{ref(kind, tp, 'to_dict')}({src})"
+            if kind == LIST_MODEL:
+                return f"[{ref(kind, tp, 'to_dict')}(v) for v in {src}]"
+            if kind == LIST_OPTIONAL_MODEL:
+                return f"[None if not v else {ref(kind, tp, 'to_dict')}(v) for v in {src}]"
+            return src
+
+        if "to_dict" not in skip:
+            items = ", ".join(f"{name!r}: {convert_to(kind, tp, f'self.{name}')}" for name, kind, tp in fields)
+            source = f"def to_dict(self):\n    return {{{items}}}\n"
+            cls.to_dict = _compile(source, namespace, "to_dict", cls)
+
+        if "from_dict" not in skip:
+            items = ", ".join(f"{name!r}: {convert_from(kind, tp, f'data_obj[{name!r}]', 'from_dict')}"
+                              for name, kind, tp in fields)
+            source = f"def from_dict(cls, data_obj):\n    obj = _new(cls)\n    obj.__dict__ = {{{items}}}\n    return obj\n"
+            cls.from_dict = classmethod(_compile(source, namespace, "from_dict", cls))
+
+        if proto_cls is not None and "from_proto" not in skip:
+            descriptor_fields = proto_cls.DESCRIPTOR.fields_by_name
+            items = []
+            for name, kind, tp in fields:
+                proto_name = proto_names.get(name, name)
+                if proto_name not in descriptor_fields:
+                    raise TypeError(f"{proto_cls.DESCRIPTOR.full_name} has no field {proto_name} for {cls.__name__}.{name}")
+                is_repeated = descriptor_fields[proto_name].label == FieldDescriptor.LABEL_REPEATED
+                if is_repeated != kind.startswith("list"):
+                    raise TypeError(f"{cls.__name__}.{name} does not match {proto_cls.DESCRIPTOR.full_name}.{proto_name}")
+                expr = convert_from(kind, tp, f"proto_obj.{proto_name}", "from_proto")
+                if name in empty_defaults:
+                    namespace[f"_{name}_default"] = empty_defaults[name]
+                    expr = f"({expr} if proto_obj.{proto_name} else _{name}_default())"
+                items.append(f"{name!r}: {expr}")
+            source = f"def from_proto(cls, proto_obj):\n    obj = _new(cls)\n    obj.__dict__ = {{{', '.join(items)}}}\n    return obj\n"
+            cls.from_proto = classmethod(_compile(source, namespace, "from_proto", cls))
+
+            if "to_proto" not in skip:
+                namespace["_proto_cls"] = proto_cls
+                items = []
+                for name, kind, tp in fields:
+                    src = f"self.{name}"
+                    if kind == ENUM:
+                        expr = f"{ref(kind, tp, 'to_int')}[{src}._name_]"
+                    elif kind == MODEL:
+                        expr = f"{ref(kind, tp, 'to_proto')}({src})"
+                    elif kind == LIST_MODEL:
+                        expr = f"[{ref(kind, tp, 'to_proto')}(v) for v in {src}]"
+                    elif kind == LIST_OPTIONAL_MODEL:
+                        # A message cannot hold missing entries, from_proto restores them from the empty list.
+                        expr = f"[{ref(kind, tp, 'to_proto')}(v) for v in {src}] if all({src}) else []"
+                    else:
+                        expr = src
+                    items.append(f"{proto_names.get(name, name)}={expr}")
+                source = f"def to_proto(self):\n    return _proto_cls({', '.join(items)})\n"
+                cls.to_proto = _compile(source, namespace, "to_proto", cls)
+
+            if "update_from_proto" not in skip:
+                lines = []
+                for name, kind, tp in fields:
+                    src = f"proto_obj.{proto_names.get(name, name)}"
+                    if kind == ENUM:
+                        line = f"self.{name} = {convert_from(kind, tp, src, 'from_proto')}"
+                    elif kind == MODEL:
+                        line = f"self.{name}.update_from_proto({src})"
+                    elif kind in (LIST_MODEL, LIST_OPTIONAL_MODEL):
+                        line = f"_update_models(self.{name}, {src}, {ref(kind, tp, 'from_proto')})"
+                    elif kind == LIST_VALUE:
+                        line = f"self.{name}[:] = {src}"
+                    else:
+                        line = f"self.{name} = {src}"
+                    if name in empty_defaults:
+                        line = f"if {src}:\n        {line}\n    else:\n        self.{name} = _{name}_default()"
+                    lines.append(line)
+                source = "def update_from_proto(self, proto_obj):\n    " + "\n    ".join(lines) + "\n    return self\n"
+                cls.update_from_proto = _compile(source, namespace, "update_from_proto", cls)
+
+        if "copy" not in skip:
+            items = []
+            for name, kind, tp in fields:
+                src = f"self.{name}"
+                if kind == MODEL:
+                    expr = f"{src}.copy()"
+                elif kind == LIST_MODEL:
+                    expr = f"[v.copy() for v in {src}]"
+                elif kind == LIST_OPTIONAL_MODEL:
+                    expr = f"[None if v is None else v.copy() for v in {src}]"
+                elif kind == LIST_VALUE:
+                    expr = f"list({src})"
+                else:
+                    expr = src
+                items.append(f"{name!r}: {expr}")
+            source = f"def copy(self):\n    obj = _new(self.__class__)\n    obj.__dict__ = {{{', '.join(items)}}}\n    return obj\n"
+            cls.copy = _compile(source, namespace, "copy", cls)
+
+        if "__reduce__" not in skip:
+            items = []
+            for name, kind, tp in fields:
+                src = f"self.{name}"
+                if kind == ENUM:
+                    expr = f"{ref(kind, tp, 'to_int')}[{src}._name_]"
+                elif kind == MODEL:
+                    expr = f"{src}._to_state()"
+                elif kind == LIST_MODEL:
+                    expr = f"[v._to_state() for v in {src}]"
+                elif kind == LIST_OPTIONAL_MODEL:
+                    expr = f"[None if v is None else v._to_state() for v in {src}]"
+                else:
+                    expr = src
+                items.append(expr)
+            source = f"def _to_state(self):\n    return ({', '.join(items)},)\n"
+            cls._to_state = _compile(source, namespace, "_to_state", cls)
+
+            items = []
+            for i, (name, kind, tp) in enumerate(fields):
+                src = f"state[{i}]"
+                if kind == ENUM:
+                    expr = f"{ref(kind, tp, 'from_int')}[{src}]"
+                elif kind == MODEL:
+                    expr = f"{ref(kind, tp, '_from_state')}({src})"
+                elif kind == LIST_MODEL:
+                    expr = f"[{ref(kind, tp, '_from_state')}(v) for v in {src}]"
+                elif kind == LIST_OPTIONAL_MODEL:
+                    expr = f"[None if v is None else {ref(kind, tp, '_from_state')}(v) for v in {src}]"
+                elif kind == LIST_VALUE:
+                    expr = f"list({src})"
+                else:
+                    expr = src
+                items.append(f"{name!r}: {expr}")
+            source = f"def _from_state(cls, state):\n    obj = _new(cls)\n    obj.__dict__ = {{{', '.join(items)}}}\n    return obj\n"
+            cls._from_state = classmethod(_compile(source, namespace, "_from_state", cls))
+            namespace["_unpickle_model"] = unpickle_model
+            source = "def __reduce__(self):\n    return _unpickle_model, (self.__class__, self._to_state())\n"
+            cls.__reduce__ = _compile(source, namespace, "__reduce__", cls)
+
+        if binary:
+            _generate_binary(cls, fields, namespace, ref)
+
+        abc.update_abstractmethods(cls)
+        return cls
+
+    return decorator
@@ -62,8 +62,15 @@ class Action(Enum):
     STAND_D_DF_FC = "stand_d_df_fc"
 
     def to_int(self) -> int:
-        return IntAction[self.name].value
+        return _ACTION_TO_INT[self._name_]
 
     @classmethod
     def from_int(cls, action: int):
-        return Action[IntAction(action).name]
+        try:
+            return _INT_TO_ACTION[action]
+        except KeyError:
+            raise ValueError(f"{action} is not a valid IntAction") from None
+
+
+_INT_TO_ACTION = {int_action.value: Action[int_action.name] for int_action in IntAction}
+_ACTION_TO_INT = {int_action.name: int_action.value for int_action in IntAction}
@@ -10,8 +10,15 @@ class State(str, Enum):
     DOWN = "down"
 
     def to_int(self) -> int:
-        return IntState[self.name].value
+        return _STATE_TO_INT[self._name_]
     
     @classmethod
     def from_int(cls, state: int):
-        return State[IntState(state).name]
+        try:
+            return _INT_TO_STATE[state]
+        except KeyError:
+            raise ValueError(f"{state} is not a valid IntState") from None
+
+
+_INT_TO_STATE = {int_state.value: State[int_state.name] for int_state in IntState}
+_STATE_TO_INT = {int_state.name: int_state.value for int_state in IntState}
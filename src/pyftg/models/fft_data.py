@@ -1,10 +1,11 @@
 from dataclasses import dataclass
 
-from google.protobuf.message import Message
-
 from pyftg.models.base_model import BaseModel
+from pyftg.models.converter import generate_converters
+from pyftg.protoc import message_pb2
 
 
+@generate_converters(message_pb2.GrpcFftData, proto_names={"real_data_bytes": "real_data_as_bytes", "imaginary_data_bytes": "imaginary_data_as_bytes"})
 @dataclass
 class FFTData(BaseModel):
     """
@@ -19,23 +20,3 @@ class FFTData(BaseModel):
     """
     imaginary_data_bytes (bytes): Imaginary part of the FFT data.
     """
-    
-    def to_dict(self):
-        return {
-            "real_data_bytes": self.real_data_bytes,
-            "imaginary_data_bytes": self.imaginary_data_bytes
-        }
-
-    @classmethod
-    def from_dict(cls, data_obj: dict):
-        return FFTData(
-            real_data_bytes=data_obj["real_data_bytes"],
-            imaginary_data_bytes=data_obj["imaginary_data_bytes"]
-        )
-    
-    @classmethod
-    def from_proto(cls, proto_obj: Message):
-        return FFTData(
-            real_data_bytes=proto_obj.real_data_as_bytes,
-            imaginary_data_bytes=proto_obj.imaginary_data_as_bytes
-        )
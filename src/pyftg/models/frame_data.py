@@ -1,13 +1,14 @@
 from dataclasses import dataclass, field
 from typing import List, Optional
 
-from google.protobuf.message import Message
-
 from pyftg.models.attack_data import AttackData
 from pyftg.models.base_model import BaseModel
 from pyftg.models.character_data import CharacterData
+from pyftg.models.converter import generate_converters
+from pyftg.protoc import message_pb2
 
 
+@generate_converters(message_pb2.GrpcFrameData, empty_defaults={"character_data": lambda: [None, None]}, binary=True)
 @dataclass
 class FrameData(BaseModel):
     """
@@ -54,39 +55,3 @@ class FrameData(BaseModel):
     
     def get_projectiles_by_player(self, player: bool) -> List[AttackData]:
         return [x for x in self.projectile_data if x.player_number == player]
-    
-    def to_dict(self) -> dict:
-        return {
-            "character_data": [None if not data else data.to_dict() for data in self.character_data],
-            "current_frame_number": self.current_frame_number,
-            "current_round": self.current_round,
-            "projectile_data": [data.to_dict() for data in self.projectile_data],
-            "empty_flag": self.empty_flag,
-            "front": self.front
-        }
-
-    @classmethod
-    def from_dict(cls, data_obj: dict):
-        return FrameData(
-            character_data=[None if not data else CharacterData.from_dict(data) for data in data_obj["character_data"]],
-            current_frame_number=data_obj["current_frame_number"],
-            current_round=data_obj["current_round"],
-            projectile_data=[AttackData.from_dict(data) for data in data_obj["projectile_data"]],
-            empty_flag=data_obj["empty_flag"],
-            front=data_obj["front"]
-        )
-    
-    @classmethod
-    def from_proto(cls, proto_obj: Message):
-        character_data = [None, None]
-        if len(proto_obj.character_data) > 0:
-            character_data = [CharacterData.from_proto(data) for data in proto_obj.character_data]
-
-        return FrameData(
-            character_data=character_data,
-            current_frame_number=proto_obj.current_frame_number,
-            current_round=proto_obj.current_round,
-            projectile_data=list(map(AttackData.from_proto, proto_obj.projectile_data)),
-            empty_flag=proto_obj.empty_flag,
-            front=list(proto_obj.front)
-        )
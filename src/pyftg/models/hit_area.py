@@ -1,10 +1,11 @@
 from dataclasses import dataclass
 
-from google.protobuf.message import Message
-
 from pyftg.models.base_model import BaseModel
+from pyftg.models.converter import generate_converters
+from pyftg.protoc import message_pb2
 
 
+@generate_converters(message_pb2.GrpcHitArea, binary=True)
 @dataclass
 class HitArea(BaseModel):
     """
@@ -27,29 +28,3 @@ class HitArea(BaseModel):
     """
     bottom (int): The most bottom y coordinate of the hit box.
     """
-    
-    def to_dict(self):
-        return {
-            "left": self.left,
-            "right": self.right,
-            "top": self.top,
-            "bottom": self.bottom
-        }
-
-    @classmethod
-    def from_dict(cls, data_obj: dict):
-        return HitArea(
-            left=data_obj["left"],
-            right=data_obj["right"],
-            top=data_obj["top"],
-            bottom=data_obj["bottom"]
-        )
-    
-    @classmethod
-    def from_proto(cls, proto_obj: Message):
-        return HitArea(
-            left=proto_obj.left,
-            right=proto_obj.right,
-            top=proto_obj.top,
-            bottom=proto_obj.bottom
-        )
@@ -1,10 +1,11 @@
 from dataclasses import dataclass
 
-from google.protobuf.message import Message
-
 from pyftg.models.base_model import BaseModel
+from pyftg.models.converter import generate_converters
+from pyftg.protoc import message_pb2
 
 
+@generate_converters(message_pb2.GrpcKey, binary=True)
 @dataclass
 class Key(BaseModel):
     """
@@ -40,6 +41,31 @@ class Key(BaseModel):
     L (bool): L key state. True if pressed, otherwise False
     """
 
+    def to_int(self) -> int:
+        """
+        Get the 7-bit integer representation, with A, B, C, U, R, D and L as bits 0 to 6.
+
+        Returns:
+            int: Key code between 0 and 127.
+        """
+        return int(self.A) | self.B << 1 | self.C << 2 | self.U << 3 | self.R << 4 | self.D << 5 | self.L << 6
+
+    @classmethod
+    def from_int(cls, code: int) -> 'Key':
+        """
+        Create a key from its 7-bit integer representation.
+
+        Args:
+            code (int): Key code between 0 and 127, see `to_int`.
+
+        Returns:
+            Key: Key data.
+        """
+        if not 0 <= code < 128:
+            raise ValueError(f"Key code out of range: {code}")
+        return cls(A=bool(code & 1), B=bool(code & 2), C=bool(code & 4), U=bool(code & 8),
+                   R=bool(code & 16), D=bool(code & 32), L=bool(code & 64))
+
     def empty(self):
         """
         Reset all key states to False.
@@ -51,38 +77,3 @@ class Key(BaseModel):
         self.R = False
         self.D = False
         self.L = False
-    
-    def to_dict(self):
-        return {
-            "A": self.A,
-            "B": self.B,
-            "C": self.C,
-            "U": self.U,
-            "R": self.R,
-            "D": self.D,
-            "L": self.L
-        }
-
-    @classmethod
-    def from_dict(cls, data_obj: dict):
-        return Key(
-            A=data_obj["A"],
-            B=data_obj["B"],
-            C=data_obj["C"],
-            U=data_obj["U"],
-            R=data_obj["R"],
-            D=data_obj["D"],
-            L=data_obj["L"]
-        )
-    
-    @classmethod
-    def from_proto(cls, proto_obj: Message):
-        return Key(
-            A=proto_obj.A,
-            B=proto_obj.B,
-            C=proto_obj.C,
-            U=proto_obj.U,
-            R=proto_obj.R,
-            D=proto_obj.D,
-            L=proto_obj.L
-        )
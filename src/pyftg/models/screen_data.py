@@ -4,8 +4,11 @@ from dataclasses import dataclass
 from google.protobuf.message import Message
 
 from pyftg.models.base_model import BaseModel
+from pyftg.models.converter import generate_converters
+from pyftg.protoc import message_pb2
 
 
+@generate_converters(message_pb2.GrpcScreenData, skip=("from_proto",))
 @dataclass
 class ScreenData(BaseModel):
     """
@@ -17,17 +20,6 @@ class ScreenData(BaseModel):
     display_bytes (bytes): Display data bytes.
     """
 
-    def to_dict(self):
-        return {
-            "display_bytes": self.display_bytes
-        }
-
-    @classmethod
-    def from_dict(cls, data_obj: dict):
-        return ScreenData(
-            display_bytes=data_obj["display_bytes"]
-        )
-    
     @classmethod
     def from_proto(cls, proto_obj: Message, decompress=True):
         display_bytes: bytes = proto_obj.display_bytes
@@ -1,9 +1,13 @@
 import asyncio
+import inspect
 import logging
+from typing import Awaitable, List, Optional
 
 from google.protobuf.message import Message
 
-from pyftg.aiinterface.ai_interface import AIInterface
+from pyftg.aiinterface.ai_interface import (AUDIO_DATA, FRAME_DATA, NON_DELAY_FRAME_DATA, SCREEN_DATA,
+                                            AIInterface)
+from pyftg.aiinterface.async_ai_interface import AsyncAIInterface
 from pyftg.models.audio_data import AudioData
 from pyftg.models.enums.flag import Flag
 from pyftg.models.frame_data import FrameData
@@ -13,7 +17,9 @@ from pyftg.models.round_result import RoundResult
 from pyftg.models.screen_data import ScreenData
 from pyftg.protoc import service_pb2
 from pyftg.socket.utils.asyncio import recv_data, send_data
-from pyftg.utils.protobuf import convert_key_to_proto
+from pyftg.utils.capture import CaptureWriter
+from pyftg.utils.decision_interval import DecisionInterval, DecisionScheduler
+from pyftg.utils.protobuf import KEY_PACKETS
 
 logger = logging.getLogger(__name__)
 
@@ -22,54 +28,187 @@ PROCESSING = b'\x01'
 
 
 class AIController:
-    def __init__(self, host: str, port: int, ai: AIInterface, player_number: bool):
+    def __init__(self, host: str, port: int, ai: AIInterface, player_number: bool, capture_path: Optional[str] = None,
+                 reuse_frame_data: bool = False, decision_interval: Optional[DecisionInterval] = None):
+        """
+        Initialize AI controller.
+
+        Args:
+            host (str): Game server host.
+            port (int): Game server port.
+            ai (AIInterface): AI to drive. The processing of an `AsyncAIInterface` is awaited directly,
+                other AIs are processed in the default thread executor. Only the data streams listed by
+                `AIInterface.subscribed_data` are decoded and delivered.
+            player_number (bool): Player number of the AI.
+            capture_path (str, optional): Path of the capture file to record received packets to.
+            reuse_frame_data (bool): If True, the same FrameData objects are refreshed in place every frame
+                instead of being reallocated. The AI must call `FrameData.copy` on frames it keeps, and a
+                `FrameRecorder` it records to must be created with `reuse_frame_data=True`.
+            decision_interval (DecisionInterval, optional): Action-repeat mode. If given, `processing` is only
+                called on the frames it selects and the last key is repeated on the others.
+        """
         self.host = host
         self.port = port
         self.ai = ai
         self.player_number = player_number
-    
+        self.capture_path = capture_path
+        self.reuse_frame_data = reuse_frame_data
+        self.frame_data: Optional[FrameData] = None
+        self.non_delay_frame_data: Optional[FrameData] = None
+        self.pending_callbacks: List[Awaitable] = []
+        self.subscriptions = ai.subscribed_data()
+        self.scheduler = DecisionScheduler(decision_interval, player_number) if decision_interval else None
+        self.last_key: Optional[Key] = None
+
     async def initialize(self) -> None:
         self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
-        request: Message = service_pb2.InitializeRequest(player_number=self.player_number, player_name=self.ai.name(), is_blind=self.ai.is_blind())
+        request: Message = service_pb2.InitializeRequest(player_number=self.player_number, player_name=self.ai.name(),
+                                                           is_blind=self.ai.is_blind())
         await send_data(self.writer, b'\x01', with_header=False)  # 1: Initialize
         await send_data(self.writer, request.SerializeToString())
 
     async def send_input_key(self, key: Key) -> None:
-        proto_key = convert_key_to_proto(key)
-        await send_data(self.writer, proto_key.SerializeToString())
+        self.writer.write(KEY_PACKETS[key.to_int()])
+        await self.writer.drain()
+
+    def convert_frame_data(self, proto_obj: Message, frame_data: Optional[FrameData]) -> FrameData:
+        """
+        Convert received frame data, updating the previous object in place in reuse mode.
+
+        Args:
+            proto_obj (Message): Received GrpcFrameData.
+            frame_data (FrameData, optional): FrameData delivered on the previous frame.
+
+        Returns:
+            FrameData: Frame data to deliver to the AI.
+        """
+        if self.reuse_frame_data and frame_data is not None:
+            return frame_data.update_from_proto(proto_obj)
+        return FrameData.from_proto(proto_obj)
+
+    def skip_processing(self, state: Message) -> Optional[Key]:
+        """
+        Get the key to send for a state without calling `processing`: the next key of the AI's input queue,
+        or the last key on frames skipped by the decision interval. The decision interval is only consulted
+        once the queue is empty, so that no decision event is consumed by a queued key. Skipped frames are
+        delivered to the AI only if `DecisionInterval.deliver_skipped_frames` is set.
+
+        Args:
+            state (Message): Received PlayerGameState.
+
+        Returns:
+            Optional[Key]: Key to send, or None if the state has to be handled and processed.
+        """
+        if state.state_flag != Flag.PROCESSING:
+            return None
+        queue = self.ai.input_queue()
+        if queue:
+            self.last_key = queue.pop(0)
+            return self.last_key
+        if not self.scheduler or self.scheduler.should_decide(state) or self.last_key is None:
+            return None
+        if self.scheduler.config.deliver_skipped_frames:
+            self.handle_state(state)
+        return self.last_key
+
+    def handle_state(self, state: Message) -> bool:
+        """
+        Deliver a game state to the AI.
+        Coroutines returned by the AI's `initialize`, `round_end` or `game_end` are kept in
+        `pending_callbacks` to be awaited by `run_pending_callbacks`.
+
+        Args:
+            state (Message): Received PlayerGameState.
+
+        Returns:
+            bool: True if the AI has to process this frame and send an input key.
+        """
+        flag = Flag(state.state_flag)
+        if flag is Flag.INITIALIZE:
+            self.add_callback(self.ai.initialize(GameData.from_proto(state.game_data), self.player_number))
+        elif flag is Flag.PROCESSING:
+            subscriptions = self.subscriptions
+            if NON_DELAY_FRAME_DATA in subscriptions and state.HasField("non_delay_frame_data"):
+                self.non_delay_frame_data = self.convert_frame_data(state.non_delay_frame_data, self.non_delay_frame_data)
+                self.ai.get_non_delay_frame_data(self.non_delay_frame_data)
+
+            if SCREEN_DATA in subscriptions and state.HasField("screen_data"):
+                self.ai.get_screen_data(ScreenData.from_proto(state.screen_data))
+
+            if FRAME_DATA in subscriptions:
+                self.frame_data = self.convert_frame_data(state.frame_data, self.frame_data)
+                self.ai.get_information(self.frame_data, state.is_control)
+            if AUDIO_DATA in subscriptions:
+                self.ai.get_audio_data(AudioData.from_proto(state.audio_data))
+            return True
+        elif flag is Flag.ROUND_END:
+            if self.scheduler:
+                self.scheduler.reset()
+            self.add_callback(self.ai.round_end(RoundResult.from_proto(state.round_result)))
+        elif flag is Flag.GAME_END:
+            if self.scheduler:
+                self.scheduler.reset()
+            self.add_callback(self.ai.round_end(RoundResult.from_proto(state.round_result)))
+            self.add_callback(self.ai.game_end())
+        return False
+
+    def add_callback(self, result):
+        """
+        Keep the result of an AI callback if it has to be awaited.
+        """
+        if inspect.isawaitable(result):
+            self.pending_callbacks.append(result)
+
+    async def run_pending_callbacks(self):
+        """
+        Await the callbacks kept by `add_callback`, in order.
+        """
+        callbacks, self.pending_callbacks = self.pending_callbacks, []
+        for callback in callbacks:
+            await callback
+
+    async def process(self):
+        """
+        Run the AI's processing, awaiting it directly for an `AsyncAIInterface`.
+        """
+        if isinstance(self.ai, AsyncAIInterface):
+            await self.ai.processing()
+        else:
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(None, self.ai.processing)
 
     async def run(self):
         await self.initialize()
-        while True:
-            data = await recv_data(self.reader, 1)
-            if not data or data == CLOSE:
-                break
-            elif data == PROCESSING:
-                state_packet = await recv_data(self.reader)
-                state: Message = service_pb2.PlayerGameState()
-                state.ParseFromString(state_packet)
-
-                flag = Flag(state.state_flag)
-                if flag is Flag.INITIALIZE:
-                    self.ai.initialize(GameData.from_proto(state.game_data), self.player_number)
-                elif flag is Flag.PROCESSING:
-                    if state.HasField("non_delay_frame_data"):
-                        self.ai.get_non_delay_frame_data(FrameData.from_proto(state.non_delay_frame_data))
-
-                    if state.HasField("screen_data"):
-                        self.ai.get_screen_data(ScreenData.from_proto(state.screen_data))
-
-                    self.ai.get_information(FrameData.from_proto(state.frame_data), state.is_control)
-                    self.ai.get_audio_data(AudioData.from_proto(state.audio_data))
-
-                    loop = asyncio.get_event_loop()
-                    await loop.run_in_executor(None, self.ai.processing)
-                    await self.send_input_key(self.ai.input())
-                elif flag is Flag.ROUND_END:
-                    self.ai.round_end(RoundResult.from_proto(state.round_result))
-                elif flag is Flag.GAME_END:
-                    self.ai.round_end(RoundResult.from_proto(state.round_result))
-                    self.ai.game_end()
-        self.ai.close()
+        capture = CaptureWriter(self.capture_path, self.player_number) if self.capture_path else None
+        state: Message = service_pb2.PlayerGameState()
+        try:
+            while True:
+                data = await recv_data(self.reader, 1)
+                if not data or data == CLOSE:
+                    break
+                elif data == PROCESSING:
+                    state_packet = await recv_data(self.reader)
+                    if not self.reuse_frame_data:
+                        state = service_pb2.PlayerGameState()
+                    state.ParseFromString(state_packet)
+                    if capture:
+                        capture.write(state_packet, state.frame_data.current_frame_number if state.HasField("frame_data") else -1)
+
+                    key = self.skip_processing(state)
+                    if key is not None:
+                        await self.send_input_key(key)
+                        continue
+
+                    process = self.handle_state(state)
+                    await self.run_pending_callbacks()
+                    if process:
+                        await self.process()
+                        self.last_key = self.ai.input().copy()
+                        await self.send_input_key(self.last_key)
+        finally:
+            if capture:
+                capture.close()
+        self.add_callback(self.ai.close())
+        await self.run_pending_callbacks()
         self.writer.close()
         await self.writer.wait_closed()
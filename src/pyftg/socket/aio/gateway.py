@@ -1,6 +1,8 @@
 import asyncio
 import logging
+import os
 from asyncio import Task
+from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 
@@ -15,15 +17,20 @@ from pyftg.socket.aio.ai_controller import AIController
 from pyftg.socket.aio.sound_controller import SoundController
 from pyftg.socket.aio.stream_controller import StreamController
 from pyftg.socket.utils.asyncio import recv_data, send_data
+from pyftg.utils.decision_interval import DecisionInterval
 from pyftg.utils.resource_loader import load_ai
 
 logger = logging.getLogger(__name__)
 
 
 class Gateway:
-    def __init__(self, host='127.0.0.1', port=31415):
+    def __init__(self, host='127.0.0.1', port=31415, capture_dir: Optional[str] = None, reuse_frame_data: bool = False,
+                 decision_interval: Optional[DecisionInterval] = None):
         self.host = host
         self.port = port
+        self.capture_dir = capture_dir
+        self.reuse_frame_data = reuse_frame_data
+        self.decision_interval = decision_interval
         self.initialize_event_loop()
         self.initialize_data()
 
@@ -79,6 +86,21 @@ class Gateway:
         """
         self.stream_agents.append(stream_agent)
 
+    def get_capture_path(self, name: str) -> Optional[str]:
+        """
+        Get the capture file path of a controller.
+
+        Args:
+            name (str): Controller name used in the file name.
+
+        Returns:
+            Optional[str]: Capture file path, or None if capturing is disabled.
+        """
+        if not self.capture_dir:
+            return None
+        os.makedirs(self.capture_dir, exist_ok=True)
+        return os.path.join(self.capture_dir, f"{datetime.now().strftime('%m%d_%H%M%S')}_{name}.cap")
+
     async def run_game(self, characters: list[str], agents: list[str], game_number: int):
         """
         Sends a request to run a game.
@@ -140,7 +162,8 @@ class Gateway:
             loop = asyncio.get_event_loop()
             for i, agent in enumerate(self.agents):
                 if agent:
-                    controller = AIController(self.host, self.port, agent, i == 0)
+                    controller = AIController(self.host, self.port, agent, i == 0, self.get_capture_path(f"P{i+1}_{agent.name()}"),
+                                              self.reuse_frame_data, self.decision_interval)
                     tasks.append(loop.create_task(controller.run()))
                     logger.info(f"Start P{i+1} AI controller task ({agent.name()})")
             await asyncio.gather(*tasks)
@@ -157,7 +180,7 @@ class Gateway:
             tasks: List[Task] = []
             loop = asyncio.get_event_loop()
             if self.sound_agent:
-                controller = SoundController(self.host, self.port, self.sound_agent, keep_alive)
+                controller = SoundController(self.host, self.port, self.sound_agent, keep_alive, self.get_capture_path("Sound"))
                 tasks.append(loop.create_task(controller.run()))
                 logger.info(f"Start Sound controller task")
             await asyncio.gather(*tasks)
@@ -174,7 +197,7 @@ class Gateway:
             tasks: List[Task] = []
             loop = asyncio.get_event_loop()
             for i, stream in enumerate(self.stream_agents):
-                controller = StreamController(self.host, self.port, stream, keep_alive)
+                controller = StreamController(self.host, self.port, stream, keep_alive, self.get_capture_path(f"Stream{i+1}"))
                 tasks.append(loop.create_task(controller.run()))
                 logger.info(f"Start Stream controller task #{i+1}")
             await asyncio.gather(*tasks)
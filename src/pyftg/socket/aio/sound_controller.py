@@ -1,5 +1,6 @@
 import asyncio
 import logging
+from typing import Optional
 
 from google.protobuf.message import Message
 
@@ -10,6 +11,7 @@ from pyftg.models.game_data import GameData
 from pyftg.models.round_result import RoundResult
 from pyftg.protoc import service_pb2
 from pyftg.socket.utils.asyncio import recv_data, send_data
+from pyftg.utils.capture import CaptureWriter
 
 logger = logging.getLogger(__name__)
 
@@ -19,11 +21,12 @@ INIT_SOUND_GENAI = b'\x03'
 
 
 class SoundController:
-    def __init__(self, host: str, port: int, sound_ai: SoundGenAIInterface, keep_alive: bool):
+    def __init__(self, host: str, port: int, sound_ai: SoundGenAIInterface, keep_alive: bool, capture_path: Optional[str] = None):
         self.host = host
         self.port = port
         self.sound_ai = sound_ai
         self.keep_alive = keep_alive
+        self.capture_path = capture_path
 
     async def initialize(self):
         self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
@@ -36,29 +39,36 @@ class SoundController:
 
     async def run(self):
         await self.initialize()
-        while True:
-            data = await recv_data(self.reader, 1)
-            if not data or data == CLOSE:
-                break
-            elif data == PROCESSING:
-                state_packet = await recv_data(self.reader)
-                state: Message = service_pb2.PlayerGameState()
-                state.ParseFromString(state_packet)
+        capture = CaptureWriter(self.capture_path) if self.capture_path else None
+        try:
+            while True:
+                data = await recv_data(self.reader, 1)
+                if not data or data == CLOSE:
+                    break
+                elif data == PROCESSING:
+                    state_packet = await recv_data(self.reader)
+                    state: Message = service_pb2.PlayerGameState()
+                    state.ParseFromString(state_packet)
+                    if capture:
+                        capture.write(state_packet, state.frame_data.current_frame_number if state.HasField("frame_data") else -1)
 
-                flag = Flag(state.state_flag)
-                if flag is Flag.INITIALIZE:
-                    self.sound_ai.initialize(GameData.from_proto(state.game_data))
-                elif flag is Flag.PROCESSING:
-                    self.sound_ai.get_information(FrameData.from_proto(state.frame_data))
+                    flag = Flag(state.state_flag)
+                    if flag is Flag.INITIALIZE:
+                        self.sound_ai.initialize(GameData.from_proto(state.game_data))
+                    elif flag is Flag.PROCESSING:
+                        self.sound_ai.get_information(FrameData.from_proto(state.frame_data))
                     
-                    loop = asyncio.get_event_loop()
-                    await loop.run_in_executor(None, self.sound_ai.processing)
-                    await self.send_audio_sample(self.sound_ai.audio_sample())
-                elif flag is Flag.ROUND_END:
-                    self.sound_ai.round_end(RoundResult.from_proto(state.round_result))
-                elif flag is Flag.GAME_END:
-                    self.sound_ai.round_end(RoundResult.from_proto(state.round_result))
-                    self.sound_ai.game_end()
+                        loop = asyncio.get_event_loop()
+                        await loop.run_in_executor(None, self.sound_ai.processing)
+                        await self.send_audio_sample(self.sound_ai.audio_sample())
+                    elif flag is Flag.ROUND_END:
+                        self.sound_ai.round_end(RoundResult.from_proto(state.round_result))
+                    elif flag is Flag.GAME_END:
+                        self.sound_ai.round_end(RoundResult.from_proto(state.round_result))
+                        self.sound_ai.game_end()
+        finally:
+            if capture:
+                capture.close()
         self.sound_ai.close()
         self.writer.close()
         await self.writer.wait_closed()
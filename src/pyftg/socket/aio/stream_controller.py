@@ -1,5 +1,6 @@
 import asyncio
 import logging
+from typing import Optional
 
 from google.protobuf.message import Message
 
@@ -12,6 +13,7 @@ from pyftg.models.round_result import RoundResult
 from pyftg.models.screen_data import ScreenData
 from pyftg.protoc import service_pb2
 from pyftg.socket.utils.asyncio import recv_data, send_data
+from pyftg.utils.capture import CaptureWriter
 
 logger = logging.getLogger(__name__)
 
@@ -21,11 +23,12 @@ INIT_STREAM = b'\x04'
 
 
 class StreamController:
-    def __init__(self, host: str, port: int, stream: StreamInterface, keep_alive: bool):
+    def __init__(self, host: str, port: int, stream: StreamInterface, keep_alive: bool, capture_path: Optional[str] = None):
         self.host = host
         self.port = port
         self.stream = stream
         self.keep_alive = keep_alive
+        self.capture_path = capture_path
     
     async def initialize(self) -> None:
         self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
@@ -38,34 +41,41 @@ class StreamController:
 
     async def run(self):
         await self.initialize()
-        while True:
-            data = await recv_data(self.reader, 1)
-            if not data or data == CLOSE:
-                break
-            elif data == PROCESSING:
-                state_packet = await recv_data(self.reader)
-                state: Message = service_pb2.PlayerGameState()
-                state.ParseFromString(state_packet)
+        capture = CaptureWriter(self.capture_path) if self.capture_path else None
+        try:
+            while True:
+                data = await recv_data(self.reader, 1)
+                if not data or data == CLOSE:
+                    break
+                elif data == PROCESSING:
+                    state_packet = await recv_data(self.reader)
+                    state: Message = service_pb2.PlayerGameState()
+                    state.ParseFromString(state_packet)
+                    if capture:
+                        capture.write(state_packet, state.frame_data.current_frame_number if state.HasField("frame_data") else -1)
                 
-                flag = Flag(state.state_flag)
-                if flag is Flag.INITIALIZE:
-                    self.stream.initialize(GameData.from_proto(state.game_data))
-                elif flag is Flag.PROCESSING:
-                    if state.HasField("frame_data"):
-                        self.stream.get_information(FrameData.from_proto(state.frame_data))
+                    flag = Flag(state.state_flag)
+                    if flag is Flag.INITIALIZE:
+                        self.stream.initialize(GameData.from_proto(state.game_data))
+                    elif flag is Flag.PROCESSING:
+                        if state.HasField("frame_data"):
+                            self.stream.get_information(FrameData.from_proto(state.frame_data))
 
-                    if state.HasField("audio_data"):
-                        self.stream.get_audio_data(AudioData.from_proto(state.audio_data))
+                        if state.HasField("audio_data"):
+                            self.stream.get_audio_data(AudioData.from_proto(state.audio_data))
                         
-                    if state.HasField("screen_data"):
-                        self.stream.get_screen_data(ScreenData.from_proto(state.screen_data))
+                        if state.HasField("screen_data"):
+                            self.stream.get_screen_data(ScreenData.from_proto(state.screen_data))
                     
-                    loop = asyncio.get_event_loop()
-                    await loop.run_in_executor(None, self.stream.processing)
-                elif flag is Flag.ROUND_END:
-                    self.stream.round_end(RoundResult.from_proto(state.round_result))
-                elif flag is Flag.GAME_END:
-                    self.stream.round_end(RoundResult.from_proto(state.round_result))
-                    self.stream.game_end()
+                        loop = asyncio.get_event_loop()
+                        await loop.run_in_executor(None, self.stream.processing)
+                    elif flag is Flag.ROUND_END:
+                        self.stream.round_end(RoundResult.from_proto(state.round_result))
+                    elif flag is Flag.GAME_END:
+                        self.stream.round_end(RoundResult.from_proto(state.round_result))
+                        self.stream.game_end()
+        finally:
+            if capture:
+                capture.close()
         self.writer.close()
         await self.writer.wait_closed()
@@ -0,0 +1,101 @@
+import struct
+import time
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+CAPTURE_MAGIC = b"FTGC"
+CAPTURE_VERSION = 1
+
+SPECTATOR = 2
+
+FILE_HEADER = struct.Struct("<4sBB")
+PACKET_HEADER = struct.Struct("<qiI")
+
+
+@dataclass
+class CapturedPacket:
+    """
+    CapturedPacket: Raw game state packet read from a capture file.
+    """
+
+    timestamp_ns: int
+    """
+    timestamp_ns (int): Time the packet was received, in nanoseconds since the epoch.
+    """
+    frame_number: int
+    """
+    frame_number (int): Frame number of the packet, or -1 if the packet has no frame data.
+    """
+    packet: bytes
+    """
+    packet (bytes): Serialized game state as received from the server.
+    """
+
+
+class CaptureWriter:
+    """
+    Writer that tees raw game state packets into a capture file.
+    """
+
+    def __init__(self, file_path: str, player_number: Optional[bool] = None):
+        """
+        Open capture file.
+
+        Args:
+            file_path (str): Path of the capture file.
+            player_number (bool, optional): Player number of the controller, or None for spectators.
+        """
+        self.file_path = file_path
+        self.file = open(file_path, "wb")
+        player_flag = SPECTATOR if player_number is None else int(player_number)
+        self.file.write(FILE_HEADER.pack(CAPTURE_MAGIC, CAPTURE_VERSION, player_flag))
+
+    def write(self, packet: bytes, frame_number: int = -1):
+        """
+        Append a packet to the capture file.
+
+        Args:
+            packet (bytes): Serialized game state.
+            frame_number (int): Frame number of the packet, or -1 if the packet has no frame data.
+        """
+        self.file.write(PACKET_HEADER.pack(time.time_ns(), frame_number, len(packet)))
+        self.file.write(packet)
+
+    def close(self):
+        self.file.close()
+
+
+def read_capture_player_number(file_path: str) -> Optional[bool]:
+    """
+    Read the player number a capture file was recorded for.
+
+    Args:
+        file_path (str): Path of the capture file.
+
+    Returns:
+        Optional[bool]: Player number, or None if the capture was recorded by a spectator.
+    """
+    with open(file_path, "rb") as f:
+        magic, version, player_flag = FILE_HEADER.unpack(f.read(FILE_HEADER.size))
+    if magic != CAPTURE_MAGIC or version != CAPTURE_VERSION:
+        raise ValueError(f"Unsupported capture file: {file_path}")
+    return None if player_flag == SPECTATOR else bool(player_flag)
+
+
+def read_capture(file_path: str) -> Iterator[CapturedPacket]:
+    """
+    Read the packets of a capture file.
+
+    Args:
+        file_path (str): Path of the capture file.
+
+    Yields:
+        CapturedPacket: Captured packets in receive order.
+    """
+    with open(file_path, "rb") as f:
+        magic, version, _ = FILE_HEADER.unpack(f.read(FILE_HEADER.size))
+        if magic != CAPTURE_MAGIC or version != CAPTURE_VERSION:
+            raise ValueError(f"Unsupported capture file: {file_path}")
+        while header := f.read(PACKET_HEADER.size):
+            timestamp_ns, frame_number, size = PACKET_HEADER.unpack(header)
+            yield CapturedPacket(timestamp_ns, frame_number, f.read(size))
@@ -0,0 +1,162 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+from pyftg.models.frame_data import FrameData
+from pyftg.models.round_result import RoundResult
+
+T = TypeVar("T")
+
+
+@dataclass
+class StateQuantizer:
+    """
+    StateQuantizer: Configuration of the quantized fingerprint of a frame seen from one player.
+    Frames with equal fingerprints are treated as the same decision state.
+    """
+
+    distance_bucket: int = 40
+    """
+    distance_bucket (int): Bucket width of the horizontal distance to the opponent, measured along the facing direction.
+    """
+    height_bucket: int = 60
+    """
+    height_bucket (int): Bucket width of the vertical offset to the opponent.
+    """
+    energy_band: int = 50
+    """
+    energy_band (int): Band width of both characters' energy. 0 to ignore energy.
+    """
+    hp_band: int = 0
+    """
+    hp_band (int): Band width of both characters' hp. 0 to ignore hp.
+    """
+    remaining_frame_bucket: int = 0
+    """
+    remaining_frame_bucket (int): Bucket width of both characters' remaining frames. 0 to ignore them.
+    """
+    include_actions: bool = True
+    """
+    include_actions (bool): Whether both characters' actions are part of the fingerprint.
+    """
+    include_projectiles: bool = True
+    """
+    include_projectiles (bool): Whether the number of the opponent's projectiles is part of the fingerprint.
+    """
+
+    def fingerprint(self, frame_data: FrameData, player: bool) -> Optional[Hashable]:
+        """
+        Compute the fingerprint of a frame.
+
+        Args:
+            frame_data (FrameData): Frame data.
+            player (bool): Player the decision is made for.
+
+        Returns:
+            Optional[Hashable]: Fingerprint, or None if the frame has no character data and must not be cached.
+        """
+        me, opp = frame_data.get_character(player), frame_data.get_character(not player)
+        if me is None or opp is None or frame_data.empty_flag:
+            return None
+        dx = opp.x - me.x if me.front else me.x - opp.x
+        key = [dx // self.distance_bucket, (opp.y - me.y) // self.height_bucket,
+               me.state, opp.state, me.control]
+        if self.include_actions:
+            key += [me.action, opp.action]
+        if self.energy_band:
+            key += [me.energy // self.energy_band, opp.energy // self.energy_band]
+        if self.hp_band:
+            key += [me.hp // self.hp_band, opp.hp // self.hp_band]
+        if self.remaining_frame_bucket:
+            key += [me.remaining_frame // self.remaining_frame_bucket, opp.remaining_frame // self.remaining_frame_bucket]
+        if self.include_projectiles:
+            key.append(len(frame_data.get_projectiles_by_player(not player)))
+        return tuple(key)
+
+
+class DecisionCache(Generic[T]):
+    """
+    Bounded LRU memoization of a policy function keyed by the quantized fingerprint of the frame.
+
+    The policy is called as `policy(frame_data, player)` on a miss, and its result is reused
+    for later frames with the same fingerprint until evicted or invalidated.
+    Call `round_end` from the agent's `round_end` to drop decisions of the finished round.
+    """
+
+    def __init__(self, policy: Callable[[FrameData, bool], T], maxsize: int = 4096,
+                 quantizer: Optional[StateQuantizer] = None):
+        """
+        Initialize cache.
+
+        Args:
+            policy (Callable[[FrameData, bool], T]): Policy function deciding from a frame and the player number.
+            maxsize (int): Maximum number of cached decisions.
+            quantizer (StateQuantizer, optional): Fingerprint configuration. Defaults to `StateQuantizer()`.
+        """
+        self.policy = policy
+        self.maxsize = maxsize
+        self.quantizer = quantizer or StateQuantizer()
+        self.hits = 0
+        self.misses = 0
+        self._cache: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __call__(self, frame_data: FrameData, player: bool) -> T:
+        """
+        Get the decision of a frame, calling the policy only on a cache miss.
+
+        Args:
+            frame_data (FrameData): Frame data.
+            player (bool): Player the decision is made for.
+
+        Returns:
+            T: Decision of the policy.
+        """
+        key = self.quantizer.fingerprint(frame_data, player)
+        if key is None:
+            return self.policy(frame_data, player)
+        key = (player, key)
+        if key in self._cache:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        self.misses += 1
+        decision = self.policy(frame_data, player)
+        self._cache[key] = decision
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        return decision
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Ratio of cached lookups that hit, or 0.0 before any lookup.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: Hits, misses, hit rate and current size.
+        """
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hit_rate, "size": len(self._cache)}
+
+    def invalidate(self):
+        """
+        Drop all cached decisions. Statistics are kept.
+        """
+        self._cache.clear()
+
+    def round_end(self, round_result: RoundResult):
+        """
+        Invalidation hook to call from `AIInterface.round_end`.
+
+        Args:
+            round_result (RoundResult): Round result.
+        """
+        self.invalidate()
@@ -0,0 +1,102 @@
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+from google.protobuf.message import Message
+
+
+@dataclass
+class DecisionInterval:
+    """
+    DecisionInterval: Configuration of the controller's action-repeat mode.
+
+    The AI decides on every `interval`-th processing frame and whenever one of the enabled events occurs.
+    On the frames in between, the controller sends the next queued skill key or repeats the last key.
+    """
+
+    interval: int = 4
+    """
+    interval (int): Maximum number of frames between two decisions.
+    """
+    on_control_change: bool = True
+    """
+    on_control_change (bool): Whether to decide when `is_control` changes.
+    """
+    on_hit: bool = True
+    """
+    on_hit (bool): Whether to decide when the AI's character loses hp.
+    """
+    on_hit_landed: bool = False
+    """
+    on_hit_landed (bool): Whether to decide when the opponent loses hp.
+    """
+    events: List[Callable[[Message, bool], bool]] = field(default_factory=list)
+    """
+    events (List[Callable[[Message, bool], bool]]): Additional triggers called with the received PlayerGameState
+    and the player number, returning True to decide. They must be cheap since they run on every frame.
+    """
+    deliver_skipped_frames: bool = False
+    """
+    deliver_skipped_frames (bool): Whether the data of skipped frames is still delivered to the AI.
+    """
+
+
+class DecisionScheduler:
+    """
+    Per-controller state of a `DecisionInterval`, deciding from the raw PlayerGameState without decoding it.
+    """
+
+    def __init__(self, config: DecisionInterval, player_number: bool):
+        """
+        Initialize scheduler.
+
+        Args:
+            config (DecisionInterval): Action-repeat configuration.
+            player_number (bool): Player number of the AI.
+        """
+        self.config = config
+        self.player_number = player_number
+        self.decisions = 0
+        self.skipped = 0
+        self.reset()
+
+    def reset(self):
+        """
+        Make the next processing frame a decision, typically at the end of a round.
+        """
+        self._since_decision = self.config.interval
+        self._control: Optional[bool] = None
+        self._hp: Optional[tuple] = None
+
+    def should_decide(self, state: Message) -> bool:
+        """
+        Update with a processing state and tell whether the AI has to decide on it.
+
+        Args:
+            state (Message): Received PlayerGameState with the processing flag.
+
+        Returns:
+            bool: True if the AI has to process this frame.
+        """
+        config = self.config
+        self._since_decision += 1
+        decide = self._since_decision >= config.interval
+        if state.is_control != self._control:
+            decide = decide or config.on_control_change or self._control is None
+            self._control = state.is_control
+
+        characters = state.frame_data.character_data
+        if len(characters) >= 2:
+            me, opponent = (0, 1) if self.player_number else (1, 0)
+            hp = (characters[me].hp, characters[opponent].hp)
+            if self._hp is not None:
+                decide = decide or (config.on_hit and hp[0] < self._hp[0]) or (config.on_hit_landed and hp[1] < self._hp[1])
+            self._hp = hp
+
+        for event in config.events:
+            decide = event(state, self.player_number) or decide
+        if decide:
+            self._since_decision = 0
+            self.decisions += 1
+        else:
+            self.skipped += 1
+        return decide
@@ -0,0 +1,331 @@
+from dataclasses import dataclass, fields
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from pyftg.models.character_data import CharacterData
+from pyftg.models.frame_data import FrameData
+from pyftg.utils.hitbox import BOTTOM, LEFT, RIGHT, TOP, boxes_overlap
+
+STAGE_WIDTH = 960
+GROUND = 640
+GRAVITY = 1
+FRICTION = 1
+
+
+def _forward_box(box: Sequence[int], x: int, y: int, front: bool) -> List[int]:
+    left, right, top, bottom = box
+    if front:
+        return [left - x, right - x, top - y, bottom - y]
+    return [x - right, x - left, top - y, bottom - y]
+
+
+def _world_boxes(offsets: np.ndarray, x: np.ndarray, y: np.ndarray, front: np.ndarray) -> np.ndarray:
+    left = np.where(front, x + offsets[..., LEFT], x - offsets[..., RIGHT])
+    right = np.where(front, x + offsets[..., RIGHT], x - offsets[..., LEFT])
+    return np.stack([left, right, y + offsets[..., TOP], y + offsets[..., BOTTOM]], axis=-1)
+
+
+@dataclass
+class RolloutState:
+    """
+    RolloutState: State of K parallel rollouts as arrays of shape (K, 2), index 0 is player 1.
+
+    Boxes are kept as offsets from the character position relative to the facing direction,
+    so that [left, right] are mirrored when the character turns around.
+    """
+
+    x: np.ndarray
+    """
+    x (np.ndarray): (K, 2) character center x-coordinate.
+    """
+    y: np.ndarray
+    """
+    y (np.ndarray): (K, 2) character center y-coordinate.
+    """
+    speed_x: np.ndarray
+    """
+    speed_x (np.ndarray): (K, 2) horizontal speed.
+    """
+    speed_y: np.ndarray
+    """
+    speed_y (np.ndarray): (K, 2) vertical speed.
+    """
+    front: np.ndarray
+    """
+    front (np.ndarray): (K, 2) bool, True if facing right.
+    """
+    hp: np.ndarray
+    """
+    hp (np.ndarray): (K, 2) hp.
+    """
+    remaining_frame: np.ndarray
+    """
+    remaining_frame (np.ndarray): (K, 2) frames left in the current motion.
+    """
+    hurtbox: np.ndarray
+    """
+    hurtbox (np.ndarray): (K, 2, 4) hit box offsets.
+    """
+    attack_frame: np.ndarray
+    """
+    attack_frame (np.ndarray): (K, 2) current frame of the attack, -1 if the character has no attack.
+    """
+    attack_start_up: np.ndarray
+    """
+    attack_start_up (np.ndarray): (K, 2) first active frame of the attack.
+    """
+    attack_active: np.ndarray
+    """
+    attack_active (np.ndarray): (K, 2) number of active frames of the attack.
+    """
+    attack_damage: np.ndarray
+    """
+    attack_damage (np.ndarray): (K, 2) hit damage of the attack.
+    """
+    attack_box: np.ndarray
+    """
+    attack_box (np.ndarray): (K, 2, 4) attack hit area offsets.
+    """
+
+    @classmethod
+    def from_frames(cls, frames: Sequence[FrameData], repeat: int = 1) -> 'RolloutState':
+        """
+        Initialize rollouts from frames.
+
+        Args:
+            frames (Sequence[FrameData]): Frames with data of both characters.
+            repeat (int): Number of rollouts per frame. Rollouts of the same frame are consecutive.
+
+        Returns:
+            RolloutState: State of len(frames) * repeat rollouts.
+        """
+        rows = []
+        for frame_data in frames:
+            characters: List[CharacterData] = frame_data.character_data
+            if len(characters) < 2 or characters[0] is None or characters[1] is None:
+                raise ValueError("Frames must hold the data of both characters")
+            for c in characters:
+                a = c.attack_data
+                has_attack = not a.empty_flag and a.current_frame >= 0
+                area = a.current_hit_area
+                rows.append([c.x, c.y, c.speed_x, c.speed_y, c.front, c.hp, c.remaining_frame,
+                             *_forward_box((c.left, c.right, c.top, c.bottom), c.x, c.y, c.front),
+                             a.current_frame if has_attack else -1, a.start_up, a.active, a.hit_damage,
+                             *_forward_box((area.left, area.right, area.top, area.bottom), c.x, c.y, c.front)])
+        values = np.repeat(np.asarray(rows, dtype=np.float32).reshape(len(frames), 1, 2, -1), repeat, axis=1)
+        values = values.reshape(len(frames) * repeat, 2, -1)
+        return cls(
+            x=values[..., 0].copy(), y=values[..., 1].copy(),
+            speed_x=values[..., 2].copy(), speed_y=values[..., 3].copy(),
+            front=values[..., 4] != 0, hp=values[..., 5].copy(),
+            remaining_frame=values[..., 6].astype(np.int32), hurtbox=values[..., 7:11].copy(),
+            attack_frame=values[..., 11].astype(np.int32), attack_start_up=values[..., 12].astype(np.int32),
+            attack_active=values[..., 13].astype(np.int32), attack_damage=values[..., 14].copy(),
+            attack_box=values[..., 15:19].copy(),
+        )
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def copy(self) -> 'RolloutState':
+        return RolloutState(**{f.name: getattr(self, f.name).copy() for f in fields(self)})
+
+    def hurtboxes(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: (K, 2, 4) character hit boxes in stage coordinates.
+        """
+        return _world_boxes(self.hurtbox, self.x, self.y, self.front)
+
+    def attack_boxes(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: (K, 2, 4) attack hit areas in stage coordinates.
+        """
+        return _world_boxes(self.attack_box, self.x, self.y, self.front)
+
+
+@dataclass
+class ActionSpec:
+    """
+    ActionSpec: Simplified motion started by a candidate action.
+    """
+
+    speed_x: int = 0
+    """
+    speed_x (int): Horizontal speed set at the start of the motion, positive toward the facing direction.
+    """
+    speed_y: int = 0
+    """
+    speed_y (int): Vertical speed set at the start of the motion, negative for a jump.
+    """
+    frames: int = 1
+    """
+    frames (int): Length of the motion in frames.
+    """
+    start_up: int = 0
+    """
+    start_up (int): First active frame of the attack of the motion.
+    """
+    active: int = 0
+    """
+    active (int): Number of active frames of the attack. 0 if the motion has no attack.
+    """
+    damage: int = 0
+    """
+    damage (int): Hit damage of the attack.
+    """
+    hit_area: Tuple[int, int, int, int] = (0, 0, 0, 0)
+    """
+    hit_area (Tuple[int, int, int, int]): Attack hit area offsets from the character position as
+    (left, right, top, bottom), with left and right measured toward the facing direction.
+    """
+
+
+class ForwardModel:
+    """
+    Lightweight vectorized forward model of both characters over K parallel rollouts.
+
+    It models kinematics with gravity and ground friction, stage bounds, countdown of `remaining_frame`,
+    facing flips when a character is free on the ground, and attack start-up/active windows
+    with one hit per attack. It is not frame-perfect: motion-specific speeds, guards,
+    projectiles and knockback are not modeled.
+    """
+
+    def __init__(self, stage_width: int = STAGE_WIDTH, ground: int = GROUND,
+                 gravity: float = GRAVITY, friction: float = FRICTION):
+        """
+        Initialize forward model.
+
+        Args:
+            stage_width (int): Width of the stage.
+            ground (int): y-coordinate of the ground, compared with the bottom of the hit boxes.
+            gravity (float): Vertical acceleration per frame in the air.
+            friction (float): Horizontal deceleration per frame on the ground.
+        """
+        self.stage_width = stage_width
+        self.ground = ground
+        self.gravity = gravity
+        self.friction = friction
+
+    def apply_actions(self, state: RolloutState, player: int, action_ids: np.ndarray, specs: Sequence[ActionSpec]):
+        """
+        Start candidate actions in rollouts where the player is free to act.
+
+        Args:
+            state (RolloutState): Rollout state, modified in place.
+            player (int): Player index, 0 for player 1.
+            action_ids (np.ndarray): (K,) index of the action spec of each rollout, -1 for no new action.
+            specs (Sequence[ActionSpec]): Candidate actions.
+        """
+        table = np.asarray([[s.speed_x, s.speed_y, s.frames, s.start_up, s.active, s.damage, *s.hit_area] for s in specs],
+                           dtype=np.float32)
+        act = (action_ids >= 0) & (state.remaining_frame[:, player] <= 0)
+        rows = table[action_ids[act]]
+        direction = np.where(state.front[act, player], 1, -1)
+        state.speed_x[act, player] = rows[:, 0] * direction
+        state.speed_y[act, player] = rows[:, 1]
+        state.remaining_frame[act, player] = rows[:, 2]
+        has_attack = rows[:, 4] > 0
+        state.attack_frame[act, player] = np.where(has_attack, 0, -1)
+        state.attack_start_up[act, player] = rows[:, 3]
+        state.attack_active[act, player] = rows[:, 4]
+        state.attack_damage[act, player] = rows[:, 5]
+        state.attack_box[act, player] = rows[:, 6:10]
+
+    def step(self, state: RolloutState):
+        """
+        Advance all rollouts by one frame in place.
+
+        Args:
+            state (RolloutState): Rollout state.
+        """
+        state.x += state.speed_x
+        state.y += state.speed_y
+
+        bottom = state.y + state.hurtbox[..., BOTTOM]
+        on_ground = bottom >= self.ground
+        state.y -= np.where(on_ground, bottom - self.ground, 0)
+        state.speed_y = np.where(on_ground, 0, state.speed_y + self.gravity).astype(np.float32)
+        state.speed_x -= np.where(on_ground, np.sign(state.speed_x) * np.minimum(np.abs(state.speed_x), self.friction), 0)
+
+        boxes = state.hurtboxes()
+        state.x -= np.minimum(boxes[..., LEFT], 0) + np.maximum(boxes[..., RIGHT] - self.stage_width, 0)
+
+        state.remaining_frame -= state.remaining_frame > 0
+        free = on_ground & (state.remaining_frame <= 0)
+        opponent_x = state.x[:, ::-1]
+        turn = free & (opponent_x != state.x)
+        state.front = np.where(turn, opponent_x > state.x, state.front)
+
+        attacking = state.attack_frame >= 0
+        state.attack_frame += attacking
+        active = (attacking & (state.attack_frame >= state.attack_start_up)
+                  & (state.attack_frame < state.attack_start_up + state.attack_active))
+        hit = active & boxes_overlap(state.attack_boxes(), state.hurtboxes()[:, ::-1])
+        state.hp -= np.where(hit, state.attack_damage, 0)[:, ::-1]
+        expired = attacking & (state.attack_frame >= state.attack_start_up + state.attack_active)
+        state.attack_frame[hit | expired] = -1
+
+    def rollout(self, state: RolloutState, n: int, player: Optional[int] = None,
+                actions: Optional[np.ndarray] = None, specs: Optional[Sequence[ActionSpec]] = None) -> RolloutState:
+        """
+        Advance rollouts by n frames, optionally starting candidate actions of one player every frame.
+
+        Args:
+            state (RolloutState): Rollout state, modified in place.
+            n (int): Number of frames.
+            player (int, optional): Player index choosing actions.
+            actions (np.ndarray, optional): (n, K) or (K,) action spec indices, -1 for no new action.
+                A (K,) array is applied at the first frame only.
+            specs (Sequence[ActionSpec], optional): Candidate actions.
+
+        Returns:
+            RolloutState: The advanced state.
+        """
+        if actions is not None and actions.ndim == 1:
+            actions = np.concatenate([actions[None], np.full((n - 1, len(actions)), -1)])
+        for t in range(n):
+            if actions is not None:
+                self.apply_actions(state, player, actions[t], specs)
+            self.step(state)
+        return state
+
+
+ERROR_FIELDS = ("x", "y", "hp", "remaining_frame")
+
+
+def evaluate_accuracy(frames: Sequence[FrameData], horizon: int, model: Optional[ForwardModel] = None) -> Dict[str, np.ndarray]:
+    """
+    Measure the forward model against a recorded sequence by rolling every recorded frame forward
+    without new actions and comparing with the frames recorded 1..horizon frames later.
+
+    Args:
+        frames (Sequence[FrameData]): Recorded frames ordered by round and frame number.
+        horizon (int): Number of frames to predict.
+        model (ForwardModel, optional): Model to evaluate. Defaults to `ForwardModel()`.
+
+    Returns:
+        Dict[str, np.ndarray]: Mean absolute error of x, y, hp and remaining_frame per prediction step,
+            the facing mismatch rate under "front", each of shape (horizon,), and the number of evaluated
+            start frames under "samples".
+    """
+    model = model or ForwardModel()
+    frames = [f for f in frames if all(c is not None for c in f.character_data[:2]) and len(f.character_data) >= 2]
+    keys = [(f.current_round, f.current_frame_number) for f in frames]
+    index = {key: i for i, key in enumerate(keys)}
+    starts = [i for i, (r, t) in enumerate(keys) if all((r, t + h) in index for h in range(1, horizon + 1))]
+    result = {name: np.zeros(horizon) for name in ERROR_FIELDS + ("front",)}
+    result["samples"] = np.asarray(len(starts))
+    if not starts:
+        return result
+
+    state = RolloutState.from_frames([frames[i] for i in starts])
+    for h in range(1, horizon + 1):
+        model.step(state)
+        truth = RolloutState.from_frames([frames[index[(keys[i][0], keys[i][1] + h)]] for i in starts])
+        for name in ERROR_FIELDS:
+            result[name][h - 1] = np.abs(getattr(state, name) - getattr(truth, name)).mean()
+        result["front"][h - 1] = (state.front != truth.front).mean()
+    return result
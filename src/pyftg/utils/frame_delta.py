@@ -0,0 +1,198 @@
+from collections import deque
+from typing import Any, Deque, List, Optional, Tuple
+
+from pyftg.models.frame_data import FrameData
+
+Path = Tuple[Any, ...]
+Delta = List[Tuple[Path, Any]]
+
+
+def copy_tree(value: Any) -> Any:
+    """
+    Deep copy a tree of dicts and lists as produced by `to_dict`.
+
+    Args:
+        value (Any): Tree to copy.
+
+    Returns:
+        Any: Copied tree.
+    """
+    if isinstance(value, dict):
+        return {k: copy_tree(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [copy_tree(v) for v in value]
+    return value
+
+
+def diff_dicts(prev: Any, cur: Any, path: Path = ()) -> Delta:
+    """
+    Compute the changes turning one `to_dict` tree into another.
+
+    Leaves are compared by value and type. Lists whose length changed and
+    values whose type changed (e.g. a character appearing) are replaced as a whole.
+
+    Args:
+        prev (Any): Previous tree.
+        cur (Any): Current tree.
+        path (Path): Path of the given trees from the root.
+
+    Returns:
+        Delta: List of (path, new value), where path is a tuple of dict keys and list indices.
+    """
+    if type(prev) is not type(cur):
+        return [(path, cur)]
+    if isinstance(cur, dict):
+        if prev.keys() != cur.keys():
+            return [(path, cur)]
+        delta = []
+        for k, v in cur.items():
+            delta.extend(diff_dicts(prev[k], v, path + (k,)))
+        return delta
+    if isinstance(cur, list):
+        if len(prev) != len(cur):
+            return [(path, cur)]
+        delta = []
+        for i, v in enumerate(cur):
+            delta.extend(diff_dicts(prev[i], v, path + (i,)))
+        return delta
+    if prev != cur:
+        return [(path, cur)]
+    return []
+
+
+def patch_dict(tree: Any, delta: Delta) -> Any:
+    """
+    Apply a delta computed by `diff_dicts` to a tree in place.
+
+    Args:
+        tree (Any): Tree to modify.
+        delta (Delta): Changes to apply. Paths may be lists, as after a JSON round trip.
+
+    Returns:
+        Any: Patched tree, which is a new object only if the delta replaces the root.
+    """
+    for path, value in delta:
+        if not path:
+            tree = copy_tree(value)
+            continue
+        parent = tree
+        for k in path[:-1]:
+            parent = parent[k]
+        parent[path[-1]] = copy_tree(value)
+    return tree
+
+
+def diff_frames(prev: FrameData, cur: FrameData) -> Delta:
+    """
+    Compute the changes turning one frame into another.
+
+    Args:
+        prev (FrameData): Previous frame.
+        cur (FrameData): Current frame.
+
+    Returns:
+        Delta: Changes of the `to_dict` representation.
+    """
+    return diff_dicts(prev.to_dict(), cur.to_dict())
+
+
+def patch_frame(frame_data: FrameData, delta: Delta) -> FrameData:
+    """
+    Reconstruct a frame from the previous frame and a delta.
+
+    Args:
+        frame_data (FrameData): Previous frame. It is not modified.
+        delta (Delta): Changes computed by `diff_frames`.
+
+    Returns:
+        FrameData: Reconstructed frame.
+    """
+    return FrameData.from_dict(patch_dict(frame_data.to_dict(), delta))
+
+
+class FrameHistory:
+    """
+    Bounded history of frames stored as periodic keyframes and deltas.
+
+    Memory grows with the number of changed fields instead of the full frame size.
+    Reading a frame replays at most `keyframe_interval - 1` deltas.
+    """
+
+    def __init__(self, maxlen: int, keyframe_interval: int = 30):
+        """
+        Initialize history.
+
+        Args:
+            maxlen (int): Maximum number of frames kept. Older frames are dropped.
+            keyframe_interval (int): Number of frames between two keyframes.
+        """
+        if maxlen < 1 or keyframe_interval < 1:
+            raise ValueError("maxlen and keyframe_interval must be positive")
+        self.maxlen = maxlen
+        self.keyframe_interval = keyframe_interval
+        self._items: Deque[Tuple[bool, Any]] = deque()
+        self._head: Optional[dict] = None
+        self._last: Optional[dict] = None
+        self._since_keyframe = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def clear(self):
+        self._items.clear()
+        self._head = None
+        self._last = None
+        self._since_keyframe = 0
+
+    def append(self, frame_data: FrameData):
+        """
+        Append a frame. The frame is converted immediately, so it may be modified afterwards.
+
+        Args:
+            frame_data (FrameData): Frame data.
+        """
+        cur = frame_data.to_dict()
+        if self._last is None or self._since_keyframe + 1 >= self.keyframe_interval:
+            self._items.append((True, cur))
+            self._since_keyframe = 0
+        else:
+            self._items.append((False, diff_dicts(self._last, cur)))
+            self._since_keyframe += 1
+        self._last = cur
+        if self._head is None:
+            self._head = copy_tree(cur)
+        if len(self._items) > self.maxlen:
+            self._pop_oldest()
+
+    def _pop_oldest(self):
+        self._items.popleft()
+        is_keyframe, item = self._items[0]
+        if is_keyframe:
+            self._head = copy_tree(item)
+        else:
+            self._head = patch_dict(self._head, item)
+            self._items[0] = (True, copy_tree(self._head))
+
+    def __getitem__(self, i: int) -> FrameData:
+        """
+        Reconstruct a frame.
+
+        Args:
+            i (int): Index from the oldest kept frame. Negative indices count from the newest.
+
+        Returns:
+            FrameData: Reconstructed frame.
+        """
+        if i < 0:
+            i += len(self._items)
+        if not 0 <= i < len(self._items):
+            raise IndexError("frame history index out of range")
+        if i == len(self._items) - 1:
+            return FrameData.from_dict(copy_tree(self._last))
+        start = i
+        while not self._items[start][0]:
+            start -= 1
+        tree = copy_tree(self._items[start][1])
+        for j in range(start + 1, i + 1):
+            tree = patch_dict(tree, self._items[j][1])
+        return FrameData.from_dict(tree)
@@ -0,0 +1,125 @@
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+
+from pyftg.models.frame_data import FrameData
+from pyftg.models.screen_data import ScreenData
+
+
+class FrameStack:
+    """
+    Preallocated stack of the last k screens for pixel-based agents.
+
+    Frames are kept in a ring buffer of 2k slots where every frame is written twice,
+    at slot i and slot i + k, so the last k frames are always contiguous in memory
+    and can be exposed as a view without copying the history.
+    """
+
+    def __init__(self, k: int, height: int = 64, width: int = 96, dtype=np.uint8,
+                 frame_vectorizer: Optional[Callable[[FrameData], Sequence[float]]] = None):
+        """
+        Initialize frame stack.
+
+        Args:
+            k (int): Number of stacked frames.
+            height (int): Screen height in pixels.
+            width (int): Screen width in pixels.
+            dtype: Data type of the screen pixels.
+            frame_vectorizer (Callable[[FrameData], Sequence[float]], optional): Function converting
+                the frame data of each screen into a vector stored next to it.
+        """
+        if k < 1:
+            raise ValueError("k must be at least 1.")
+        self.k = k
+        self.height = height
+        self.width = width
+        self.frame_vectorizer = frame_vectorizer
+        self._screens = np.zeros((2 * k, height, width), dtype=dtype)
+        self._vectors: Optional[np.ndarray] = None
+        self._index = k - 1
+        self._count = 0
+
+    def reset(self):
+        """
+        Forget all pushed frames, e.g. at the start of a new round.
+        """
+        self._screens.fill(0)
+        if self._vectors is not None:
+            self._vectors.fill(0)
+        self._index = self.k - 1
+        self._count = 0
+
+    def push(self, screen_data: ScreenData):
+        """
+        Push a screen, typically called from `get_screen_data`.
+
+        Args:
+            screen_data (ScreenData): Decompressed screen data.
+        """
+        self.push_bytes(screen_data.display_bytes)
+
+    def push_bytes(self, display_bytes: bytes):
+        """
+        Push a screen from raw decompressed display bytes.
+
+        Args:
+            display_bytes (bytes): Decompressed display bytes of size height * width.
+        """
+        frame = np.frombuffer(display_bytes, dtype=self._screens.dtype).reshape(self.height, self.width)
+        self._index = (self._index + 1) % self.k
+        if self._count == 0:
+            # pad the history with the first frame instead of black screens
+            self._screens[:] = frame
+        else:
+            self._screens[self._index] = frame
+            self._screens[self._index + self.k] = frame
+        self._count += 1
+
+    def set_frame_data(self, frame_data: FrameData):
+        """
+        Pair the latest pushed screen with its frame data, typically called from `get_information`.
+
+        Args:
+            frame_data (FrameData): Frame data of the latest pushed screen.
+        """
+        if self.frame_vectorizer is None:
+            raise ValueError("frame_vectorizer must be set to pair screens with frame data.")
+        vector = np.asarray(self.frame_vectorizer(frame_data), dtype=np.float32)
+        if self._vectors is None:
+            self._vectors = np.zeros((2 * self.k, vector.shape[0]), dtype=np.float32)
+        if self._count <= 1:
+            self._vectors[:] = vector
+        else:
+            self._vectors[self._index] = vector
+            self._vectors[self._index + self.k] = vector
+
+    @property
+    def stack(self) -> np.ndarray:
+        """
+        Get the stacked screens ordered from oldest to newest.
+
+        Return:
+            np.ndarray: Read-only view of shape (k, height, width).
+        """
+        start = self._index + 1
+        view = self._screens[start:start + self.k]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def vectors(self) -> Optional[np.ndarray]:
+        """
+        Get the frame data vectors aligned with `stack`.
+
+        Return:
+            Optional[np.ndarray]: Read-only view of shape (k, vector_size), or None if no frame data was set.
+        """
+        if self._vectors is None:
+            return None
+        start = self._index + 1
+        view = self._vectors[start:start + self.k]
+        view.flags.writeable = False
+        return view
+
+    def __len__(self) -> int:
+        return min(self._count, self.k)
@@ -0,0 +1,224 @@
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from pyftg.models.attack_data import AttackData
+from pyftg.models.character_data import CharacterData
+from pyftg.models.frame_data import FrameData
+
+NUM_PROJECTILES = 3
+
+LEFT, RIGHT, TOP, BOTTOM = range(4)
+
+
+def _attack_row(attack: AttackData) -> list:
+    area = attack.current_hit_area
+    return [area.left, area.right, area.top, area.bottom, attack.speed_x, attack.speed_y,
+            attack.empty_flag, attack.current_frame, attack.is_projectile, attack.is_live]
+
+
+_EMPTY_ATTACK_ROW = _attack_row(AttackData())
+
+
+@dataclass
+class FrameBoxes:
+    """
+    FrameBoxes: Hurtboxes and attack boxes of a batch of frames as arrays.
+
+    Boxes are stored as [left, right, top, bottom]. Each player has 1 + num_projectiles attack slots:
+    slot 0 is `CharacterData.attack_data`, the others are filled with the player's non-empty projectiles.
+    Both `CharacterData.projectile_attack` and `FrameData.projectile_data` report the same projectiles,
+    so they are taken from the former, and from the latter only if the character reports none.
+    """
+
+    hurtboxes: np.ndarray
+    """
+    hurtboxes (np.ndarray): (B, 2, 4) character hit boxes, index 0 is player 1.
+    """
+    present: np.ndarray
+    """
+    present (np.ndarray): (B, 2) bool, whether the frame has the character's data.
+    """
+    character_speeds: np.ndarray
+    """
+    character_speeds (np.ndarray): (B, 2, 2) character speed_x and speed_y.
+    """
+    attacks: np.ndarray
+    """
+    attacks (np.ndarray): (B, 2, A, 4) current hit areas of the attack slots.
+    """
+    attack_speeds: np.ndarray
+    """
+    attack_speeds (np.ndarray): (B, 2, A, 2) speed_x and speed_y of the attack slots.
+    """
+    valid: np.ndarray
+    """
+    valid (np.ndarray): (B, 2, A) bool, whether each attack slot holds a valid attack.
+    """
+
+    @classmethod
+    def from_frames(cls, frames: Sequence[FrameData], num_projectiles: int = NUM_PROJECTILES,
+                    check_bbox: bool = True) -> 'FrameBoxes':
+        """
+        Convert frames into box arrays.
+
+        Args:
+            frames (Sequence[FrameData]): Frames. Missing characters get empty boxes and no valid attacks.
+            num_projectiles (int): Number of projectile slots per player. Extra projectiles are dropped.
+            check_bbox (bool): Whether attacks with an empty current hit area are invalid.
+
+        Returns:
+            FrameBoxes: Box arrays of the frames.
+        """
+        characters, attacks = [], []
+        for frame_data in frames:
+            for player in (True, False):
+                character: Optional[CharacterData] = frame_data.get_character(player)
+                if character is None:
+                    characters.append([0] * 7)
+                    attacks.append([_EMPTY_ATTACK_ROW] * (1 + num_projectiles))
+                    continue
+                characters.append([character.left, character.right, character.top, character.bottom,
+                                   character.speed_x, character.speed_y, 1])
+                projectiles = [p for p in character.projectile_attack if not p.empty_flag]
+                if not projectiles:
+                    projectiles = [p for p in frame_data.projectile_data if p.player_number == player and not p.empty_flag]
+                rows = [_attack_row(character.attack_data)] + [_attack_row(p) for p in projectiles[:num_projectiles]]
+                attacks.append(rows + [_EMPTY_ATTACK_ROW] * (1 + num_projectiles - len(rows)))
+
+        n = len(frames)
+        characters = np.asarray(characters, dtype=np.float32).reshape(n, 2, 7)
+        attacks = np.asarray(attacks, dtype=np.float32).reshape(n, 2, 1 + num_projectiles, 10)
+        return cls(
+            hurtboxes=characters[..., :4],
+            present=characters[..., 6] != 0,
+            character_speeds=characters[..., 4:6],
+            attacks=attacks[..., :4],
+            attack_speeds=attacks[..., 4:6],
+            valid=valid_attack_mask(attacks[..., :4], attacks[..., 6] != 0, attacks[..., 7],
+                                    attacks[..., 8] != 0, attacks[..., 9] != 0, check_bbox),
+        )
+
+    def __len__(self) -> int:
+        return len(self.hurtboxes)
+
+    def pairwise_overlaps(self, k: int = 0) -> np.ndarray:
+        """
+        Overlaps of every attack slot with both characters' hurtboxes, with all boxes moved k frames ahead.
+
+        Args:
+            k (int): Number of frames to extrapolate.
+
+        Returns:
+            np.ndarray: (B, 2, A, 2) bool, [frame, attacking player, slot, hit player].
+                Invalid attacks and missing characters never overlap.
+        """
+        attacks = extrapolate_boxes(self.attacks, self.attack_speeds, k)
+        hurtboxes = extrapolate_boxes(self.hurtboxes, self.character_speeds, k)
+        overlaps = boxes_overlap(attacks[:, :, :, None, :], hurtboxes[:, None, None, :, :])
+        return overlaps & self.valid[..., None] & self.present[:, None, None, :]
+
+    def hits(self, k: int = 0) -> np.ndarray:
+        """
+        Which attack slots hit the opponent k frames ahead.
+
+        Args:
+            k (int): Number of frames to extrapolate.
+
+        Returns:
+            np.ndarray: (B, 2, A) bool, [frame, attacking player, slot].
+        """
+        overlaps = self.pairwise_overlaps(k)
+        return np.stack([overlaps[:, 0, :, 1], overlaps[:, 1, :, 0]], axis=1)
+
+    def threats(self, horizon: int) -> np.ndarray:
+        """
+        Which attack slots hit the opponent at each of the next frames, computed at once for all frames.
+
+        Args:
+            horizon (int): Number of frames to look ahead.
+
+        Returns:
+            np.ndarray: (B, horizon + 1, 2, A) bool, [frame, frames ahead, attacking player, slot].
+        """
+        ks = np.arange(horizon + 1, dtype=np.float32)[None, :, None, None, None]
+        attacks = self.attacks[:, None] + ks * _box_velocity(self.attack_speeds)[:, None]
+        hurtboxes = self.hurtboxes[:, None] + ks[..., 0, :] * _box_velocity(self.character_speeds)[:, None]
+        opponents = hurtboxes[:, :, ::-1, None, :]
+        return boxes_overlap(attacks, opponents) & self.valid[:, None] & self.present[:, None, ::-1, None]
+
+
+def valid_attack_mask(boxes: np.ndarray, empty_flag: np.ndarray, current_frame: np.ndarray,
+                      is_projectile: np.ndarray, is_live: np.ndarray, check_bbox: bool = True) -> np.ndarray:
+    """
+    Vectorized `is_valid_attack`: the attack is not empty, its current frame is not negative,
+    a projectile is live and, if check_bbox is True, its current hit area has a positive width and height.
+
+    Args:
+        boxes (np.ndarray): (..., 4) current hit areas.
+        empty_flag (np.ndarray): (...) bool.
+        current_frame (np.ndarray): (...) current frames.
+        is_projectile (np.ndarray): (...) bool.
+        is_live (np.ndarray): (...) bool.
+        check_bbox (bool): Whether empty hit areas are invalid.
+
+    Returns:
+        np.ndarray: (...) bool.
+    """
+    valid = ~empty_flag & (current_frame >= 0) & (~is_projectile | is_live)
+    if check_bbox:
+        valid &= (boxes[..., RIGHT] > boxes[..., LEFT]) & (boxes[..., BOTTOM] > boxes[..., TOP])
+    return valid
+
+
+def boxes_overlap(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Broadcasted overlap test of [left, right, top, bottom] boxes. Touching edges count as overlapping.
+
+    Args:
+        a (np.ndarray): (..., 4) boxes.
+        b (np.ndarray): (..., 4) boxes broadcastable with a.
+
+    Returns:
+        np.ndarray: (...) bool.
+    """
+    return ((a[..., LEFT] <= b[..., RIGHT]) & (b[..., LEFT] <= a[..., RIGHT])
+            & (a[..., TOP] <= b[..., BOTTOM]) & (b[..., TOP] <= a[..., BOTTOM]))
+
+
+def _box_velocity(speeds: np.ndarray) -> np.ndarray:
+    return speeds[..., [0, 0, 1, 1]]
+
+
+def extrapolate_boxes(boxes: np.ndarray, speeds: np.ndarray, k: int) -> np.ndarray:
+    """
+    Move boxes k frames ahead with constant speed.
+
+    Args:
+        boxes (np.ndarray): (..., 4) boxes.
+        speeds (np.ndarray): (..., 2) speed_x and speed_y per frame.
+        k (int): Number of frames.
+
+    Returns:
+        np.ndarray: (..., 4) moved boxes.
+    """
+    if k == 0:
+        return boxes
+    return boxes + k * _box_velocity(speeds)
+
+
+def hit_slots(frame_data: FrameData, player: bool, horizon: int = 0) -> List[int]:
+    """
+    Get the attack slots of the opponent threatening the given player within the horizon.
+
+    Args:
+        frame_data (FrameData): Frame data.
+        player (bool): Threatened player.
+        horizon (int): Number of frames to look ahead.
+
+    Returns:
+        List[int]: Slot indices of the opponent's threatening attacks, see `FrameBoxes`.
+    """
+    threats = FrameBoxes.from_frames([frame_data]).threats(horizon)[0]
+    return np.flatnonzero(threats[:, 1 if player else 0].any(axis=0)).tolist()
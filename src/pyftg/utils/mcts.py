@@ -0,0 +1,338 @@
+import math
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from pyftg.models.frame_data import FrameData
+from pyftg.utils.forward_model import ActionSpec, ForwardModel, RolloutState
+
+VIRTUAL_LOSS = 1.0
+
+
+class Simulator(ABC):
+    """
+    Abstract class evaluating action paths from a frame, run inside MCTS worker processes.
+    """
+
+    @abstractmethod
+    def evaluate(self, frame_data: FrameData, player: bool, paths: List[List[str]], seed: int) -> List[float]:
+        """
+        Evaluate action paths.
+
+        Args:
+            frame_data (FrameData): Root frame.
+            player (bool): Player of the searching agent.
+            paths (List[List[str]]): Action names to play in order from the root frame.
+            seed (int): Seed of the random parts of the rollouts.
+
+        Returns:
+            List[float]: Value of each path for the player, in [-1, 1].
+        """
+        pass
+
+
+def hp_difference(start: RolloutState, end: RolloutState, player: int, scale: float = 50.0) -> np.ndarray:
+    """
+    Default evaluator: hp lead gained during the rollout, squashed to [-1, 1].
+
+    Args:
+        start (RolloutState): State at the root frame.
+        end (RolloutState): State at the end of the rollouts.
+        player (int): Player index, 0 for player 1.
+        scale (float): hp difference mapped to tanh(1).
+
+    Returns:
+        np.ndarray: (K,) values.
+    """
+    lead = (end.hp[:, player] - start.hp[:, player]) - (end.hp[:, 1 - player] - start.hp[:, 1 - player])
+    return np.tanh(lead / scale)
+
+
+class ForwardModelSimulator(Simulator):
+    """
+    Simulator evaluating all paths of a task at once with the vectorized `ForwardModel`.
+
+    The searching player plays the path and then random actions, the opponent plays random actions.
+    """
+
+    def __init__(self, action_specs: Dict[str, ActionSpec], depth: int = 60,
+                 evaluator: Callable[[RolloutState, RolloutState, int], np.ndarray] = hp_difference,
+                 model: Optional[ForwardModel] = None):
+        """
+        Initialize simulator.
+
+        Args:
+            action_specs (Dict[str, ActionSpec]): Motion of every action name used in paths.
+            depth (int): Number of simulated frames per rollout.
+            evaluator (Callable[[RolloutState, RolloutState, int], np.ndarray]): Evaluator of the final states.
+                It must be picklable to be sent to worker processes.
+            model (ForwardModel, optional): Forward model. Defaults to `ForwardModel()`.
+        """
+        self.names = list(action_specs)
+        self.specs = [action_specs[name] for name in self.names]
+        self.ids = {name: i for i, name in enumerate(self.names)}
+        self.depth = depth
+        self.evaluator = evaluator
+        self.model = model or ForwardModel()
+
+    def evaluate(self, frame_data: FrameData, player: bool, paths: List[List[str]], seed: int) -> List[float]:
+        rng = np.random.default_rng(seed)
+        k = len(paths)
+        me = 0 if player else 1
+        max_len = max(1, max(len(path) for path in paths))
+        planned = np.full((k, max_len), -1)
+        for i, path in enumerate(paths):
+            planned[i, :len(path)] = [self.ids[name] for name in path]
+        lengths = np.asarray([len(path) for path in paths])
+        position = np.zeros(k, dtype=np.int64)
+        rows = np.arange(k)
+
+        start = RolloutState.from_frames([frame_data], repeat=k)
+        state = start.copy()
+        for _ in range(self.depth):
+            free = state.remaining_frame[:, me] <= 0
+            random_ids = rng.integers(len(self.specs), size=k)
+            ids = np.where(position < lengths, planned[rows, np.minimum(position, max_len - 1)], random_ids)
+            self.model.apply_actions(state, me, np.where(free, ids, -1), self.specs)
+            position += free
+            opponent_ids = np.where(state.remaining_frame[:, 1 - me] <= 0, rng.integers(len(self.specs), size=k), -1)
+            self.model.apply_actions(state, 1 - me, opponent_ids, self.specs)
+            self.model.step(state)
+        return self.evaluator(start, state, me).tolist()
+
+
+class Node:
+    """
+    MCTS node reached by playing `action` from its parent.
+
+    `visits` include the virtual visits of leaves still being evaluated and drive the selection,
+    `evaluations` only count the evaluations backed up through the node.
+    """
+
+    __slots__ = ("action", "parent", "children", "visits", "evaluations", "value_sum")
+
+    def __init__(self, action: Optional[str] = None, parent: Optional['Node'] = None):
+        self.action = action
+        self.parent = parent
+        self.children: Dict[str, Node] = {}
+        self.visits = 0.0
+        self.evaluations = 0
+        self.value_sum = 0.0
+
+    @property
+    def value(self) -> float:
+        return self.value_sum / self.visits if self.visits else 0.0
+
+    def path(self) -> List[str]:
+        """
+        Returns:
+            List[str]: Actions from the root to this node.
+        """
+        actions = []
+        node = self
+        while node.parent is not None:
+            actions.append(node.action)
+            node = node.parent
+        return actions[::-1]
+
+
+class SearchTree:
+    """
+    UCT search tree over the agent's own actions, with virtual loss for batched parallel evaluation.
+    """
+
+    def __init__(self, actions: Sequence[str], exploration: float = 1.4, max_depth: int = 3):
+        """
+        Initialize tree.
+
+        Args:
+            actions (Sequence[str]): Actions expanded at every node.
+            exploration (float): UCT exploration constant.
+            max_depth (int): Maximum depth of the tree. Deeper moves are left to the rollouts.
+        """
+        self.actions = list(actions)
+        self.exploration = exploration
+        self.max_depth = max_depth
+        self.root = Node()
+
+    def reset(self):
+        self.root = Node()
+
+    def reroot(self, action: str) -> bool:
+        """
+        Move the root to the child reached by an observed action, keeping its subtree.
+
+        Args:
+            action (str): Observed action.
+
+        Returns:
+            bool: True if the subtree was reused, False if a new tree was started.
+        """
+        child = self.root.children.get(action)
+        if child is None:
+            self.root = Node()
+            return False
+        child.parent = None
+        child.action = None
+        self.root = child
+        return True
+
+    def select_leaf(self) -> Node:
+        """
+        Descend by UCT, expand one untried action and add a virtual loss along the path.
+
+        Returns:
+            Node: Selected leaf.
+        """
+        node, depth = self.root, 0
+        while depth < self.max_depth:
+            if len(node.children) < len(self.actions):
+                action = self.actions[len(node.children)]
+                node.children[action] = Node(action, node)
+                node = node.children[action]
+                break
+            log_visits = math.log(max(node.visits, 1.0))
+            node = max(node.children.values(),
+                       key=lambda c: c.value + self.exploration * math.sqrt(log_visits / max(c.visits, 1e-9)))
+            depth += 1
+        leaf = node
+        while node is not None:
+            node.visits += 1
+            node.value_sum -= VIRTUAL_LOSS
+            node = node.parent
+        return leaf
+
+    @staticmethod
+    def backpropagate(leaf: Node, value: float):
+        """
+        Replace the virtual loss added by `select_leaf` with the evaluated value.
+
+        Args:
+            leaf (Node): Leaf returned by `select_leaf`.
+            value (float): Value of the leaf's path.
+        """
+        node = leaf
+        while node is not None:
+            node.value_sum += value + VIRTUAL_LOSS
+            node.evaluations += 1
+            node = node.parent
+
+    def best_action(self) -> Optional[str]:
+        """
+        Returns:
+            Optional[str]: Action of the root with the most backed-up evaluations,
+                or None before any evaluation was backed up.
+        """
+        evaluated = [child for child in self.root.children.values() if child.evaluations]
+        if not evaluated:
+            return None
+        return max(evaluated, key=lambda c: c.evaluations).action
+
+
+_worker_simulator: Optional[Simulator] = None
+
+
+def _init_worker(simulator: Simulator):
+    global _worker_simulator
+    _worker_simulator = simulator
+
+
+def _evaluate_in_worker(frame_data: FrameData, player: bool, paths: List[List[str]], seed: int) -> List[float]:
+    return _worker_simulator.evaluate(frame_data, player, paths, seed)
+
+
+def create_pool(simulator: Simulator, workers: int) -> ProcessPoolExecutor:
+    """
+    Create a persistent process pool whose workers hold their own copy of the simulator.
+
+    Args:
+        simulator (Simulator): Simulator, sent once to every worker.
+        workers (int): Number of worker processes.
+
+    Returns:
+        ProcessPoolExecutor: Process pool for `submit_paths`.
+    """
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(simulator,))
+
+
+def submit_paths(pool: Executor, frame_data: FrameData, player: bool, paths: List[List[str]], seed: int) -> Future:
+    """
+    Evaluate paths in a pool created by `create_pool`.
+
+    Returns:
+        Future: Future of the list of values.
+    """
+    return pool.submit(_evaluate_in_worker, frame_data, player, paths, seed)
+
+
+def benchmark_throughput(simulator: Simulator, frame_data: FrameData, player: bool, actions: Sequence[str],
+                         worker_counts: Iterable[int] = (1, 2, 4), duration: float = 2.0,
+                         batch_size: int = 32, path_length: int = 3) -> Dict[int, float]:
+    """
+    Measure rollouts per second against the number of worker processes.
+
+    Args:
+        simulator (Simulator): Simulator to benchmark.
+        frame_data (FrameData): Root frame.
+        player (bool): Searching player.
+        actions (Sequence[str]): Actions the random paths are drawn from.
+        worker_counts (Iterable[int]): Numbers of workers to measure.
+        duration (float): Measuring time per worker count, in seconds.
+        batch_size (int): Paths per task.
+        path_length (int): Length of the random paths.
+
+    Returns:
+        Dict[int, float]: Rollouts per second for each number of workers.
+    """
+    rng = np.random.default_rng(0)
+    paths = [list(rng.choice(actions, size=path_length)) for _ in range(batch_size)]
+    result = {}
+    for workers in worker_counts:
+        with create_pool(simulator, workers) as pool:
+            wait([submit_paths(pool, frame_data, player, paths, seed) for seed in range(workers)])
+            rollouts, seed = 0, 0
+            start = time.perf_counter()
+            pending = {submit_paths(pool, frame_data, player, paths, seed := seed + 1) for _ in range(2 * workers)}
+            while time.perf_counter() - start < duration:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                rollouts += batch_size * len(done)
+                pending |= {submit_paths(pool, frame_data, player, paths, seed := seed + 1) for _ in done}
+            result[workers] = rollouts / (time.perf_counter() - start)
+            wait(pending)
+    return result
+
+
+def run_search(tree: SearchTree, evaluate: Callable[[List[List[str]]], Future], deadline: float,
+               pending: Dict[Future, List[Node]], max_pending: int, batch_size: int) -> int:
+    """
+    Anytime search loop: keep up to `max_pending` batches in flight and back up results until the deadline.
+    Batches still running at the deadline stay in `pending` and are backed up by the next call.
+
+    Args:
+        tree (SearchTree): Search tree.
+        evaluate (Callable[[List[List[str]]], Future]): Function submitting paths for evaluation.
+        deadline (float): `time.perf_counter()` value at which to stop.
+        pending (Dict[Future, List[Node]]): Batches in flight, updated in place.
+        max_pending (int): Maximum number of batches in flight.
+        batch_size (int): Number of leaves per batch.
+
+    Returns:
+        int: Number of rollouts backed up.
+    """
+    rollouts = 0
+    while True:
+        while len(pending) < max_pending:
+            leaves = [tree.select_leaf() for _ in range(batch_size)]
+            pending[evaluate([leaf.path() for leaf in leaves])] = leaves
+        timeout = deadline - time.perf_counter()
+        done, _ = wait(list(pending), timeout=max(timeout, 0), return_when=FIRST_COMPLETED)
+        for future in done:
+            leaves = pending.pop(future)
+            for leaf, value in zip(leaves, future.result()):
+                tree.backpropagate(leaf, value)
+            rollouts += len(leaves)
+        if time.perf_counter() >= deadline:
+            return rollouts
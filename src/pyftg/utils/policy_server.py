@@ -0,0 +1,174 @@
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, InvalidStateError
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+
+from pyftg.models.key import Key
+
+logger = logging.getLogger(__name__)
+
+_CLOSE = object()
+
+
+class PolicyServer:
+    """
+    Dynamic-batching server of a vectorized policy shared by many agents.
+
+    Agents of any number of controllers submit observations from their threads or event loops. A server thread
+    gathers them into batches of up to `max_batch_size`, waiting at most `max_wait` after the oldest
+    pending observation, runs the policy once on the stacked batch and scatters the returned keys back.
+    """
+
+    def __init__(self, policy: Callable[[np.ndarray], Sequence[Key]], max_batch_size: int = 64,
+                 max_wait: float = 0.002, metrics_window: int = 10000):
+        """
+        Initialize server and start the server thread.
+
+        Args:
+            policy (Callable[[np.ndarray], Sequence[Key]]): Policy mapping a (B, ...) batch of observations
+                to one key per observation. Returned keys must not be modified afterwards.
+            max_batch_size (int): Maximum number of observations per forward pass.
+            max_wait (float): Maximum time to wait for a batch to fill, in seconds.
+            metrics_window (int): Number of recent requests and batches kept for the metrics.
+        """
+        self.policy = policy
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.requests = 0
+        self.batches = 0
+        self._batch_sizes: deque = deque(maxlen=metrics_window)
+        self._queue_latencies: deque = deque(maxlen=metrics_window)
+        self._forward_times: deque = deque(maxlen=metrics_window)
+        self._metrics_lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="PolicyServer", daemon=True)
+        self._thread.start()
+
+    def submit(self, observation: np.ndarray) -> Future:
+        """
+        Enqueue an observation.
+
+        Args:
+            observation (np.ndarray): Observation. All observations must have the same shape and dtype.
+
+        Returns:
+            Future: Future of the key chosen by the policy.
+        """
+        if self._closed:
+            raise RuntimeError("PolicyServer is closed")
+        future = Future()
+        self._queue.put((observation, future, time.perf_counter()))
+        return future
+
+    def infer(self, observation: np.ndarray, timeout: Optional[float] = None) -> Key:
+        """
+        Get the key chosen by the policy, blocking until the observation's batch has run.
+
+        Args:
+            observation (np.ndarray): Observation.
+            timeout (float, optional): Maximum time to wait, in seconds.
+
+        Returns:
+            Key: Chosen key.
+        """
+        return self.submit(observation).result(timeout)
+
+    def stats(self) -> dict:
+        """
+        Get server metrics over the recent window.
+
+        Returns:
+            dict: Request and batch counts, mean and maximum batch size, queue latency
+                (time from submission to the start of the forward pass) mean, p50, p99 and maximum,
+                and mean forward time. Times are in seconds.
+        """
+        with self._metrics_lock:
+            requests, batches = self.requests, self.batches
+            sizes = np.asarray(self._batch_sizes, dtype=np.float64)
+            latencies = np.asarray(self._queue_latencies, dtype=np.float64)
+            forward_times = np.asarray(self._forward_times, dtype=np.float64)
+        if not len(sizes):
+            return {"requests": requests, "batches": batches}
+        return {
+            "requests": requests,
+            "batches": batches,
+            "batch_size_mean": float(sizes.mean()),
+            "batch_size_max": int(sizes.max()),
+            "queue_latency_mean": float(latencies.mean()),
+            "queue_latency_p50": float(np.percentile(latencies, 50)),
+            "queue_latency_p99": float(np.percentile(latencies, 99)),
+            "queue_latency_max": float(latencies.max()),
+            "forward_time_mean": float(forward_times.mean()),
+        }
+
+    def close(self):
+        """
+        Run the pending observations and stop the server thread.
+        """
+        if self._thread.is_alive():
+            self._closed = True
+            self._queue.put(_CLOSE)
+            self._thread.join()
+
+    def _run(self):
+        running = True
+        while running:
+            item = self._queue.get()
+            if item is _CLOSE:
+                break
+            batch = [item]
+            deadline = item[2] + self.max_wait
+            while len(batch) < self.max_batch_size:
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.perf_counter(), 0))
+                except queue.Empty:
+                    break
+                if item is _CLOSE:
+                    running = False
+                    break
+                batch.append(item)
+            try:
+                self._forward(batch)
+            except Exception:
+                logger.exception("Failed to serve a batch")
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _CLOSE and item[1].set_running_or_notify_cancel():
+                item[1].set_exception(RuntimeError("PolicyServer is closed"))
+
+    def _forward(self, batch: list):
+        # Futures cancelled by their client, e.g. on a timeout, are dropped before the forward pass.
+        # The others are marked running, so they cannot be cancelled while their result is set.
+        batch = [item for item in batch if item[1].set_running_or_notify_cancel()]
+        if not batch:
+            return
+        start = time.perf_counter()
+        try:
+            keys = self.policy(np.stack([observation for observation, _, _ in batch]))
+            if len(keys) != len(batch):
+                raise ValueError(f"policy returned {len(keys)} keys for {len(batch)} observations")
+        except Exception as e:
+            logger.exception("Policy forward pass failed")
+            for _, future, _ in batch:
+                future.set_exception(e)
+            return
+        with self._metrics_lock:
+            self._forward_times.append(time.perf_counter() - start)
+            self._batch_sizes.append(len(batch))
+            self._queue_latencies.extend(start - submitted for _, _, submitted in batch)
+            self.requests += len(batch)
+            self.batches += 1
+        for (_, future, _), key in zip(batch, keys):
+            try:
+                future.set_result(key)
+            except InvalidStateError:
+                logger.exception("Failed to set the result of a request")
@@ -1,3 +1,5 @@
+from typing import Dict, List
+
 from google.protobuf.message import Message
 
 from pyftg.models.key import Key
@@ -6,3 +8,45 @@ from pyftg.protoc import message_pb2
 
 def convert_key_to_proto(key: Key) -> Message:
     return message_pb2.GrpcKey(A=key.A, B=key.B, C=key.C, U=key.U, D=key.D, L=key.L, R=key.R)
+
+
+KEY_PAYLOADS: List[bytes] = [convert_key_to_proto(Key.from_int(code)).SerializeToString() for code in range(128)]
+"""
+KEY_PAYLOADS (List[bytes]): Serialized `GrpcKey` of every key code, see `Key.to_int`.
+"""
+KEY_PACKETS: List[bytes] = [len(payload).to_bytes(4, byteorder='little') + payload for payload in KEY_PAYLOADS]
+"""
+KEY_PACKETS (List[bytes]): Serialized `GrpcKey` of every key code framed with its 4-byte size header, ready to send.
+"""
+_KEY_CODES: Dict[bytes, int] = {payload: code for code, payload in enumerate(KEY_PAYLOADS)}
+
+
+def decode_key_code(payload: bytes) -> int:
+    """
+    Decode a serialized `GrpcKey` into its key code.
+
+    Args:
+        payload (bytes): Serialized `GrpcKey` without the size header.
+
+    Returns:
+        int: Key code, see `Key.to_int`.
+    """
+    code = _KEY_CODES.get(payload)
+    if code is None:
+        proto_key = message_pb2.GrpcKey.FromString(payload)
+        code = Key(A=proto_key.A, B=proto_key.B, C=proto_key.C, U=proto_key.U, R=proto_key.R, D=proto_key.D, L=proto_key.L).to_int()
+    return code
+
+
+def decode_key(payload: bytes) -> Key:
+    """
+    Decode a serialized `GrpcKey`.
+
+    Args:
+        payload (bytes): Serialized `GrpcKey` without the size header.
+
+    Returns:
+        Key: Key data.
+    """
+    return Key.from_int(decode_key_code(payload))
+
@@ -0,0 +1,266 @@
+import json
+import os
+import random
+import re
+from bisect import bisect_left
+from typing import Dict, IO, Iterator, List, Optional, Tuple
+
+from pyftg.models.frame_data import FrameData
+from pyftg.protoc import message_pb2
+from pyftg.utils.frame_delta import copy_tree
+from pyftg.utils.recorder import (ACTION_HEADER, BINARY, DELTA, RECORD_HEADER,
+                                  decode_binary_payload, decode_delta_record,
+                                  decode_jsonl_record)
+
+FRAME_NUMBER_PATTERN = re.compile(rb'"current_frame_number": (-?\d+)')
+ROUND_PATTERN = re.compile(rb'"current_round": (-?\d+)')
+ROUND_SUFFIX_PATTERN = re.compile(r'_r\d+$')
+
+Record = Tuple[FrameData, str]
+
+
+def get_session_id(file_path: str) -> str:
+    """
+    Get the session identifier of a recording file from its name, without the round suffix.
+
+    Args:
+        file_path (str): Path of the recording file.
+
+    Returns:
+        str: Session identifier.
+    """
+    stem = os.path.basename(file_path).rsplit(".", 1)[0]
+    return ROUND_SUFFIX_PATTERN.sub("", stem)
+
+
+def _scan_jsonl(f: IO[bytes]) -> Iterator[Tuple[int, int, int, int]]:
+    offset = 0
+    for line in f:
+        frame_number = FRAME_NUMBER_PATTERN.search(line)
+        round_number = ROUND_PATTERN.search(line)
+        if frame_number and round_number:
+            yield int(round_number.group(1)), int(frame_number.group(1)), offset, len(line)
+        else:
+            frame_data, _ = decode_jsonl_record(line)
+            yield frame_data.current_round, frame_data.current_frame_number, offset, len(line)
+        offset += len(line)
+
+
+def _scan_binary(f: IO[bytes]) -> Iterator[Tuple[int, int, int, int]]:
+    offset = 0
+    while header := f.read(RECORD_HEADER.size):
+        (size,) = RECORD_HEADER.unpack(header)
+        payload = f.read(size)
+        (action_size,) = ACTION_HEADER.unpack_from(payload)
+        proto_obj = message_pb2.GrpcFrameData.FromString(payload[ACTION_HEADER.size + action_size:])
+        yield proto_obj.current_round, proto_obj.current_frame_number, offset + RECORD_HEADER.size, size
+        offset += RECORD_HEADER.size + size
+
+
+class RecordIndex:
+    """
+    Byte offsets of every frame in a set of recording files, keyed by (session, round, frame number).
+    """
+
+    def __init__(self, files: List[str], entries: List[Tuple[str, int, int, int, int, int]]):
+        """
+        Initialize index.
+
+        Args:
+            files (List[str]): Paths of the indexed recording files.
+            entries (List[Tuple[str, int, int, int, int, int]]): Entries of
+                (session, round, frame number, file id, byte offset, byte length).
+        """
+        self.files = files
+        self.entries = entries
+        self._rounds: Dict[Tuple[str, int], Tuple[List[int], List[int]]] = {}
+        for entry_id in sorted(range(len(entries)), key=lambda i: entries[i][:3]):
+            session, round, frame = entries[entry_id][:3]
+            frames, entry_ids = self._rounds.setdefault((session, round), ([], []))
+            frames.append(frame)
+            entry_ids.append(entry_id)
+
+    @classmethod
+    def build(cls, file_paths: List[str]) -> 'RecordIndex':
+        """
+        Build an index by scanning recording files once.
+
+        Args:
+            file_paths (List[str]): Paths of `.jsonl`, `.bin` or `.delta` recording files.
+
+        Returns:
+            RecordIndex: Built index.
+        """
+        files = sorted(file_paths)
+        entries = []
+        for file_id, file_path in enumerate(files):
+            session = get_session_id(file_path)
+            scan = _scan_binary if file_path.endswith("." + BINARY) else _scan_jsonl
+            with open(file_path, "rb") as f:
+                for round, frame, offset, length in scan(f):
+                    entries.append((session, round, frame, file_id, offset, length))
+        return cls(files, entries)
+
+    def save(self, file_path: str):
+        with open(file_path, "w") as f:
+            json.dump({"files": self.files, "entries": self.entries}, f)
+
+    @classmethod
+    def load(cls, file_path: str) -> 'RecordIndex':
+        with open(file_path, "r") as f:
+            data = json.load(f)
+        return cls(data["files"], [tuple(entry) for entry in data["entries"]])
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def find(self, session: str, round: int, frame: int) -> int:
+        """
+        Find the entry of a frame.
+
+        Returns:
+            int: Entry id.
+        """
+        frames, entry_ids = self._rounds.get((session, round), ([], []))
+        i = bisect_left(frames, frame)
+        if i == len(frames) or frames[i] != frame:
+            raise KeyError((session, round, frame))
+        return entry_ids[i]
+
+    def find_range(self, session: str, round: int, start: int, stop: int) -> List[int]:
+        """
+        Find the entries of the recorded frames with start <= frame number < stop.
+
+        Returns:
+            List[int]: Entry ids ordered by frame number.
+        """
+        frames, entry_ids = self._rounds.get((session, round), ([], []))
+        return entry_ids[bisect_left(frames, start):bisect_left(frames, stop)]
+
+
+class RecordReader:
+    """
+    Random-access reader decoding only the requested frames of indexed recording files.
+
+    Frames of the delta format are rebuilt from their keyframe. The last rebuilt frame is kept,
+    so reading forward within the same keyframe interval only replays the lines in between.
+    """
+
+    def __init__(self, index: RecordIndex):
+        self.index = index
+        self._files: Dict[int, IO[bytes]] = {}
+        self._delta_state: Optional[Tuple[int, int, int, dict]] = None
+
+    def _get_file(self, file_id: int) -> IO[bytes]:
+        if file_id not in self._files:
+            self._files[file_id] = open(self.index.files[file_id], "rb")
+        return self._files[file_id]
+
+    def _decode(self, file_id: int, offset: int, data: bytes) -> Record:
+        file_path = self.index.files[file_id]
+        if file_path.endswith("." + BINARY):
+            return decode_binary_payload(data)
+        if file_path.endswith("." + DELTA):
+            return self._decode_delta(file_id, offset, data)
+        return decode_jsonl_record(data)
+
+    def _decode_delta(self, file_id: int, offset: int, data: bytes) -> Record:
+        record = json.loads(data)
+        key_offset = record.get("key_offset", offset)
+        frame_data_dict = None
+        if key_offset != offset:
+            state = self._delta_state
+            if state and state[:2] == (file_id, key_offset) and state[2] <= offset:
+                start, frame_data_dict = state[2], state[3]
+            else:
+                start = key_offset
+            f = self._get_file(file_id)
+            f.seek(start)
+            for line in f.read(offset - start).splitlines():
+                frame_data_dict, _ = decode_delta_record(line, frame_data_dict)
+        frame_data_dict, action = decode_delta_record(data, frame_data_dict)
+        self._delta_state = (file_id, key_offset, offset + len(data), frame_data_dict)
+        return FrameData.from_dict(copy_tree(frame_data_dict)), action
+
+    def read_entries(self, entry_ids: List[int]) -> List[Record]:
+        """
+        Read and decode entries. Consecutive entries of the same file are read at once.
+
+        Args:
+            entry_ids (List[int]): Entry ids.
+
+        Returns:
+            List[Record]: Frame data and action of each entry, in the given order.
+        """
+        records: List[Optional[Record]] = [None] * len(entry_ids)
+        order = sorted(range(len(entry_ids)), key=lambda i: self.index.entries[entry_ids[i]][3:5])
+        i = 0
+        while i < len(order):
+            _, _, _, file_id, start, _ = self.index.entries[entry_ids[order[i]]]
+            j, end = i, start
+            while j < len(order):
+                _, _, _, next_file_id, offset, length = self.index.entries[entry_ids[order[j]]]
+                if next_file_id != file_id or offset > end:
+                    break
+                end = max(end, offset + length)
+                j += 1
+            f = self._get_file(file_id)
+            f.seek(start)
+            chunk = f.read(end - start)
+            for k in order[i:j]:
+                _, _, _, _, offset, length = self.index.entries[entry_ids[k]]
+                records[k] = self._decode(file_id, offset, chunk[offset - start:offset - start + length])
+            i = j
+        return records
+
+    def read(self, session: str, round: int, frame: int) -> Record:
+        """
+        Read one frame.
+
+        Returns:
+            Record: Frame data and action.
+        """
+        return self.read_entries([self.index.find(session, round, frame)])[0]
+
+    def read_range(self, session: str, round: int, start: int, stop: int) -> List[Record]:
+        """
+        Read the recorded frames with start <= frame number < stop.
+
+        Returns:
+            List[Record]: Frame data and action ordered by frame number.
+        """
+        return self.read_entries(self.index.find_range(session, round, start, stop))
+
+    def sample(self, batch_size: int, rng: Optional[random.Random] = None) -> List[Record]:
+        """
+        Read a uniformly sampled minibatch of frames, with replacement.
+
+        Returns:
+            List[Record]: Sampled frame data and actions.
+        """
+        rng = rng or random
+        return self.read_entries([rng.randrange(len(self.index)) for _ in range(batch_size)])
+
+    def iter_batches(self, batch_size: int, shuffle: bool = True, seed: Optional[int] = None) -> Iterator[List[Record]]:
+        """
+        Iterate over all frames once in minibatches.
+
+        Args:
+            batch_size (int): Batch size. The last batch may be smaller.
+            shuffle (bool): Whether to visit frames in random order.
+            seed (int, optional): Seed of the shuffle.
+
+        Yields:
+            List[Record]: Minibatch of frame data and actions.
+        """
+        entry_ids = list(range(len(self.index)))
+        if shuffle:
+            random.Random(seed).shuffle(entry_ids)
+        for i in range(0, len(entry_ids), batch_size):
+            yield self.read_entries(entry_ids[i:i + batch_size])
+
+    def close(self):
+        for f in self._files.values():
+            f.close()
+        self._files.clear()
+        self._delta_state = None
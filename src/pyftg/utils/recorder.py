@@ -0,0 +1,352 @@
+import json
+import logging
+import os
+import queue
+import struct
+import threading
+from datetime import datetime
+from typing import IO, Iterator, Optional, Tuple
+
+from pyftg.models.frame_data import FrameData
+from pyftg.protoc import message_pb2
+from pyftg.utils.frame_delta import copy_tree, diff_dicts, patch_dict
+
+logger = logging.getLogger(__name__)
+
+JSONL = "jsonl"
+BINARY = "bin"
+DELTA = "delta"
+
+RECORD_HEADER = struct.Struct("<I")
+ACTION_HEADER = struct.Struct("<H")
+
+_NEXT_GAME = object()
+_CLOSE = object()
+
+
+def encode_jsonl_record(frame_data: FrameData, action: str) -> bytes:
+    """
+    Encode a frame and its action as one JSONL line.
+
+    Args:
+        frame_data (FrameData): Frame data.
+        action (str): Action chosen at this frame.
+
+    Returns:
+        bytes: Encoded line including the trailing newline.
+    """
+    frame_data_dict = frame_data.to_dict()
+    frame_data_dict["action"] = action
+    return (json.dumps(frame_data_dict) + "\n").encode()
+
+
+def encode_binary_record(frame_data: FrameData, action: str) -> bytes:
+    """
+    Encode a frame and its action as one length-prefixed binary record.
+
+    The record is a 4-byte little-endian payload size followed by the payload,
+    which holds a 2-byte action size, the action and the serialized `GrpcFrameData`.
+
+    Args:
+        frame_data (FrameData): Frame data.
+        action (str): Action chosen at this frame.
+
+    Returns:
+        bytes: Encoded record.
+    """
+    action_bytes = action.encode()
+    payload = ACTION_HEADER.pack(len(action_bytes)) + action_bytes + frame_data.to_proto().SerializeToString()
+    return RECORD_HEADER.pack(len(payload)) + payload
+
+
+def decode_jsonl_record(line: bytes) -> Tuple[FrameData, str]:
+    """
+    Decode one JSONL line.
+
+    Args:
+        line (bytes): Encoded line.
+
+    Returns:
+        Tuple[FrameData, str]: Frame data and action.
+    """
+    frame_data_dict = json.loads(line)
+    action = frame_data_dict.pop("action", None)
+    return FrameData.from_dict(frame_data_dict), action
+
+
+def decode_binary_payload(payload: bytes) -> Tuple[FrameData, str]:
+    """
+    Decode the payload of a binary record.
+
+    Args:
+        payload (bytes): Record payload without the size header.
+
+    Returns:
+        Tuple[FrameData, str]: Frame data and action.
+    """
+    (action_size,) = ACTION_HEADER.unpack_from(payload)
+    offset = ACTION_HEADER.size + action_size
+    action = payload[ACTION_HEADER.size:offset].decode()
+    proto_obj = message_pb2.GrpcFrameData.FromString(payload[offset:])
+    return FrameData.from_proto(proto_obj), action
+
+
+class DeltaRecordEncoder:
+    """
+    Encoder of the delta format: JSONL lines holding either a keyframe or the changes since the previous frame.
+
+    Every line starts with "current_round", "current_frame_number" and "action".
+    A keyframe line then holds the whole frame under "key". A delta line holds
+    "key_offset", the byte offset of its keyframe line in the file, and "delta",
+    a list of [path, value] changes computed by `diff_dicts`.
+    """
+
+    def __init__(self, keyframe_interval: int = 60):
+        """
+        Initialize encoder.
+
+        Args:
+            keyframe_interval (int): Number of frames between two keyframes.
+        """
+        self.keyframe_interval = keyframe_interval
+        self.reset()
+
+    def reset(self, offset: int = 0):
+        """
+        Start a new file, so that the next frame is a keyframe.
+
+        Args:
+            offset (int): Current size of the file the lines are appended to.
+        """
+        self._offset = offset
+        self._key_offset = -1
+        self._prev: Optional[dict] = None
+        self._since_keyframe = 0
+
+    def encode(self, frame_data: FrameData, action: str) -> bytes:
+        """
+        Encode a frame and its action as one line.
+
+        Args:
+            frame_data (FrameData): Frame data.
+            action (str): Action chosen at this frame.
+
+        Returns:
+            bytes: Encoded line including the trailing newline.
+        """
+        cur = frame_data.to_dict()
+        record = {"current_round": frame_data.current_round, "current_frame_number": frame_data.current_frame_number, "action": action}
+        if self._prev is None or self._since_keyframe + 1 >= self.keyframe_interval:
+            record["key"] = cur
+            self._key_offset = self._offset
+            self._since_keyframe = 0
+        else:
+            record["key_offset"] = self._key_offset
+            record["delta"] = diff_dicts(self._prev, cur)
+            self._since_keyframe += 1
+        self._prev = cur
+        line = (json.dumps(record) + "\n").encode()
+        self._offset += len(line)
+        return line
+
+
+def decode_delta_record(line: bytes, frame_data_dict: Optional[dict]) -> Tuple[dict, str]:
+    """
+    Decode one line of the delta format.
+
+    Args:
+        line (bytes): Encoded line.
+        frame_data_dict (dict, optional): Frame dictionary of the previous line, patched in place.
+            Ignored for keyframe lines.
+
+    Returns:
+        Tuple[dict, str]: Frame dictionary and action.
+    """
+    record = json.loads(line)
+    if "key" in record:
+        return record["key"], record["action"]
+    if frame_data_dict is None:
+        raise ValueError("delta record without preceding keyframe")
+    return patch_dict(frame_data_dict, record["delta"]), record["action"]
+
+
+def read_records(file_path: str) -> Iterator[Tuple[FrameData, str]]:
+    """
+    Read the frames and actions of a recording file.
+
+    Args:
+        file_path (str): Path of a `.jsonl`, `.bin` or `.delta` recording file.
+
+    Yields:
+        Tuple[FrameData, str]: Frame data and action.
+    """
+    if file_path.endswith("." + DELTA):
+        frame_data_dict = None
+        with open(file_path, "rb") as f:
+            for line in f:
+                frame_data_dict, action = decode_delta_record(line, frame_data_dict)
+                yield FrameData.from_dict(copy_tree(frame_data_dict)), action
+    elif file_path.endswith("." + BINARY):
+        with open(file_path, "rb") as f:
+            while header := f.read(RECORD_HEADER.size):
+                (size,) = RECORD_HEADER.unpack(header)
+                yield decode_binary_payload(f.read(size))
+    else:
+        with open(file_path, "rb") as f:
+            for line in f:
+                yield decode_jsonl_record(line)
+
+
+class FrameRecorder:
+    """
+    Background recorder for state-action logs.
+
+    `record` only enqueues the frame and action, so its cost on the agent's thread is constant.
+    A writer thread serializes queued frames in batches and writes them to files
+    which are kept open and rotated per game and round.
+    Since frames are serialized later, recorded `FrameData` objects must not be modified afterwards.
+    When the controller refreshes frames in place (`AIController` with `reuse_frame_data`), create the
+    recorder with `reuse_frame_data=True` so that `record` enqueues a copy instead.
+    """
+
+    def __init__(self, save_dir: str, session_id: Optional[str] = None, file_format: str = JSONL,
+                 batch_size: int = 256, max_queue_size: int = 8192, keyframe_interval: int = 60,
+                 reuse_frame_data: bool = False):
+        """
+        Initialize recorder and start the writer thread.
+
+        Args:
+            save_dir (str): Directory of the recording files.
+            session_id (str, optional): Session identifier used as file name prefix. Defaults to current time.
+            file_format (str): One of "jsonl", "bin" or "delta".
+            batch_size (int): Maximum number of records written at once.
+            max_queue_size (int): Maximum number of pending records. Records beyond it are dropped.
+            keyframe_interval (int): Number of frames between two keyframes of the "delta" format.
+            reuse_frame_data (bool): If True, recorded frames are copied when they are enqueued, because the
+                controller overwrites them on the next frame.
+        """
+        if file_format not in (JSONL, BINARY, DELTA):
+            raise ValueError(f"Unknown file format: {file_format}")
+        os.makedirs(save_dir, exist_ok=True)
+        self.save_dir = save_dir
+        self.session_id = session_id or datetime.now().strftime("%m%d_%H%M%S")
+        self.file_format = file_format
+        self.batch_size = batch_size
+        self.reuse_frame_data = reuse_frame_data
+        self.dropped = 0
+        self._delta_encoder = DeltaRecordEncoder(keyframe_interval)
+        self._encode = {JSONL: encode_jsonl_record, BINARY: encode_binary_record, DELTA: self._delta_encoder.encode}[file_format]
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._game = 0
+        self._file_key: Optional[Tuple[int, int]] = None
+        self._file: Optional[IO[bytes]] = None
+        self._thread = threading.Thread(target=self._run, name="FrameRecorder", daemon=True)
+        self._thread.start()
+
+    def get_file_path(self, game: int, round: int) -> str:
+        """
+        Get the recording file path of a game and round.
+
+        Args:
+            game (int): Game index starting from 0.
+            round (int): Round number.
+
+        Returns:
+            str: File path.
+        """
+        return os.path.join(self.save_dir, f"{self.session_id}_g{game:02d}_r{round:02d}.{self.file_format}")
+
+    def record(self, frame_data: FrameData, action: str) -> bool:
+        """
+        Enqueue a frame and the action chosen at this frame.
+        The frame is copied first if the recorder was created with `reuse_frame_data`.
+
+        Args:
+            frame_data (FrameData): Frame data.
+            action (str): Action chosen at this frame.
+
+        Returns:
+            bool: False if the queue was full and the record was dropped.
+        """
+        if self.reuse_frame_data:
+            frame_data = frame_data.copy()
+        try:
+            self._queue.put_nowait((frame_data, action))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def next_game(self):
+        """
+        Rotate to the files of the next game, typically called from `game_end`.
+        """
+        self._queue.put(_NEXT_GAME)
+
+    def flush(self):
+        """
+        Block until all enqueued records are written.
+        """
+        self._queue.join()
+
+    def close(self):
+        """
+        Write all pending records, close the files and stop the writer thread.
+        """
+        if self._thread.is_alive():
+            self._queue.put(_CLOSE)
+            self._thread.join()
+        if self.dropped:
+            logger.warning(f"{self.dropped} records were dropped because the recorder queue was full")
+
+    def _run(self):
+        running = True
+        while running:
+            items = [self._queue.get()]
+            while len(items) < self.batch_size:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            running = not any(item is _CLOSE for item in items)
+            try:
+                self._write_batch(items)
+            except Exception:
+                logger.exception("Failed to write records")
+            finally:
+                for _ in items:
+                    self._queue.task_done()
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def _write_batch(self, items: list):
+        chunks = []
+        for item in items:
+            if item is _CLOSE:
+                break
+            if item is _NEXT_GAME:
+                self._write_chunks(chunks)
+                chunks = []
+                self._game += 1
+                continue
+            frame_data, action = item
+            file_key = (self._game, frame_data.current_round)
+            if file_key != self._file_key:
+                self._write_chunks(chunks)
+                chunks = []
+                self._open(file_key)
+            chunks.append(self._encode(frame_data, action))
+        self._write_chunks(chunks)
+
+    def _write_chunks(self, chunks: list):
+        if chunks:
+            self._file.write(b"".join(chunks))
+            self._file.flush()
+
+    def _open(self, file_key: Tuple[int, int]):
+        if self._file:
+            self._file.close()
+        self._file_key = file_key
+        self._file = open(self.get_file_path(*file_key), "ab")
+        self._delta_encoder.reset(self._file.tell())
@@ -0,0 +1,119 @@
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Union
+
+from google.protobuf.message import Message
+
+from pyftg.aiinterface.ai_interface import AIInterface
+from pyftg.aiinterface.async_ai_interface import AsyncAIInterface
+from pyftg.models.key import Key
+from pyftg.protoc import service_pb2
+from pyftg.socket.aio.ai_controller import AIController
+from pyftg.utils.capture import read_capture, read_capture_player_number
+from pyftg.utils.decision_interval import DecisionInterval
+from pyftg.utils.resource_loader import load_ai
+
+
+@dataclass
+class ReplayResult:
+    """
+    ReplayResult: Result of replaying a capture file through an AI.
+    """
+
+    file_path: str
+    """
+    file_path (str): Path of the replayed capture file.
+    """
+    frames: int = 0
+    """
+    frames (int): Number of processed frames.
+    """
+    processing_time: float = 0.0
+    """
+    processing_time (float): Total time spent in `processing`, in seconds.
+    """
+    max_processing_time: float = 0.0
+    """
+    max_processing_time (float): Longest single `processing` call, in seconds.
+    """
+    inputs: List[Key] = field(default_factory=list)
+    """
+    inputs (List[Key]): Input keys returned by the AI for every processed frame.
+    """
+
+
+def replay_capture(file_path: str, ai: AIInterface, player_number: Optional[bool] = None,
+                   decision_interval: Optional[DecisionInterval] = None) -> ReplayResult:
+    """
+    Drive an AI from a capture file as fast as possible, without a game server.
+
+    Args:
+        file_path (str): Path of the capture file.
+        ai (AIInterface): AI to drive.
+        player_number (bool, optional): Player number given to the AI. Defaults to the one stored in the capture.
+        decision_interval (DecisionInterval, optional): Action-repeat mode of the controller.
+
+    Returns:
+        ReplayResult: Processing statistics and produced input keys.
+    """
+    if player_number is None:
+        player_number = read_capture_player_number(file_path)
+        if player_number is None:
+            raise ValueError("player_number must be given to replay a spectator capture.")
+
+    controller = AIController(None, None, ai, player_number, decision_interval=decision_interval)
+    result = ReplayResult(file_path)
+    loop = asyncio.new_event_loop()
+    for captured in read_capture(file_path):
+        state: Message = service_pb2.PlayerGameState()
+        state.ParseFromString(captured.packet)
+        key = controller.skip_processing(state)
+        if key is not None:
+            result.frames += 1
+            result.inputs.append(key.copy())
+            continue
+        process = controller.handle_state(state)
+        if controller.pending_callbacks:
+            loop.run_until_complete(controller.run_pending_callbacks())
+        if process:
+            start = time.perf_counter()
+            if isinstance(ai, AsyncAIInterface):
+                loop.run_until_complete(ai.processing())
+            else:
+                ai.processing()
+            elapsed = time.perf_counter() - start
+            result.frames += 1
+            result.processing_time += elapsed
+            result.max_processing_time = max(result.max_processing_time, elapsed)
+            controller.last_key = ai.input().copy()
+            result.inputs.append(controller.last_key.copy())
+    controller.add_callback(ai.close())
+    loop.run_until_complete(controller.run_pending_callbacks())
+    loop.close()
+    return result
+
+
+def _replay_worker(file_path: str, ai_factory: Union[str, Callable[[], AIInterface]], player_number: Optional[bool]) -> ReplayResult:
+    ai = load_ai(ai_factory) if isinstance(ai_factory, str) else ai_factory()
+    return replay_capture(file_path, ai, player_number)
+
+
+def replay_captures(file_paths: List[str], ai_factory: Union[str, Callable[[], AIInterface]],
+                    player_number: Optional[bool] = None, max_workers: Optional[int] = None) -> List[ReplayResult]:
+    """
+    Replay many capture files in parallel worker processes, with a fresh AI per capture.
+
+    Args:
+        file_paths (List[str]): Paths of the capture files.
+        ai_factory (Union[str, Callable[[], AIInterface]]): AI name accepted by `load_ai`, or a picklable callable creating the AI.
+        player_number (bool, optional): Player number given to the AI. Defaults to the one stored in each capture.
+        max_workers (int, optional): Number of worker processes. Defaults to the number of CPUs.
+
+    Returns:
+        List[ReplayResult]: Replay results in the order of `file_paths`.
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_replay_worker, file_path, ai_factory, player_number) for file_path in file_paths]
+        return [future.result() for future in futures]
@@ -0,0 +1,242 @@
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+from pyftg.models.frame_data import FrameData
+from pyftg.models.key import Key
+from pyftg.utils.forward_model import ActionSpec, ForwardModel, RolloutState
+from pyftg.utils.hitbox import BOTTOM, LEFT, RIGHT, TOP
+
+FRAME_DELAY = 15
+
+_DISCRETE_FIELDS = ("remaining_frame", "front", "hp", "attack_frame")
+_CONTINUOUS_FIELDS = ("x", "y", "speed_x", "speed_y")
+
+
+@dataclass
+class DirectionalKeyModel:
+    """
+    DirectionalKeyModel: Rough mapping of sent direction keys to the motion they start.
+    Buttons are ignored since the motion of an attack depends on the character's state.
+    """
+
+    walk: ActionSpec = field(default_factory=lambda: ActionSpec(speed_x=4, frames=1))
+    """
+    walk (ActionSpec): Motion started by the direction key toward the facing direction.
+    """
+    back: ActionSpec = field(default_factory=lambda: ActionSpec(speed_x=-4, frames=1))
+    """
+    back (ActionSpec): Motion started by the direction key away from the facing direction.
+    """
+    jump: ActionSpec = field(default_factory=lambda: ActionSpec(speed_y=-19, frames=1))
+    """
+    jump (ActionSpec): Motion started by the up key.
+    """
+
+    def __call__(self, key: Key, front: bool) -> Optional[ActionSpec]:
+        if key.U:
+            return self.jump
+        if key.R != key.L:
+            return self.walk if key.R == front else self.back
+        return None
+
+
+class StateEstimator:
+    """
+    Estimator of the present frame from delayed frames, the keys sent by the agent and,
+    when given, non-delay frames.
+
+    The newest known frame is rolled forward to the present frame with the `ForwardModel`,
+    starting the motion of every key the agent sent in between. The predicted trajectory is kept,
+    so that when the next delayed frame agrees with its prediction only one new frame is simulated;
+    the whole trajectory is recomputed only when the prediction was wrong. A non-delay frame
+    replaces the estimate of its frame, and delayed frames older than it are then only used to
+    advance the present frame.
+
+    Call `update` from `get_information`, `correct` from `get_non_delay_frame_data` and
+    `record_key` with the key returned by `input`.
+    """
+
+    def __init__(self, player: bool, delay: int = FRAME_DELAY,
+                 key_model: Optional[Callable[[Key, bool], Optional[ActionSpec]]] = None,
+                 model: Optional[ForwardModel] = None, tolerance: float = 2.0, history: int = 60):
+        """
+        Initialize estimator.
+
+        Args:
+            player (bool): Player of the agent sending the keys.
+            delay (int): Number of frames the frames given to `get_information` are behind.
+            key_model (Callable[[Key, bool], Optional[ActionSpec]], optional): Motion started by a sent key
+                given the facing direction, or None for no new motion. Defaults to `DirectionalKeyModel()`.
+            model (ForwardModel, optional): Forward model. Defaults to `ForwardModel()`.
+            tolerance (float): Largest position and speed error of a prediction that still counts as agreeing.
+            history (int): Number of sent keys kept.
+        """
+        self.player = player
+        self.delay = delay
+        self.key_model = key_model or DirectionalKeyModel()
+        self.model = model or ForwardModel()
+        self.tolerance = tolerance
+        self.history = history
+        self.present = -1
+        self.reused = 0
+        self.recomputed = 0
+        self.corrections = 0
+        self.correction_error = 0.0
+        self._index = 0 if player else 1
+        self._round = -1
+        self._anchor = -1
+        self._base: Optional[FrameData] = None
+        self._trajectory: Dict[int, RolloutState] = {}
+        self._keys: Dict[int, Key] = {}
+        self._estimate: Optional[FrameData] = None
+
+    def reset(self):
+        """
+        Forget all frames and keys, typically at the end of a round.
+        """
+        self.present = -1
+        self._round = -1
+        self._anchor = -1
+        self._base = None
+        self._trajectory = {}
+        self._keys = {}
+        self._estimate = None
+
+    def update(self, frame_data: FrameData):
+        """
+        Add a delayed frame.
+
+        Args:
+            frame_data (FrameData): Frame given to `get_information`.
+        """
+        if not self._accept(frame_data):
+            return
+        frame_number = frame_data.current_frame_number
+        self.present = max(self.present, frame_number + self.delay)
+        if frame_number > self._anchor:
+            if self._reanchor(frame_data):
+                self.reused += 1
+            else:
+                self.recomputed += 1
+        self._extend()
+
+    def correct(self, frame_data: FrameData):
+        """
+        Add a non-delay frame, which replaces the estimate of its frame.
+
+        Args:
+            frame_data (FrameData): Frame given to `get_non_delay_frame_data`.
+        """
+        if not self._accept(frame_data):
+            return
+        frame_number = frame_data.current_frame_number
+        self.present = max(self.present, frame_number)
+        if frame_number > self._anchor:
+            predicted = self._trajectory.get(frame_number)
+            character = frame_data.get_character(self.player)
+            if predicted is not None:
+                error = abs(predicted.x[0, self._index] - character.x) + abs(predicted.y[0, self._index] - character.y)
+                self.correction_error += (float(error) - self.correction_error) / (self.corrections + 1)
+                self.corrections += 1
+            self._reanchor(frame_data)
+        self._extend()
+
+    def record_key(self, key: Key, frame_number: Optional[int] = None):
+        """
+        Record the key sent by the agent.
+
+        Args:
+            key (Key): Sent key.
+            frame_number (int, optional): Frame the key was sent at. Defaults to the present frame.
+        """
+        frame_number = self.present if frame_number is None else frame_number
+        self._keys[frame_number] = Key(key.A, key.B, key.C, key.U, key.R, key.D, key.L)
+        if len(self._keys) > self.history:
+            del self._keys[min(self._keys)]
+
+    def estimate(self) -> Optional[FrameData]:
+        """
+        Get the estimated present frame. Positions, speeds, facing, hit boxes, hp and remaining frames
+        of the characters are estimated; the other fields are those of the newest known frame.
+
+        Returns:
+            Optional[FrameData]: Estimated frame, or None before any frame. Must not be modified.
+        """
+        if self._base is None:
+            return None
+        if self._estimate is not None and self._estimate.current_frame_number == self.present:
+            return self._estimate
+        state = self._trajectory[self.present]
+        boxes = state.hurtboxes()
+        frame_data = self._base.copy()
+        frame_data.current_frame_number = self.present
+        for i, character in enumerate(frame_data.character_data[:2]):
+            character.x = int(state.x[0, i])
+            character.y = int(state.y[0, i])
+            character.speed_x = int(state.speed_x[0, i])
+            character.speed_y = int(state.speed_y[0, i])
+            character.front = bool(state.front[0, i])
+            character.hp = int(state.hp[0, i])
+            character.remaining_frame = int(state.remaining_frame[0, i])
+            character.left, character.right = int(boxes[0, i, LEFT]), int(boxes[0, i, RIGHT])
+            character.top, character.bottom = int(boxes[0, i, TOP]), int(boxes[0, i, BOTTOM])
+        frame_data.front = [bool(state.front[0, 0]), bool(state.front[0, 1])]
+        self._estimate = frame_data
+        return frame_data
+
+    def stats(self) -> dict:
+        """
+        Get estimator statistics.
+
+        Returns:
+            dict: Numbers of delayed frames whose prediction was reused or recomputed, number of corrections
+                by non-delay frames, and the mean position error of the agent's character they corrected.
+        """
+        return {"reused": self.reused, "recomputed": self.recomputed,
+                "corrections": self.corrections, "correction_error": self.correction_error}
+
+    def _accept(self, frame_data: FrameData) -> bool:
+        if frame_data.empty_flag or frame_data.current_frame_number < 0:
+            return False
+        if len(frame_data.character_data) < 2 or any(c is None for c in frame_data.character_data[:2]):
+            return False
+        if frame_data.current_round != self._round:
+            self.reset()
+            self._round = frame_data.current_round
+        return True
+
+    def _reanchor(self, frame_data: FrameData) -> bool:
+        frame_number = frame_data.current_frame_number
+        actual = RolloutState.from_frames([frame_data])
+        predicted = self._trajectory.get(frame_number)
+        agrees = predicted is not None and self._agrees(predicted, actual)
+        if agrees:
+            self._trajectory = {t: s for t, s in self._trajectory.items() if t >= frame_number}
+        else:
+            self._trajectory = {frame_number: actual}
+        self._anchor = frame_number
+        self._base = frame_data
+        self._estimate = None
+        return agrees
+
+    def _agrees(self, predicted: RolloutState, actual: RolloutState) -> bool:
+        for name in _DISCRETE_FIELDS:
+            if not np.array_equal(getattr(predicted, name), getattr(actual, name)):
+                return False
+        return all(np.abs(getattr(predicted, name) - getattr(actual, name)).max() <= self.tolerance
+                   for name in _CONTINUOUS_FIELDS)
+
+    def _extend(self):
+        frame_number = max(self._trajectory)
+        state = self._trajectory[frame_number]
+        while frame_number < self.present:
+            state = state.copy()
+            key = self._keys.get(frame_number)
+            spec = self.key_model(key, bool(state.front[0, self._index])) if key is not None else None
+            if spec is not None:
+                self.model.apply_actions(state, self._index, np.zeros(1, dtype=np.int64), [spec])
+            self.model.step(state)
+            frame_number += 1
+            self._trajectory[frame_number] = state
@@ -2,7 +2,8 @@ import numpy as np
 from glob import glob
 import json
 
-from visualize_state_action_records import filter_frame_data
+from pyftg.models.character_data import CharacterData
+from pyftg.models.frame_data import FrameData
 
 def flatten_dict_to_vector_with_keys(d, parent_key=""):
     """
@@ -44,6 +45,140 @@ def flatten_dict_to_vector_with_keys(d, parent_key=""):
 
     return vector, keys
 
+
+def infer_schema(d, parent_path=()):
+    """
+    한 프레임 dict에서 숫자/불린/None 값의 경로 목록(스키마)을 추출합니다. 문자열 값은 제외합니다.
+
+    Returns:
+        list of tuple: 각 값까지의 경로 (dict key 또는 list index)
+    """
+    paths = []
+    if isinstance(d, dict):
+        for k, v in d.items():
+            paths.extend(infer_schema(v, parent_path + (k,)))
+    elif isinstance(d, list):
+        for idx, item in enumerate(d):
+            paths.extend(infer_schema(item, parent_path + (idx,)))
+    elif not isinstance(d, str):
+        paths.append(parent_path)
+    return paths
+
+
+def schema_from_dataclass(model_cls=FrameData):
+    """
+    모델 dataclass의 to_dict() 구조에서 스키마를 만듭니다.
+    FrameData는 캐릭터 2명 기준이며, 개수가 바뀌는 projectile_data는 포함되지 않습니다.
+    """
+    if model_cls is FrameData:
+        instance = FrameData(character_data=[CharacterData(), CharacterData()])
+    else:
+        instance = model_cls()
+    return infer_schema(instance.to_dict())
+
+
+def fixed_schema(frame=None):
+    """
+    schema_from_dataclass()의 고정 길이 경로 중 주어진 프레임 dict에 실제로 있는 경로만 남깁니다.
+    projectile_data처럼 프레임마다 개수가 바뀌는 리스트는 포함되지 않으므로, 첫 프레임과 개수가 다른 프레임도 NaN 행이 되지 않습니다.
+    """
+    schema = schema_from_dataclass()
+    if frame is None:
+        return schema
+    present = set(infer_schema(frame))
+    return [path for path in schema if path in present]
+
+
+def path_to_key(path):
+    """
+    경로를 flatten_dict_to_vector_with_keys와 같은 key 문자열로 바꿉니다. (예: character_data[0].hp)
+    """
+    key = ""
+    for p in path:
+        if isinstance(p, int):
+            key += f"[{p}]"
+        else:
+            key = f"{key}.{p}" if key else p
+    return key
+
+
+def compile_flattener(schema):
+    """
+    스키마에 맞춰 특화된 추출 함수를 한 번만 생성합니다.
+    공통 상위 경로는 지역 변수로 한 번만 접근합니다.
+
+    Returns:
+        flatten (Callable[[dict], tuple]): 프레임 dict -> 값 tuple
+        keys (list of str): 값 순서에 대응하는 key 목록
+    """
+    var_names = {(): "d"}
+    lines = []
+
+    def container(path):
+        if path not in var_names:
+            parent = container(path[:-1])
+            var_names[path] = f"v{len(var_names)}"
+            lines.append(f"    {var_names[path]} = {parent}[{path[-1]!r}]")
+        return var_names[path]
+
+    values = [f"{container(path[:-1])}[{path[-1]!r}]" for path in schema]
+    source = "def flatten(d):\n" + "\n".join(lines) + "\n    return (" + ", ".join(values) + ",)\n"
+    namespace = {}
+    exec(compile(source, "<compiled_flattener>", "exec"), namespace)
+    return namespace["flatten"], [path_to_key(path) for path in schema]
+
+
+def flatten_frames(frames, flatten, num_keys):
+    """
+    컴파일된 추출 함수로 프레임 dict들을 (N, D) 배열로 변환합니다.
+    스키마에 맞지 않는 프레임은 NaN 행으로 채우고 errors에 기록합니다.
+
+    Returns:
+        array (np.ndarray): (N, D) float32
+        errors (list of tuple): (프레임 번호, 오류 메시지)
+    """
+    rows = []
+    errors = []
+    nan_row = (float("nan"),) * num_keys
+    for i, frame_data in enumerate(frames):
+        try:
+            rows.append(flatten(frame_data))
+        except (KeyError, IndexError, TypeError) as e:
+            errors.append((i, f"{type(e).__name__}: {e}"))
+            rows.append(nan_row)
+
+    try:
+        array = np.array(rows, dtype=np.float32).reshape(len(rows), num_keys)
+    except (TypeError, ValueError):
+        # 숫자로 바꿀 수 없는 값이 있는 행만 찾아서 보고
+        array = np.full((len(rows), num_keys), np.nan, dtype=np.float32)
+        for i, row in enumerate(rows):
+            try:
+                array[i] = np.array(row, dtype=np.float32)
+            except (TypeError, ValueError) as e:
+                errors.append((i, f"{type(e).__name__}: {e}"))
+    return array, errors
+
+
+def flatten_file(file_path, schema=None):
+    """
+    JSONL 파일 전체를 (N, D) 배열로 변환합니다.
+    스키마를 주지 않으면 첫 번째 프레임 기준의 fixed_schema()를 사용합니다.
+
+    Returns:
+        array (np.ndarray): (N, D) float32
+        keys (list of str): 컬럼 key 목록
+        errors (list of tuple): (줄 번호, 오류 메시지)
+    """
+    with open(file_path, "r") as f:
+        frames = [json.loads(line) for line in f]
+    if schema is None:
+        schema = fixed_schema(frames[0] if frames else None)
+    flatten, keys = compile_flattener(schema)
+    array, errors = flatten_frames(frames, flatten, len(keys))
+    return array, keys, errors
+
+
 if __name__ == "__main__":
 
     state_action_records_path = "../state_action_records/*.jsonl"
@@ -54,16 +189,9 @@ if __name__ == "__main__":
     # 첫 번째 파일 선택
     file_path = state_action_records[2]
 
-    with open(file_path, "r") as f:
-
-        for line in f:
-            frame_data = json.loads(line)
-
-            frame_data = filter_frame_data(frame_data)
-
-            vec, var_names = flatten_dict_to_vector_with_keys(frame_data)
-            print(len(vec), len(var_names))
-            # print(vec)
-            # print(var_names)
-
-            # break
+    # 예전처럼 filter_frame_data를 적용하면 유효하지 않은 공격이 빠져 프레임마다 벡터 길이가 달라지므로,
+    # 고정 스키마로 원본 프레임 전체를 변환합니다.
+    array, var_names, errors = flatten_file(file_path)
+    print(array.shape, len(var_names))
+    for line_no, message in errors:
+        print(f"Line {line_no}: {message}")
@@ -1,5 +1,9 @@
 from glob import glob
 import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import matplotlib
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 import math
@@ -333,6 +337,240 @@ def visualize_frame(frame_data, ax):
     ax.grid(True)
 
 
+MAX_ATTACKS_PER_CHARACTER = 4  # attack_data 1개 + projectile_attack 3개
+
+
+class FrameRenderer:
+    """
+    visualize_frame과 같은 그림을 그리지만, artist를 한 번만 만들고
+    매 프레임 위치/텍스트만 갱신합니다.
+    animated=True이면 blitting으로 바뀐 artist만 다시 그립니다.
+    """
+
+    def __init__(self, ax, animated: bool = False):
+        self.ax = ax
+        self.animated = animated
+        self.background = None
+
+        ax.set_xlim(0, 960)
+        ax.set_ylim(0, 720)
+        ax.set_xlabel("X")
+        ax.set_ylabel("Y")
+        ax.invert_yaxis()
+        ax.grid(True)
+
+        self.title = ax.text(0.01, 0.99, "", transform=ax.transAxes, va='top', fontsize=10)
+        self.characters = [self._create_character_artists(player) for player in (True, False)]
+        self.artists = [self.title]
+        for char_artists in self.characters:
+            self.artists.extend(a for k, a in char_artists.items() if k != 'attacks')
+            for atk_artists in char_artists['attacks']:
+                self.artists.extend(atk_artists.values())
+        for artist in self.artists:
+            artist.set_animated(animated)
+
+        if animated:
+            ax.figure.canvas.mpl_connect('draw_event', self._on_draw)
+
+    def _create_character_artists(self, player_number):
+        ax = self.ax
+        artists = {
+            'rect': ax.add_patch(patches.Rectangle(
+                (0, 0), 0, 0, linewidth=2,
+                edgecolor='blue' if player_number else 'red', facecolor='none'
+            )),
+            'front': ax.arrow(0, 0, 0, 0, head_width=8, head_length=8, fc='green', ec='green'),
+            'speed': ax.arrow(0, 0, 0, 0, head_width=8, head_length=8, fc='orange', ec='orange'),
+            'speed_text': ax.text(0, 0, "", color='orange', fontsize=8, ha='center',
+                                  bbox=dict(facecolor='white', alpha=0.8, edgecolor='none', pad=3)),
+            'hp': ax.text(0, 0, "", color='red', fontsize=10, ha='center'),
+            'en': ax.text(0, 0, "", color='blue', fontsize=10, ha='center'),
+            'action': ax.text(0, 0, "", color='black', fontsize=10, ha='center'),
+        }
+        artists['attacks'] = []
+        for _ in range(MAX_ATTACKS_PER_CHARACTER):
+            artists['attacks'].append({
+                'rect': ax.add_patch(patches.Rectangle(
+                    (0, 0), 0, 0, linewidth=1, edgecolor='none', facecolor='none', linestyle='--'
+                )),
+                'corners': ax.plot([], [], 'o', markersize=3)[0],
+                'text': ax.text(0, 0, "", fontsize=8),
+            })
+        return artists
+
+    def _on_draw(self, event):
+        self.background = self.ax.figure.canvas.copy_from_bbox(self.ax.bbox)
+
+    def update(self, frame_data):
+        """
+        한 프레임 데이터로 artist들을 갱신합니다.
+
+        Args:
+            frame_data (dict): 한 프레임의 상태 액션 데이터
+        """
+        self.title.set_text(f"Frame {frame_data.get('current_frame_number', '?')} - Round {frame_data.get('current_round', '?')}")
+
+        characters = filter_frame_data(frame_data)['character_data']
+        for i, artists in enumerate(self.characters):
+            char = characters[i] if i < len(characters) else None
+            self._update_character(artists, char)
+
+    def _update_character(self, artists, char):
+        if char is None:
+            for k, artist in artists.items():
+                if k != 'attacks':
+                    artist.set_visible(False)
+            for atk_artists in artists['attacks']:
+                for artist in atk_artists.values():
+                    artist.set_visible(False)
+            return
+
+        x, y = char['x'], char['y']
+        left, right, top, bottom = char['left'], char['right'], char['top'], char['bottom']
+        speed_x, speed_y = char.get('speed_x', 0), char.get('speed_y', 0)
+
+        artists['rect'].set_bounds(left, top, right - left, bottom - top)
+        artists['front'].set_data(x=x, y=y + 10, dx=10 if char['front'] else -10, dy=0)
+
+        scale = 3  # 속도 스케일링
+        artists['speed'].set_visible(speed_x != 0 or speed_y != 0)
+        artists['speed'].set_data(x=x, y=y, dx=speed_x * scale, dy=speed_y * scale)
+
+        speed_mag = math.sqrt(speed_x**2 + speed_y**2)
+        artists['speed_text'].set_position((x, y - 15))
+        artists['speed_text'].set_text(f"({speed_x:.1f},{speed_y:.1f})\n|v|={speed_mag:.2f}")
+
+        artists['hp'].set_position((x, top - 15))
+        artists['hp'].set_text(f"HP:{char['hp']}")
+        artists['en'].set_position((x, top - 30))
+        artists['en'].set_text(f"EN:{char['energy']}")
+        artists['action'].set_position((x, bottom + 15))
+        artists['action'].set_text(f"Action:{char.get('action', '?')}")
+        for k in ('rect', 'front', 'speed_text', 'hp', 'en', 'action'):
+            artists[k].set_visible(True)
+
+        attack_list = [atk for atk in [char.get('attack_data')] + char.get('projectile_attack', [])
+                       if atk is not None and is_valid_attack(atk)]
+        for i, atk_artists in enumerate(artists['attacks']):
+            atk = attack_list[i] if i < len(attack_list) else None
+            if atk is None:
+                for artist in atk_artists.values():
+                    artist.set_visible(False)
+                continue
+
+            hit_area = atk['current_hit_area']
+            abs_left, abs_right = hit_area['left'], hit_area['right']
+            abs_top, abs_bottom = hit_area['top'], hit_area['bottom']
+            color = 'orange' if atk.get('player_number') else 'magenta'
+
+            atk_artists['rect'].set_bounds(abs_left, abs_top, abs_right - abs_left, abs_bottom - abs_top)
+            atk_artists['rect'].set_edgecolor(color)
+            atk_artists['corners'].set_data([abs_left, abs_right, abs_right, abs_left],
+                                            [abs_top, abs_top, abs_bottom, abs_bottom])
+            atk_artists['corners'].set_color(color)
+            atk_artists['rect'].set_visible(True)
+            atk_artists['corners'].set_visible(True)
+
+            rem_frame = atk.get('remaining_frame', atk.get('current_frame', '?'))
+            if rem_frame < 0:
+                atk_artists['text'].set_visible(False)
+                continue
+            atk_artists['text'].set_position((abs_left, abs_top - 5))
+            atk_artists['text'].set_color(color)
+            atk_artists['text'].set_text(
+                f"RF:{rem_frame} Hit:{atk.get('hit_confirm', False)} Act:{atk.get('active', 0)}\n"
+                f"HD:{atk.get('hit_damage', 0)} GD:{atk.get('guard_damage', 0)} SU:{atk.get('start_up', 0)}"
+            )
+            atk_artists['text'].set_visible(True)
+
+    def blit(self):
+        """
+        저장해 둔 배경 위에 artist만 다시 그립니다. (animated=True 전용)
+        """
+        canvas = self.ax.figure.canvas
+        if self.background is None:
+            canvas.draw()
+        canvas.restore_region(self.background)
+        for artist in self.artists:
+            if artist.get_visible():
+                self.ax.draw_artist(artist)
+        canvas.blit(self.ax.bbox)
+        canvas.flush_events()
+
+    def play(self, frames, fps: float = 60.0):
+        """
+        프레임들을 blitting으로 재생합니다. fps=None이면 최대 속도로 재생합니다.
+
+        Args:
+            frames (Iterable[dict]): 프레임 데이터
+            fps (float): 재생 속도
+        """
+        plt.show(block=False)
+        interval = 1.0 / fps if fps else 0.0
+        next_time = time.perf_counter()
+        for frame_data in frames:
+            self.update(frame_data)
+            self.blit()
+            next_time += interval
+            delay = next_time - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+
+def read_frames(file_path: str, start: int = 0, stop: int = None):
+    """
+    JSONL 파일에서 [start, stop) 범위의 줄만 읽어 프레임 dict로 반환합니다.
+    """
+    with open(file_path, "r") as f:
+        for i, line in enumerate(f):
+            if stop is not None and i >= stop:
+                break
+            if i >= start:
+                yield json.loads(line)
+
+
+def _render_range_to_files(file_path: str, out_dir: str, start: int, stop: int, figsize, dpi) -> int:
+    matplotlib.use("Agg")
+    fig, ax = plt.subplots(figsize=figsize)
+    renderer = FrameRenderer(ax)
+    count = 0
+    for i, frame_data in enumerate(read_frames(file_path, start, stop), start=start):
+        renderer.update(frame_data)
+        fig.savefig(os.path.join(out_dir, f"frame_{i:05d}.png"), dpi=dpi)
+        count += 1
+    plt.close(fig)
+    return count
+
+
+def render_to_files(file_path: str, out_dir: str, start: int = 0, stop: int = None,
+                    workers: int = None, chunk_size: int = 200, figsize=(12, 8), dpi: int = 80) -> int:
+    """
+    화면 없이 프레임 범위를 이미지 파일로 저장합니다. 범위를 chunk_size 단위로 나눠 여러 프로세스에서 렌더링합니다.
+
+    Args:
+        file_path (str): JSONL 파일 경로
+        out_dir (str): 이미지 저장 디렉터리 (frame_00000.png 형식)
+        start (int): 시작 줄 번호
+        stop (int): 끝 줄 번호 (포함하지 않음). None이면 파일 끝까지
+        workers (int): 프로세스 수
+        chunk_size (int): 프로세스 하나가 맡는 프레임 수
+
+    Returns:
+        int: 저장된 이미지 수
+    """
+    if stop is None:
+        with open(file_path, "r") as f:
+            stop = sum(1 for _ in f)
+    os.makedirs(out_dir, exist_ok=True)
+
+    chunk_starts = list(range(start, stop, chunk_size))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_render_range_to_files, file_path, out_dir, s, min(s + chunk_size, stop), figsize, dpi)
+                   for s in chunk_starts]
+        return sum(future.result() for future in futures)
+
+
+
 if __name__ == "__main__":
 
     state_action_records_path = "../state_action_records/*.jsonl"
@@ -346,15 +584,8 @@ if __name__ == "__main__":
     # debug_attack_projectile_lengths(file_path)
     # debug_attack_bboxes(file_path)
 
-    # JSONL 한 줄씩 읽기
-    with open(file_path, "r") as f:
-
-        fig, ax = plt.subplots(figsize=(12, 8))
-
-        for line in f:
-            frame_data = json.loads(line)
-            
-            ax.cla()
-            visualize_frame(frame_data, ax)
-            plt.pause(0.1)
-            # plt.pause(1.0)
\ No newline at end of file
+    # JSONL 한 줄씩 읽어 blitting으로 재생
+    # render_to_files(file_path, "../state_action_frames")  # 화면 없이 이미지로 저장
+    fig, ax = plt.subplots(figsize=(12, 8))
+    renderer = FrameRenderer(ax, animated=True)
+    renderer.play(read_frames(file_path), fps=60)
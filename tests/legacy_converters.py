@@ -0,0 +1,404 @@
+"""
+The hand-written model converters replaced by `generate_converters`, transcribed unchanged as functions.
+They are the reference the generated converters are checked and benchmarked against.
+"""
+from pyftg.models.attack_data import AttackData
+from pyftg.models.audio_data import AudioData
+from pyftg.models.character_data import CharacterData
+from pyftg.models.enums.action import Action
+from pyftg.models.enums.state import State
+from pyftg.models.fft_data import FFTData
+from pyftg.models.frame_data import FrameData
+from pyftg.models.game_data import GameData
+from pyftg.models.hit_area import HitArea
+from pyftg.models.key import Key
+from pyftg.models.round_result import RoundResult
+
+
+def hit_area_to_dict(self: HitArea) -> dict:
+    return {
+        "left": self.left,
+        "right": self.right,
+        "top": self.top,
+        "bottom": self.bottom
+    }
+
+
+def hit_area_from_dict(data_obj: dict) -> HitArea:
+    return HitArea(
+        left=data_obj["left"],
+        right=data_obj["right"],
+        top=data_obj["top"],
+        bottom=data_obj["bottom"]
+    )
+
+
+def hit_area_from_proto(proto_obj) -> HitArea:
+    return HitArea(
+        left=proto_obj.left,
+        right=proto_obj.right,
+        top=proto_obj.top,
+        bottom=proto_obj.bottom
+    )
+
+
+def attack_data_to_dict(self: AttackData) -> dict:
+    return {
+        "setting_hit_area": hit_area_to_dict(self.setting_hit_area),
+        "setting_speed_x": self.setting_speed_x,
+        "setting_speed_y": self.setting_speed_y,
+        "current_hit_area": hit_area_to_dict(self.current_hit_area),
+        "current_frame": self.current_frame,
+        "player_number": self.player_number,
+        "speed_x": self.speed_x,
+        "speed_y": self.speed_y,
+        "start_up": self.start_up,
+        "active": self.active,
+        "hit_damage": self.hit_damage,
+        "guard_damage": self.guard_damage,
+        "start_add_energy": self.start_add_energy,
+        "hit_add_energy": self.hit_add_energy,
+        "guard_add_energy": self.guard_add_energy,
+        "give_energy": self.give_energy,
+        "impact_x": self.impact_x,
+        "impact_y": self.impact_y,
+        "give_guard_recov": self.give_guard_recov,
+        "attack_type": self.attack_type,
+        "down_prop": self.down_prop,
+        "is_projectile": self.is_projectile,
+        "is_live": self.is_live,
+        "empty_flag": self.empty_flag,
+        "identifier": self.identifier
+    }
+
+
+def attack_data_from_dict(data_obj: dict) -> AttackData:
+    return AttackData(
+        setting_hit_area=hit_area_from_dict(data_obj["setting_hit_area"]),
+        setting_speed_x=data_obj["setting_speed_x"],
+        setting_speed_y=data_obj["setting_speed_y"],
+        current_hit_area=hit_area_from_dict(data_obj["current_hit_area"]),
+        current_frame=data_obj["current_frame"],
+        player_number=data_obj["player_number"],
+        speed_x=data_obj["speed_x"],
+        speed_y=data_obj["speed_y"],
+        start_up=data_obj["start_up"],
+        active=data_obj["active"],
+        hit_damage=data_obj["hit_damage"],
+        guard_damage=data_obj["guard_damage"],
+        start_add_energy=data_obj["start_add_energy"],
+        hit_add_energy=data_obj["hit_add_energy"],
+        guard_add_energy=data_obj["guard_add_energy"],
+        give_energy=data_obj["give_energy"],
+        impact_x=data_obj["impact_x"],
+        impact_y=data_obj["impact_y"],
+        give_guard_recov=data_obj["give_guard_recov"],
+        attack_type=data_obj["attack_type"],
+        down_prop=data_obj["down_prop"],
+        is_projectile=data_obj["is_projectile"],
+        is_live=data_obj["is_live"],
+        empty_flag=data_obj["empty_flag"],
+        identifier=data_obj["identifier"]
+    )
+
+
+def attack_data_from_proto(proto_obj) -> AttackData:
+    return AttackData(
+        setting_hit_area=hit_area_from_proto(proto_obj.setting_hit_area),
+        setting_speed_x=proto_obj.setting_speed_x,
+        setting_speed_y=proto_obj.setting_speed_y,
+        current_hit_area=hit_area_from_proto(proto_obj.current_hit_area),
+        current_frame=proto_obj.current_frame,
+        player_number=proto_obj.player_number,
+        speed_x=proto_obj.speed_x,
+        speed_y=proto_obj.speed_y,
+        start_up=proto_obj.start_up,
+        active=proto_obj.active,
+        hit_damage=proto_obj.hit_damage,
+        guard_damage=proto_obj.guard_damage,
+        start_add_energy=proto_obj.start_add_energy,
+        hit_add_energy=proto_obj.hit_add_energy,
+        guard_add_energy=proto_obj.guard_add_energy,
+        give_energy=proto_obj.give_energy,
+        impact_x=proto_obj.impact_x,
+        impact_y=proto_obj.impact_y,
+        give_guard_recov=proto_obj.give_guard_recov,
+        attack_type=proto_obj.attack_type,
+        down_prop=proto_obj.down_prop,
+        is_projectile=proto_obj.is_projectile,
+        is_live=proto_obj.is_live,
+        empty_flag=proto_obj.empty_flag,
+        identifier=proto_obj.identifier
+    )
+
+
+def character_data_to_dict(self: CharacterData) -> dict:
+    return {
+        "player_number": self.player_number,
+        "hp": self.hp,
+        "energy": self.energy,
+        "x": self.x,
+        "y": self.y,
+        "left": self.left,
+        "right": self.right,
+        "top": self.top,
+        "bottom": self.bottom,
+        "speed_x": self.speed_x,
+        "speed_y": self.speed_y,
+        "state": self.state.to_int(),
+        "action": self.action.to_int(),
+        "front": self.front,
+        "control": self.control,
+        "attack_data": attack_data_to_dict(self.attack_data),
+        "remaining_frame": self.remaining_frame,
+        "hit_confirm": self.hit_confirm,
+        "graphic_size_x": self.graphic_size_x,
+        "graphic_size_y": self.graphic_size_y,
+        "graphic_adjust_x": self.graphic_adjust_x,
+        "hit_count": self.hit_count,
+        "last_hit_frame": self.last_hit_frame,
+        "projectile_attack": [attack_data_to_dict(attack) for attack in self.projectile_attack]
+    }
+
+
+def character_data_from_dict(data_obj: dict) -> CharacterData:
+    return CharacterData(
+        player_number=data_obj["player_number"],
+        hp=data_obj["hp"],
+        energy=data_obj["energy"],
+        x=data_obj["x"],
+        y=data_obj["y"],
+        left=data_obj["left"],
+        right=data_obj["right"],
+        top=data_obj["top"],
+        bottom=data_obj["bottom"],
+        speed_x=data_obj["speed_x"],
+        speed_y=data_obj["speed_y"],
+        state=State.from_int(data_obj["state"]),
+        action=Action.from_int(data_obj["action"]),
+        front=data_obj["front"],
+        control=data_obj["control"],
+        attack_data=attack_data_from_dict(data_obj["attack_data"]),
+        remaining_frame=data_obj["remaining_frame"],
+        hit_confirm=data_obj["hit_confirm"],
+        graphic_size_x=data_obj["graphic_size_x"],
+        graphic_size_y=data_obj["graphic_size_y"],
+        graphic_adjust_x=data_obj["graphic_adjust_x"],
+        hit_count=data_obj["hit_count"],
+        last_hit_frame=data_obj["last_hit_frame"],
+        projectile_attack=[attack_data_from_dict(attack) for attack in data_obj["projectile_attack"]]
+    )
+
+
+def character_data_from_proto(proto_obj) -> CharacterData:
+    return CharacterData(
+        player_number=proto_obj.player_number,
+        hp=proto_obj.hp,
+        energy=proto_obj.energy,
+        x=proto_obj.x,
+        y=proto_obj.y,
+        left=proto_obj.left,
+        right=proto_obj.right,
+        top=proto_obj.top,
+        bottom=proto_obj.bottom,
+        speed_x=proto_obj.speed_x,
+        speed_y=proto_obj.speed_y,
+        state=State.from_int(proto_obj.state),
+        action=Action.from_int(proto_obj.action),
+        front=proto_obj.front,
+        control=proto_obj.control,
+        attack_data=attack_data_from_proto(proto_obj.attack_data),
+        remaining_frame=proto_obj.remaining_frame,
+        hit_confirm=proto_obj.hit_confirm,
+        graphic_size_x=proto_obj.graphic_size_x,
+        graphic_size_y=proto_obj.graphic_size_y,
+        graphic_adjust_x=proto_obj.graphic_adjust_x,
+        hit_count=proto_obj.hit_count,
+        last_hit_frame=proto_obj.last_hit_frame,
+        projectile_attack=[attack_data_from_proto(attack) for attack in proto_obj.projectile_attack]
+    )
+
+
+def frame_data_to_dict(self: FrameData) -> dict:
+    return {
+        "character_data": [None if not data else character_data_to_dict(data) for data in self.character_data],
+        "current_frame_number": self.current_frame_number,
+        "current_round": self.current_round,
+        "projectile_data": [attack_data_to_dict(data) for data in self.projectile_data],
+        "empty_flag": self.empty_flag,
+        "front": self.front
+    }
+
+
+def frame_data_from_dict(data_obj: dict) -> FrameData:
+    return FrameData(
+        character_data=[None if not data else character_data_from_dict(data) for data in data_obj["character_data"]],
+        current_frame_number=data_obj["current_frame_number"],
+        current_round=data_obj["current_round"],
+        projectile_data=[attack_data_from_dict(data) for data in data_obj["projectile_data"]],
+        empty_flag=data_obj["empty_flag"],
+        front=data_obj["front"]
+    )
+
+
+def frame_data_from_proto(proto_obj) -> FrameData:
+    character_data = [None, None]
+    if len(proto_obj.character_data) > 0:
+        character_data = [character_data_from_proto(data) for data in proto_obj.character_data]
+
+    return FrameData(
+        character_data=character_data,
+        current_frame_number=proto_obj.current_frame_number,
+        current_round=proto_obj.current_round,
+        projectile_data=list(map(attack_data_from_proto, proto_obj.projectile_data)),
+        empty_flag=proto_obj.empty_flag,
+        front=list(proto_obj.front)
+    )
+
+
+def key_to_dict(self: Key) -> dict:
+    return {
+        "A": self.A,
+        "B": self.B,
+        "C": self.C,
+        "U": self.U,
+        "R": self.R,
+        "D": self.D,
+        "L": self.L
+    }
+
+
+def key_from_dict(data_obj: dict) -> Key:
+    return Key(
+        A=data_obj["A"],
+        B=data_obj["B"],
+        C=data_obj["C"],
+        U=data_obj["U"],
+        R=data_obj["R"],
+        D=data_obj["D"],
+        L=data_obj["L"]
+    )
+
+
+def key_from_proto(proto_obj) -> Key:
+    return Key(
+        A=proto_obj.A,
+        B=proto_obj.B,
+        C=proto_obj.C,
+        U=proto_obj.U,
+        R=proto_obj.R,
+        D=proto_obj.D,
+        L=proto_obj.L
+    )
+
+
+def fft_data_to_dict(self: FFTData) -> dict:
+    return {
+        "real_data_bytes": self.real_data_bytes,
+        "imaginary_data_bytes": self.imaginary_data_bytes
+    }
+
+
+def fft_data_from_dict(data_obj: dict) -> FFTData:
+    return FFTData(
+        real_data_bytes=data_obj["real_data_bytes"],
+        imaginary_data_bytes=data_obj["imaginary_data_bytes"]
+    )
+
+
+def fft_data_from_proto(proto_obj) -> FFTData:
+    return FFTData(
+        real_data_bytes=proto_obj.real_data_as_bytes,
+        imaginary_data_bytes=proto_obj.imaginary_data_as_bytes
+    )
+
+
+def audio_data_to_dict(self: AudioData) -> dict:
+    return {
+        "raw_data_bytes": self.raw_data_bytes,
+        "fft_data": [fft_data_to_dict(data) for data in self.fft_data],
+        "spectrogram_data_bytes": self.spectrogram_data_bytes
+    }
+
+
+def audio_data_from_dict(data_obj: dict) -> AudioData:
+    return AudioData(
+        raw_data_bytes=data_obj["raw_data_bytes"],
+        fft_data=[fft_data_from_dict(data) for data in data_obj["fft_data"]],
+        spectrogram_data_bytes=data_obj["spectrogram_data_bytes"]
+    )
+
+
+def audio_data_from_proto(proto_obj) -> AudioData:
+    return AudioData(
+        raw_data_bytes=proto_obj.raw_data_as_bytes,
+        fft_data=list(map(fft_data_from_proto, proto_obj.fft_data)),
+        spectrogram_data_bytes=proto_obj.spectrogram_data_as_bytes
+    )
+
+
+def game_data_to_dict(self: GameData) -> dict:
+    return {
+        "max_hps": self.max_hps,
+        "max_energies": self.max_energies,
+        "character_names": self.character_names,
+        "ai_names": self.ai_names
+    }
+
+
+def game_data_from_dict(data_obj: dict) -> GameData:
+    return GameData(
+        max_hps=data_obj["max_hps"],
+        max_energies=data_obj["max_energies"],
+        character_names=data_obj["character_names"],
+        ai_names=data_obj["ai_names"]
+    )
+
+
+def game_data_from_proto(proto_obj) -> GameData:
+    return GameData(
+        max_hps=list(proto_obj.max_hps),
+        max_energies=list(proto_obj.max_energies),
+        character_names=list(proto_obj.character_names),
+        ai_names=list(proto_obj.ai_names)
+    )
+
+
+def round_result_to_dict(self: RoundResult) -> dict:
+    return {
+        "current_round": self.current_round,
+        "remaining_hps": self.remaining_hps,
+        "elapsed_frame": self.elapsed_frame
+    }
+
+
+def round_result_from_dict(data_obj: dict) -> RoundResult:
+    return RoundResult(
+        current_round=data_obj["current_round"],
+        remaining_hps=data_obj["remaining_hps"],
+        elapsed_frame=data_obj["elapsed_frame"]
+    )
+
+
+def round_result_from_proto(proto_obj) -> RoundResult:
+    return RoundResult(
+        current_round=proto_obj.current_round,
+        remaining_hps=list(map(int, proto_obj.remaining_hps)),
+        elapsed_frame=proto_obj.elapsed_frame
+    )
+
+
+LEGACY = {
+    HitArea: (hit_area_to_dict, hit_area_from_dict, hit_area_from_proto),
+    AttackData: (attack_data_to_dict, attack_data_from_dict, attack_data_from_proto),
+    CharacterData: (character_data_to_dict, character_data_from_dict, character_data_from_proto),
+    FrameData: (frame_data_to_dict, frame_data_from_dict, frame_data_from_proto),
+    Key: (key_to_dict, key_from_dict, key_from_proto),
+    FFTData: (fft_data_to_dict, fft_data_from_dict, fft_data_from_proto),
+    AudioData: (audio_data_to_dict, audio_data_from_dict, audio_data_from_proto),
+    GameData: (game_data_to_dict, game_data_from_dict, game_data_from_proto),
+    RoundResult: (round_result_to_dict, round_result_from_dict, round_result_from_proto),
+}
+"""
+Model class -> (to_dict, from_dict, from_proto) hand-written reference converters.
+"""
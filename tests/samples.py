@@ -0,0 +1,113 @@
+import copy
+import json
+import random
+import string
+from pathlib import Path
+from typing import Optional
+
+from google.protobuf.descriptor import FieldDescriptor
+
+from pyftg.models.enums.flag import Flag
+from pyftg.models.frame_data import FrameData
+from pyftg.protoc import service_pb2
+from pyftg.socket.aio.ai_controller import AIController
+
+EXAMPLE_PATH = Path(__file__).resolve().parent.parent / "data_example.json"
+NUM_PROJECTILES = 3
+
+_INT_LIMIT = 2 ** 31 - 1
+
+
+def example_frame_dict() -> dict:
+    """
+    Load data_example.json as a FrameData dictionary. The file elides the projectile attacks
+    of the characters, which are filled in with copies of their `attack_data`, and stores
+    the recorded action next to the frame, which is dropped.
+    """
+    text = EXAMPLE_PATH.read_text(encoding="utf-8").replace("[ ... 같은 구조 3개 ... ]", "[]")
+    data = json.loads(text)
+    data.pop("action", None)
+    for character in data["character_data"]:
+        character["projectile_attack"] = [copy.deepcopy(character["attack_data"]) for _ in range(NUM_PROJECTILES)]
+    return data
+
+
+def random_proto(message_cls, rng: random.Random, max_repeated: int = 3, max_string: int = 16):
+    """
+    Build a protobuf message with every field set to a random value.
+    Enum fields only take values defined by the enum.
+    """
+    message = message_cls()
+    for field in message_cls.DESCRIPTOR.fields:
+        repeated = field.label == FieldDescriptor.LABEL_REPEATED
+        count = rng.randint(0, max_repeated) if repeated else 1
+        for _ in range(count):
+            if field.type == FieldDescriptor.TYPE_MESSAGE:
+                child = random_proto(field.message_type._concrete_class, rng, max_repeated, max_string)
+                if repeated:
+                    getattr(message, field.name).append(child)
+                else:
+                    getattr(message, field.name).CopyFrom(child)
+                continue
+            value = _random_scalar(field, rng, max_string)
+            if repeated:
+                getattr(message, field.name).append(value)
+            else:
+                setattr(message, field.name, value)
+    return message
+
+
+def _random_scalar(field, rng: random.Random, max_string: int):
+    if field.type == FieldDescriptor.TYPE_BOOL:
+        return rng.random() < 0.5
+    if field.type == FieldDescriptor.TYPE_ENUM:
+        return rng.choice(field.enum_type.values).number
+    if field.type == FieldDescriptor.TYPE_STRING:
+        return "".join(rng.choices(string.ascii_letters + string.digits + "_", k=rng.randint(0, max_string)))
+    if field.type == FieldDescriptor.TYPE_BYTES:
+        return bytes(rng.getrandbits(8) for _ in range(rng.randint(0, 64)))
+    return rng.randint(-_INT_LIMIT - 1, _INT_LIMIT)
+
+
+def processing_state(frame_number: int, is_control: bool = True, hit_count: int = 0, current_round: int = 1,
+                     hp: Optional[int] = None):
+    """
+    Build a PROCESSING PlayerGameState carrying the example frame at the given frame number.
+    `hit_count` and, if given, `hp` are set on both characters.
+    """
+    data = example_frame_dict()
+    data["current_frame_number"] = frame_number
+    data["current_round"] = current_round
+    for character in data["character_data"]:
+        character["hit_count"] = hit_count
+        if hp is not None:
+            character["hp"] = hp
+    state = service_pb2.PlayerGameState(state_flag=Flag.PROCESSING, is_control=is_control)
+    state.frame_data.CopyFrom(FrameData.from_dict(data).to_proto())
+    return state
+
+
+def initialize_state():
+    """
+    Build an INITIALIZE PlayerGameState.
+    """
+    state = service_pb2.PlayerGameState(state_flag=Flag.INITIALIZE)
+    state.game_data.max_hps.extend([400, 400])
+    return state
+
+
+def drive(controller: AIController, states) -> list:
+    """
+    Feed states to a controller like `AIController.run` does and return the keys it sends.
+    """
+    keys = []
+    for state in states:
+        key = controller.skip_processing(state)
+        if key is None:
+            if not controller.handle_state(state):
+                continue
+            controller.ai.processing()
+            controller.last_key = controller.ai.input().copy()
+            key = controller.last_key
+        keys.append(key.copy())
+    return keys
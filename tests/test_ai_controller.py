@@ -0,0 +1,90 @@
+import pytest
+
+from KickAI import KickAI
+from pyftg.models.key import Key
+from pyftg.socket.aio.ai_controller import AIController
+from pyftg.utils.decision_interval import DecisionInterval
+from samples import drive, initialize_state, processing_state
+
+
+def test_blind_agent_gets_server_frames():
+    ai = KickAI()
+    assert ai.is_blind()
+    controller = AIController(None, None, ai, True)
+    controller.handle_state(initialize_state())
+    assert controller.handle_state(processing_state(10))
+    assert not ai.frame_data.empty_flag
+    assert ai.frame_data.current_frame_number == 10
+
+
+def test_blind_agent_issues_commands():
+    ai = KickAI()
+    controller = AIController(None, None, ai, True)
+    keys = drive(controller, [initialize_state()] + [processing_state(i) for i in range(1, 40)])
+    assert len(keys) == 39
+    assert any(key.B for key in keys)
+    assert keys != [Key()] * 39
+
+
+class ScriptedAI(KickAI):
+    """
+    Agent counting its decisions. Each decision sends `key` and queues a copy of `combo`.
+    """
+
+    def __init__(self, key: Key, combo=()):
+        super().__init__()
+        self.decisions = 0
+        self.next_key = key
+        self.combo = list(combo)
+        self.queue = []
+
+    def input_queue(self):
+        return self.queue
+
+    def processing(self):
+        self.decisions += 1
+        self.key = self.next_key.copy()
+        self.queue[:] = [key.copy() for key in self.combo]
+
+
+def test_queued_keys_are_sent_without_processing():
+    combo = [Key(D=True), Key(D=True, R=True), Key(R=True, A=True)]
+    ai = ScriptedAI(Key(B=True), combo)
+    controller = AIController(None, None, ai, True)
+    keys = drive(controller, [initialize_state()] + [processing_state(i) for i in range(1, 6)])
+    assert ai.decisions == 2
+    assert keys == [Key(B=True)] + combo + [Key(B=True)]
+    assert ai.frame_data.current_frame_number == 5
+
+
+class TogglingAI(ScriptedAI):
+    def processing(self):
+        super().processing()
+        self.next_key = Key(A=not self.next_key.A, B=not self.next_key.B)
+
+
+def test_last_key_is_repeated_between_decisions():
+    ai = TogglingAI(Key(A=True))
+    controller = AIController(None, None, ai, True, decision_interval=DecisionInterval(interval=4))
+    keys = drive(controller, [initialize_state()] + [processing_state(i) for i in range(1, 10)])
+    assert ai.decisions == 3
+    assert keys == [Key(A=True)] * 4 + [Key(B=True)] * 4 + [Key(A=True)]
+    assert ai.frame_data.current_frame_number == 9
+    assert controller.scheduler.skipped == 6
+
+
+@pytest.mark.parametrize("hit", [True, False], ids=["hit", "no_hit"])
+def test_hit_during_queued_combo_triggers_a_decision(hit):
+    combo = [Key(D=True), Key(D=True, R=True), Key(R=True, A=True)]
+    ai = ScriptedAI(Key(B=True), combo)
+    controller = AIController(None, None, ai, True, decision_interval=DecisionInterval(interval=100))
+    hps = [400, 400, 350 if hit else 400, 350 if hit else 400, 350 if hit else 400]
+    states = [initialize_state()] + [processing_state(i, hp=hp) for i, hp in enumerate(hps, start=1)]
+    keys = drive(controller, states)
+    assert keys[:4] == [Key(B=True)] + combo
+    if hit:
+        assert ai.decisions == 2
+        assert ai.frame_data.current_frame_number == 5
+    else:
+        assert ai.decisions == 1
+        assert keys[4] == combo[-1]
@@ -0,0 +1,29 @@
+import time
+
+from pyftg.aiinterface.anytime_planner_ai import AnytimePlannerAI
+from pyftg.socket.aio.ai_controller import AIController
+from samples import drive, initialize_state, processing_state
+
+
+class KickPlannerAI(AnytimePlannerAI):
+    def plan(self, frame_data):
+        yield None
+        yield "B"
+
+
+def test_planned_action_is_issued():
+    ai = KickPlannerAI()
+    assert not ai.is_blind()
+    controller = AIController(None, None, ai, True)
+    drive(controller, [initialize_state()])
+    try:
+        keys = []
+        for frame_number in range(1, 200):
+            keys += drive(controller, [processing_state(frame_number)])
+            if any(key.B for key in keys):
+                break
+            time.sleep(0.005)
+        assert any(key.B for key in keys)
+        assert ai.planned_frames >= 1
+    finally:
+        ai.close()
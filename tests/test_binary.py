@@ -0,0 +1,82 @@
+import random
+
+import pytest
+
+from pyftg.models.attack_data import AttackData
+from pyftg.models.character_data import CharacterData
+from pyftg.models.converter import STR_SIZE
+from pyftg.models.frame_data import FrameData
+from pyftg.models.key import Key
+from pyftg.protoc import message_pb2
+from samples import example_frame_dict, random_proto
+
+PROTO_CLASSES = {
+    FrameData: message_pb2.GrpcFrameData,
+    CharacterData: message_pb2.GrpcCharacterData,
+    AttackData: message_pb2.GrpcAttackData,
+    Key: message_pb2.GrpcKey,
+}
+SAMPLES = 50
+
+
+def random_models(model, max_string: int = STR_SIZE):
+    rng = random.Random(f"{model.__name__}-binary")
+    return [model.from_proto(random_proto(PROTO_CLASSES[model], rng, max_string=max_string)) for _ in range(SAMPLES)]
+
+
+@pytest.mark.parametrize("model", list(PROTO_CLASSES), ids=lambda model: model.__name__)
+def test_round_trip_matches_dict(model):
+    for obj in random_models(model):
+        unpacked = model.from_bytes(obj.to_bytes())
+        assert type(unpacked) is model
+        assert unpacked.to_dict() == obj.to_dict()
+
+
+@pytest.mark.parametrize("model", list(PROTO_CLASSES), ids=lambda model: model.__name__)
+def test_pack_many_round_trip(model):
+    objs = random_models(model)
+    unpacked = model.unpack_many(model.pack_many(objs))
+    assert [obj.to_dict() for obj in unpacked] == [obj.to_dict() for obj in objs]
+    assert model.unpack_many(model.pack_many([])) == []
+
+
+def test_example_frame_round_trip():
+    frame_data = FrameData.from_dict(example_frame_dict())
+    assert FrameData.from_bytes(frame_data.to_bytes()).to_dict() == frame_data.to_dict()
+
+
+@pytest.mark.parametrize("character_data", [[None, None], [], [CharacterData(), None]], ids=["none", "empty", "one"])
+def test_empty_characters_round_trip(character_data):
+    frame_data = FrameData(character_data=character_data)
+    unpacked = FrameData.from_bytes(frame_data.to_bytes())
+    assert unpacked.to_dict() == frame_data.to_dict()
+    assert unpacked.character_data == character_data
+    frames = FrameData.unpack_many(FrameData.pack_many([frame_data, FrameData.from_dict(example_frame_dict())]))
+    assert frames[0].to_dict() == frame_data.to_dict()
+
+
+def test_strings_up_to_field_size_round_trip():
+    for identifier in ("", "a" * STR_SIZE, "é" * (STR_SIZE // 2)):
+        attack = AttackData(identifier=identifier)
+        assert AttackData.from_bytes(attack.to_bytes()).identifier == identifier
+
+
+@pytest.mark.parametrize("identifier", ["a" * (STR_SIZE + 1), "é" * (STR_SIZE // 2 + 1), "a\x00"],
+                         ids=["ascii", "utf8", "trailing_nul"])
+def test_unpackable_strings_are_rejected(identifier):
+    attack = AttackData(identifier=identifier)
+    with pytest.raises(ValueError):
+        attack.to_bytes()
+    frame_data = FrameData(projectile_data=[attack])
+    with pytest.raises(ValueError):
+        FrameData.pack_many([frame_data])
+
+
+def test_corrupted_buffers_are_rejected():
+    data = FrameData.from_dict(example_frame_dict()).to_bytes()
+    with pytest.raises(ValueError):
+        FrameData.from_bytes(data[:-1])
+    with pytest.raises(ValueError):
+        FrameData.from_bytes(data + b"\x00")
+    with pytest.raises(ValueError):
+        CharacterData.from_bytes(data)
@@ -0,0 +1,121 @@
+import pickle
+import random
+
+import pytest
+
+from legacy_converters import LEGACY
+from pyftg.models.attack_data import AttackData
+from pyftg.models.audio_data import AudioData
+from pyftg.models.character_data import CharacterData
+from pyftg.models.fft_data import FFTData
+from pyftg.models.frame_data import FrameData
+from pyftg.models.game_data import GameData
+from pyftg.models.hit_area import HitArea
+from pyftg.models.key import Key
+from pyftg.models.round_result import RoundResult
+from pyftg.protoc import message_pb2
+from samples import example_frame_dict, random_proto
+
+PROTO_CLASSES = {
+    HitArea: message_pb2.GrpcHitArea,
+    AttackData: message_pb2.GrpcAttackData,
+    CharacterData: message_pb2.GrpcCharacterData,
+    FrameData: message_pb2.GrpcFrameData,
+    Key: message_pb2.GrpcKey,
+    FFTData: message_pb2.GrpcFftData,
+    AudioData: message_pb2.GrpcAudioData,
+    GameData: message_pb2.GrpcGameData,
+    RoundResult: message_pb2.GrpcRoundResult,
+}
+MODELS = list(PROTO_CLASSES)
+SAMPLES = 50
+
+
+class DerivedFrameData(FrameData):
+    pass
+
+
+def typed(value):
+    """
+    Structure of a value that also compares types and dictionary key order, so that
+    e.g. True and 1 or an enum member and its int code are told apart.
+    """
+    if isinstance(value, dict):
+        return ("dict", [(key, typed(item)) for key, item in value.items()])
+    if isinstance(value, list):
+        return ("list", [typed(item) for item in value])
+    if hasattr(value, "__dataclass_fields__"):
+        return (type(value).__name__, [(name, typed(getattr(value, name))) for name in value.__dataclass_fields__])
+    return (type(value).__name__, value)
+
+
+def random_protos(model):
+    rng = random.Random(f"{model.__name__}-converters")
+    return [random_proto(PROTO_CLASSES[model], rng) for _ in range(SAMPLES)]
+
+
+@pytest.mark.parametrize("model", MODELS, ids=lambda model: model.__name__)
+def test_from_proto_matches_legacy(model):
+    _, _, legacy_from_proto = LEGACY[model]
+    for proto_obj in random_protos(model):
+        assert typed(model.from_proto(proto_obj)) == typed(legacy_from_proto(proto_obj))
+
+
+@pytest.mark.parametrize("model", MODELS, ids=lambda model: model.__name__)
+def test_dict_converters_match_legacy(model):
+    legacy_to_dict, legacy_from_dict, legacy_from_proto = LEGACY[model]
+    for proto_obj in random_protos(model):
+        obj = legacy_from_proto(proto_obj)
+        data = legacy_to_dict(obj)
+        assert typed(obj.to_dict()) == typed(data)
+        assert typed(model.from_dict(data)) == typed(legacy_from_dict(data))
+
+
+@pytest.mark.parametrize("model", MODELS, ids=lambda model: model.__name__)
+def test_to_proto_round_trip(model):
+    for proto_obj in random_protos(model):
+        obj = model.from_proto(proto_obj)
+        assert obj.to_proto() == proto_obj
+        assert typed(model.from_proto(obj.to_proto())) == typed(obj)
+
+
+def test_to_proto_drops_missing_characters():
+    frame_data = FrameData.from_dict(example_frame_dict())
+    frame_data.character_data[1] = None
+    proto_obj = frame_data.to_proto()
+    assert len(proto_obj.character_data) == 0
+    assert FrameData.from_proto(proto_obj).character_data == [None, None]
+
+
+@pytest.mark.parametrize("model", [m for m in MODELS if hasattr(m, "update_from_proto")], ids=lambda model: model.__name__)
+def test_update_from_proto_matches_from_proto(model):
+    protos = random_protos(model)
+    obj = model.from_proto(protos[0])
+    for proto_obj in protos[1:]:
+        assert obj.update_from_proto(proto_obj) is obj
+        assert typed(obj) == typed(model.from_proto(proto_obj))
+
+
+def test_example_frame_matches_legacy():
+    data = example_frame_dict()
+    legacy_to_dict, legacy_from_dict, _ = LEGACY[FrameData]
+    frame_data = FrameData.from_dict(data)
+    assert typed(frame_data) == typed(legacy_from_dict(data))
+    assert typed(frame_data.to_dict()) == typed(legacy_to_dict(frame_data)) == typed(data)
+
+
+def test_constructors_build_subclasses():
+    data = example_frame_dict()
+    frame_data = FrameData.from_dict(data)
+    built = [
+        DerivedFrameData.from_dict(data),
+        DerivedFrameData.from_proto(random_protos(FrameData)[0]),
+        DerivedFrameData.from_bytes(frame_data.to_bytes()),
+        DerivedFrameData.unpack_many(FrameData.pack_many([frame_data]))[0],
+        DerivedFrameData.from_dict(data).copy(),
+        pickle.loads(pickle.dumps(DerivedFrameData.from_dict(data))),
+    ]
+    for obj in built:
+        assert type(obj) is DerivedFrameData
+    assert type(FrameData.from_dict(data)) is FrameData
+    assert type(DerivedFrameData.from_dict(data).character_data[0]) is CharacterData
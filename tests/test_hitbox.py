@@ -0,0 +1,27 @@
+from pyftg.models.attack_data import AttackData
+from pyftg.models.character_data import CharacterData
+from pyftg.models.frame_data import FrameData
+from pyftg.models.hit_area import HitArea
+from pyftg.utils.hitbox import FrameBoxes
+
+
+def projectile(player: bool, left: int) -> AttackData:
+    return AttackData(current_hit_area=HitArea(left=left, right=left + 10, top=0, bottom=10), player_number=player,
+                      is_projectile=True, is_live=True, empty_flag=False)
+
+
+def character(player: bool, projectiles: list) -> CharacterData:
+    empty = [AttackData(empty_flag=True) for _ in range(3 - len(projectiles))]
+    return CharacterData(player_number=player, attack_data=AttackData(empty_flag=True),
+                         projectile_attack=projectiles + empty)
+
+
+def test_projectiles_reported_twice_are_counted_once():
+    frame_data = FrameData(
+        character_data=[character(True, [projectile(True, 100)]), character(False, [])],
+        projectile_data=[projectile(True, 100), projectile(False, 300)],
+    )
+    boxes = FrameBoxes.from_frames([frame_data])
+    assert boxes.valid[0].sum(axis=1).tolist() == [1, 1]
+    assert boxes.attacks[0, 0, 1].tolist() == [100, 110, 0, 10]
+    assert boxes.attacks[0, 1, 1].tolist() == [300, 310, 0, 10]
@@ -0,0 +1,66 @@
+import time
+from concurrent.futures import Future
+
+from pyftg.aiinterface.mcts_ai import MCTSAI
+from pyftg.socket.aio.ai_controller import AIController
+from pyftg.utils.mcts import SearchTree, Simulator, run_search
+from samples import drive, initialize_state, processing_state
+
+ACTIONS = ["A", "B"]
+
+
+class PreferB(Simulator):
+    def evaluate(self, frame_data, player, paths, seed):
+        return [1.0 if path[:1] == ["B"] else -1.0 for path in paths]
+
+
+def test_best_action_is_none_before_any_backup():
+    tree = SearchTree(ACTIONS)
+    leaves = [tree.select_leaf() for _ in range(4)]
+    assert tree.best_action() is None
+    for leaf in leaves:
+        tree.backpropagate(leaf, 1.0 if leaf.path()[:1] == ["B"] else -1.0)
+    assert tree.root.evaluations == 4
+    assert tree.best_action() is not None
+
+
+def test_reroot_keeps_the_subtree():
+    tree = SearchTree(ACTIONS, max_depth=2)
+    for _ in range(20):
+        tree.backpropagate(tree.select_leaf(), 0.0)
+    child = tree.root.children["B"]
+    evaluations = child.evaluations
+    assert tree.reroot("B")
+    assert tree.root is child and child.parent is None and child.action is None
+    assert tree.root.evaluations == evaluations
+    assert all(node.path() == [node.action] for node in tree.root.children.values())
+    assert not tree.reroot("C")
+    assert tree.root.evaluations == 0 and not tree.root.children
+
+
+def test_run_search_backs_up_late_batches_on_the_next_call():
+    tree = SearchTree(ACTIONS)
+    futures = []
+
+    def evaluate(paths):
+        futures.append((Future(), paths))
+        return futures[-1][0]
+
+    pending = {}
+    assert run_search(tree, evaluate, time.perf_counter() + 0.01, pending, max_pending=2, batch_size=4) == 0
+    assert len(pending) == 2
+    assert tree.best_action() is None
+    for future, paths in futures:
+        future.set_result([1.0 if path[:1] == ["B"] else -1.0 for path in paths])
+    assert run_search(tree, evaluate, time.perf_counter(), pending, max_pending=2, batch_size=4) == 8
+    assert tree.best_action() is not None
+
+
+def test_agent_commands_the_searched_action():
+    ai = MCTSAI(ACTIONS, PreferB(), workers=0, time_budget=0.002, batch_size=4, max_depth=1)
+    assert not ai.is_blind()
+    controller = AIController(None, None, ai, True)
+    keys = drive(controller, [initialize_state()] + [processing_state(i) for i in range(1, 10)])
+    ai.close()
+    assert ai.rollouts > 0
+    assert any(key.B for key in keys)
@@ -0,0 +1,54 @@
+import asyncio
+import time
+
+import numpy as np
+import pytest
+
+from pyftg.aiinterface.policy_client_ai import PolicyClientAI
+from pyftg.models.key import Key
+from pyftg.socket.aio.ai_controller import AIController
+from pyftg.utils.policy_server import PolicyServer
+from samples import initialize_state, processing_state
+
+
+def kick_policy(delay: float = 0.0):
+    def policy(observations: np.ndarray):
+        time.sleep(delay)
+        return [Key(B=True) for _ in observations]
+    return policy
+
+
+def observe(frame_data, player):
+    return np.array([frame_data.current_frame_number], dtype=np.float32)
+
+
+def test_cancelled_requests_do_not_stop_the_server():
+    server = PolicyServer(kick_policy(0.05), max_wait=0.0)
+    try:
+        ai = PolicyClientAI(server, observe, timeout=0.01)
+        controller = AIController(None, None, ai, True)
+        controller.handle_state(initialize_state())
+        controller.handle_state(processing_state(1))
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(controller.process())
+        time.sleep(0.1)
+        assert server._thread.is_alive()
+        assert server.infer(np.zeros(1, dtype=np.float32), timeout=1.0).B
+    finally:
+        server.close()
+
+
+def test_client_sends_server_keys():
+    server = PolicyServer(kick_policy())
+    try:
+        ai = PolicyClientAI(server, observe, timeout=1.0)
+        assert not ai.is_blind()
+        controller = AIController(None, None, ai, True)
+        controller.handle_state(initialize_state())
+        for frame_number in range(1, 4):
+            assert controller.handle_state(processing_state(frame_number))
+            asyncio.run(controller.process())
+            assert ai.input().B
+        assert server.stats()["requests"] == 3
+    finally:
+        server.close()
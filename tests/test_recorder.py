@@ -0,0 +1,26 @@
+import copy
+import random
+
+import pytest
+
+from pyftg.models.frame_data import FrameData
+from pyftg.protoc import message_pb2
+from pyftg.utils.recorder import BINARY, DELTA, JSONL, FrameRecorder, read_records
+from samples import example_frame_dict, random_proto
+
+
+@pytest.mark.parametrize("file_format", [JSONL, BINARY, DELTA])
+def test_reuse_mode_records_frames_refreshed_in_place(tmp_path, file_format):
+    rng = random.Random(f"{file_format}-recorder")
+    recorder = FrameRecorder(str(tmp_path), session_id="s", file_format=file_format, reuse_frame_data=True)
+    frame_data = FrameData.from_dict(example_frame_dict())
+    expected = []
+    for i in range(20):
+        proto_obj = random_proto(message_pb2.GrpcFrameData, rng, max_string=0)
+        proto_obj.current_round = 1
+        frame_data.update_from_proto(proto_obj)
+        expected.append((copy.deepcopy(frame_data.to_dict()), f"ACTION_{i}"))
+        assert recorder.record(frame_data, f"ACTION_{i}")
+    recorder.close()
+    records = read_records(recorder.get_file_path(0, 1))
+    assert [(frame.to_dict(), action) for frame, action in records] == expected